@@ -1,8 +1,14 @@
 from django.apps import AppConfig as Config
+from django.db.backends.signals import connection_created
 
 
 class AppConfig(Config):
     name = "app"
 
+    def ready(self):
+        from app.internal.services.db import configure_sqlite
+
+        connection_created.connect(configure_sqlite, dispatch_uid="app.configure_sqlite")
+
 
 default_app_config = "app.AppConfig"
@@ -1,2 +1,6 @@
 from app.internal.admin.admin_user import AdminUserAdmin
-from app.internal.admin.user import YouGileUserAdmin
\ No newline at end of file
+from app.internal.admin.event_subscription import EventSubscriptionAdmin
+from app.internal.admin.task_outbox import TaskOutboxAdmin
+from app.internal.admin.task_record import TaskRecordAdmin
+from app.internal.admin.user import YouGileUserAdmin
+from app.internal.admin.yougile_employee import YougileEmployeeAdmin
\ No newline at end of file
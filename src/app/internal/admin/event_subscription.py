@@ -0,0 +1,10 @@
+from django.contrib import admin
+from app.internal.models.event_subscription import EventSubscription
+
+
+@admin.register(EventSubscription)
+class EventSubscriptionAdmin(admin.ModelAdmin):
+    list_display = ('kind', 'target_id', 'chat_id', 'telegram_id', 'created_at')
+    list_filter = ('kind',)
+    search_fields = ('target_id', 'chat_id', 'telegram_id')
+    readonly_fields = ('created_at',)
@@ -0,0 +1,10 @@
+from django.contrib import admin
+from app.internal.models.task_outbox import TaskOutbox
+
+
+@admin.register(TaskOutbox)
+class TaskOutboxAdmin(admin.ModelAdmin):
+    list_display = ('id', 'title', 'status', 'attempts', 'next_attempt_at', 'yougile_task_id', 'created_at')
+    list_filter = ('status',)
+    search_fields = ('title', 'yougile_task_id', 'telegram_id')
+    readonly_fields = ('created_at', 'updated_at')
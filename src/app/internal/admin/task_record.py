@@ -0,0 +1,10 @@
+from django.contrib import admin
+from app.internal.models.task_record import TaskRecord
+
+
+@admin.register(TaskRecord)
+class TaskRecordAdmin(admin.ModelAdmin):
+    list_display = ('yougile_id', 'title', 'telegram_id', 'executor_username', 'completed', 'created_at')
+    list_filter = ('completed', 'archived', 'deleted')
+    search_fields = ('title', 'yougile_id', 'telegram_id', 'executor_username')
+    readonly_fields = ('created_at', 'synced_at')
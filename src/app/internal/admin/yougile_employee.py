@@ -0,0 +1,10 @@
+from django.contrib import admin
+from app.internal.models.yougile_employee import YougileEmployee
+
+
+@admin.register(YougileEmployee)
+class YougileEmployeeAdmin(admin.ModelAdmin):
+    list_display = ('yougile_id', 'email', 'real_name', 'is_admin', 'synced_at')
+    list_filter = ('is_admin',)
+    search_fields = ('yougile_id', 'email', 'real_name')
+    readonly_fields = ('synced_at',)
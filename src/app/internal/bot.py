@@ -1,24 +1,167 @@
+import asyncio
+import logging
 import os
+import signal
+from django.conf import settings
+from telegram import Update
 from telegram.ext import Application
+from app.internal.services.employee_service import EmployeeService
+from app.internal.services.http_client import HttpClient
+from app.internal.services.task_service import TaskService
+from app.internal.services.yougile_service import YougileService
+from app.internal.transport.bot.filters import RawUpdateFilter, allowed_updates
 from app.internal.transport.bot.handlers import get_handlers
+from app.internal.transport.bot.metrics_server import MetricsServer
+from app.internal.transport.bot.outbox_worker import OutboxWorker
+from app.internal.transport.bot.rate_limiter import TelegramRateLimiter
+from app.internal.transport.bot.update_processor import ChatOrderedUpdateProcessor
+from app.internal.transport.bot.webhook import WebhookServer
+
+logger = logging.getLogger(__name__)
 
 
 class TelegramBot:
-    def __init__(self, token):
+    def __init__(self, token, primary=True, shard=None):
         self.token = token
-        self.application = Application.builder().token(token).build()
+        self.primary = primary
+        self.shard = shard
+        self.webhook_server = None
+        self.metrics_server = None
+        self.outbox_worker = None
+        self.allowed_updates = []
+        self.application = (
+            Application.builder()
+            .token(token)
+            .base_url(settings.TELEGRAM_API_BASE_URL)
+            .base_file_url(settings.TELEGRAM_API_BASE_FILE_URL)
+            .concurrent_updates(
+                ChatOrderedUpdateProcessor(settings.BOT_CONCURRENT_UPDATES, settings.BOT_MAX_PENDING_UPDATES)
+            )
+            .rate_limiter(TelegramRateLimiter())
+            .post_init(self.on_startup)
+            .post_shutdown(self.on_shutdown)
+            .build()
+        )
         self.setup_handlers()
 
     def setup_handlers(self):
-        for handler in get_handlers():
+        handlers = get_handlers()
+        for handler in handlers:
             self.application.add_handler(handler)
+        self.allowed_updates = allowed_updates(handlers)
+
+    async def on_startup(self, application):
+        if application.bot.can_read_all_group_messages:
+            logger.warning(
+                "Privacy mode is disabled for @%s: all group messages are delivered and dropped locally",
+                application.bot.username,
+            )
+        else:
+            logger.info("Privacy mode is enabled for @%s", application.bot.username)
+        await HttpClient.start()
+        if settings.BOT_METRICS_PORT:
+            port = settings.BOT_METRICS_PORT + (self.shard[0] + 1 if self.shard else 0)
+            self.metrics_server = MetricsServer(settings.BOT_METRICS_LISTEN, port)
+            await self.metrics_server.start()
+        yougile = YougileService.get_instance()
+        await asyncio.gather(yougile.project_tree.refresh(), yougile.user_directory.refresh(), return_exceptions=True)
+        yougile.user_directory.start_background_refresh()
+        yougile.project_tree.start_background_refresh()
+        if settings.YOUGILE_SYNC_INTERVAL and self.primary:
+            EmployeeService.start_periodic_sync(settings.YOUGILE_SYNC_INTERVAL)
+        if settings.YOUGILE_TASK_SYNC_INTERVAL and self.primary:
+            TaskService.start_periodic_sync(settings.YOUGILE_TASK_SYNC_INTERVAL)
+        self.outbox_worker = OutboxWorker(application.bot, self.shard)
+        self.outbox_worker.start()
+
+    async def on_shutdown(self, application):
+        await EmployeeService.stop_periodic_sync()
+        await TaskService.stop_periodic_sync()
+        if self.outbox_worker is not None:
+            await self.outbox_worker.stop()
+        yougile = YougileService.get_instance()
+        await yougile.user_directory.stop_background_refresh()
+        await yougile.project_tree.stop_background_refresh()
+        await HttpClient.close()
+        if self.metrics_server is not None:
+            await self.metrics_server.stop()
 
     def run_polling(self):
-        self.application.run_polling(drop_pending_updates=True, allowed_updates=['message'])
+        self.application.run_polling(drop_pending_updates=True, allowed_updates=self.allowed_updates)
 
+    async def serve_webhook(self, webhook_url, secret_token, listen, port, url_path, max_connections, stop_event=None):
+        stop_event = stop_event or asyncio.Event()
+        update_filter = RawUpdateFilter(self.allowed_updates)
+        server = self.webhook_server = WebhookServer(
+            self.application, secret_token, listen, port, url_path, update_filter
+        )
 
-def create_bot():
+        await self.application.initialize()
+        update_filter.bot_username = self.application.bot.username
+        await self.on_startup(self.application)
+        await server.start()
+        await self.application.bot.set_webhook(
+            url=webhook_url,
+            secret_token=secret_token,
+            max_connections=max_connections,
+            allowed_updates=self.allowed_updates,
+            drop_pending_updates=True,
+        )
+        await self.application.start()
+        try:
+            await stop_event.wait()
+        finally:
+            await server.stop()
+            await self.application.stop()
+            await self.on_shutdown(self.application)
+            await self.application.shutdown()
+
+    async def serve_queue(self, source):
+        loop = asyncio.get_running_loop()
+        await self.application.initialize()
+        await self.on_startup(self.application)
+        await self.application.start()
+        try:
+            while True:
+                data = await loop.run_in_executor(None, source.get)
+                if data is None:
+                    break
+                await self.application.update_queue.put(Update.de_json(data, self.application.bot))
+        finally:
+            await self.application.stop()
+            await self.on_shutdown(self.application)
+            await self.application.shutdown()
+
+    def run_webhook(self):
+        if not settings.TELEGRAM_WEBHOOK_URL:
+            raise ValueError("Не удалось найти TELEGRAM_WEBHOOK_URL")
+        if not settings.TELEGRAM_WEBHOOK_SECRET:
+            raise ValueError("Не удалось найти TELEGRAM_WEBHOOK_SECRET")
+
+        async def main():
+            stop_event = asyncio.Event()
+            loop = asyncio.get_running_loop()
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                loop.add_signal_handler(sig, stop_event.set)
+            await self.serve_webhook(
+                webhook_url=settings.TELEGRAM_WEBHOOK_URL,
+                secret_token=settings.TELEGRAM_WEBHOOK_SECRET,
+                listen=settings.TELEGRAM_WEBHOOK_LISTEN,
+                port=settings.TELEGRAM_WEBHOOK_PORT,
+                url_path=settings.TELEGRAM_WEBHOOK_PATH,
+                max_connections=settings.TELEGRAM_WEBHOOK_MAX_CONNECTIONS,
+                stop_event=stop_event,
+            )
+
+        asyncio.run(main())
+
+
+def get_token():
     token = os.environ.get("TELEGRAM_BOT_TOKEN")
     if not token:
         raise ValueError("Не удалось найти TELEGRAM_BOT_TOKEN")
-    return TelegramBot(token)
\ No newline at end of file
+    return token
+
+
+def create_bot():
+    return TelegramBot(get_token())
@@ -0,0 +1,29 @@
+from django.db import models
+
+
+class EventSubscription(models.Model):
+    KIND_TASK = "task"
+    KIND_USER = "user"
+    KIND_CHOICES = (
+        (KIND_TASK, "Изменения задачи"),
+        (KIND_USER, "Назначения исполнителя"),
+    )
+
+    kind = models.CharField("Тип", max_length=8, choices=KIND_CHOICES)
+    target_id = models.CharField("ID задачи или пользователя в YouGile", max_length=255)
+    chat_id = models.BigIntegerField("ID чата")
+    telegram_id = models.BigIntegerField("ID подписчика в Telegram", null=True, blank=True)
+    created_at = models.DateTimeField("Создана", auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Подписка на события"
+        verbose_name_plural = "Подписки на события"
+        constraints = [
+            models.UniqueConstraint(fields=["kind", "target_id", "chat_id"], name="eventsubscription_target_uniq"),
+        ]
+        indexes = [
+            models.Index(fields=["telegram_id", "kind"], name="eventsubscription_user_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind}:{self.target_id} → {self.chat_id}"
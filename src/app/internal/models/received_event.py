@@ -0,0 +1,14 @@
+from django.db import models
+from django.utils import timezone
+
+
+class ReceivedEvent(models.Model):
+    key = models.CharField("Ключ события", max_length=255, unique=True)
+    received_at = models.DateTimeField("Получено", default=timezone.now, db_index=True)
+
+    class Meta:
+        verbose_name = "Полученное событие YouGile"
+        verbose_name_plural = "Полученные события YouGile"
+
+    def __str__(self):
+        return self.key
@@ -0,0 +1,45 @@
+from django.db import models
+from django.utils import timezone
+
+
+class TaskOutbox(models.Model):
+    STATUS_PENDING = "pending"
+    STATUS_PROCESSING = "processing"
+    STATUS_SENT = "sent"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = (
+        (STATUS_PENDING, "Ожидает отправки"),
+        (STATUS_PROCESSING, "Отправляется"),
+        (STATUS_SENT, "Создана"),
+        (STATUS_FAILED, "Ошибка"),
+    )
+
+    telegram_id = models.BigIntegerField("ID автора в Telegram")
+    chat_id = models.BigIntegerField("ID чата")
+    reply_message_id = models.BigIntegerField("ID ответа бота", null=True, blank=True)
+    title = models.CharField("Название", max_length=1024)
+    description = models.TextField("Описание", null=True, blank=True)
+    project_id = models.CharField("Проект", max_length=255, null=True, blank=True)
+    column_id = models.CharField("Колонка", max_length=255, null=True, blank=True)
+    executor_id = models.CharField("ID исполнителя в YouGile", max_length=255, null=True, blank=True)
+    executor_username = models.CharField("Username исполнителя", max_length=255, null=True, blank=True)
+    batched = models.BooleanField("Часть пакета", default=False)
+    attachments = models.JSONField("Вложения", default=list, blank=True)
+    status = models.CharField("Статус", max_length=16, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.PositiveIntegerField("Попыток", default=0)
+    next_attempt_at = models.DateTimeField("Следующая попытка", default=timezone.now)
+    locked_until = models.DateTimeField("Заблокирована до", null=True, blank=True)
+    last_error = models.TextField("Последняя ошибка", null=True, blank=True)
+    yougile_task_id = models.CharField("ID задачи в YouGile", max_length=255, null=True, blank=True)
+    created_at = models.DateTimeField("Создана", auto_now_add=True)
+    updated_at = models.DateTimeField("Обновлена", auto_now=True)
+
+    class Meta:
+        verbose_name = "Задача в очереди"
+        verbose_name_plural = "Очередь задач"
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"], name="taskoutbox_status_next_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.title} ({self.status})"
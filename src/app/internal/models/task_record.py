@@ -0,0 +1,37 @@
+from django.db import models
+from django.db.models import Q
+from django.utils import timezone
+
+
+class TaskRecord(models.Model):
+    yougile_id = models.CharField("ID задачи в YouGile", max_length=255, unique=True)
+    telegram_id = models.BigIntegerField("ID автора в Telegram")
+    chat_id = models.BigIntegerField("ID чата")
+    title = models.CharField("Название", max_length=1024)
+    description = models.TextField("Описание", null=True, blank=True)
+    column_id = models.CharField("Колонка", max_length=255, null=True, blank=True)
+    executor_id = models.CharField("ID исполнителя в YouGile", max_length=255, null=True, blank=True)
+    executor_username = models.CharField("Username исполнителя", max_length=255, null=True, blank=True)
+    completed = models.BooleanField("Выполнена", default=False)
+    archived = models.BooleanField("В архиве", default=False)
+    deleted = models.BooleanField("Удалена", default=False)
+    created_at = models.DateTimeField("Создана", default=timezone.now)
+    synced_at = models.DateTimeField("Статус обновлён", null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Созданная задача"
+        verbose_name_plural = "Созданные задачи"
+        indexes = [
+            models.Index(fields=["telegram_id", "-created_at", "-id"], name="taskrecord_creator_idx"),
+            models.Index(fields=["executor_id", "-created_at", "-id"], name="taskrecord_executor_idx"),
+            models.Index(fields=["chat_id", "-created_at", "-id"], name="taskrecord_chat_idx"),
+            models.Index(
+                fields=["column_id"], condition=Q(completed=False, deleted=False), name="taskrecord_open_idx"
+            ),
+            models.Index(
+                fields=["synced_at", "id"], condition=Q(completed=False, deleted=False), name="taskrecord_sync_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.title} ({self.yougile_id})"
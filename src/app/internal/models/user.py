@@ -1,7 +1,18 @@
 from django.db import models
+from django.db.models.functions import Lower
 
 
 class YouGileUserManager(models.Manager):
+    def by_telegram_username(self, username):
+        return self.annotate(telegram_username_lower=Lower('telegram_username')).filter(
+            telegram_username_lower=username.lower()
+        )
+
+    def by_telegram_usernames(self, usernames):
+        return self.annotate(telegram_username_lower=Lower('telegram_username')).filter(
+            telegram_username_lower__in=[username.lower() for username in usernames]
+        )
+
     async def async_get(self, **kwargs):
         return await self.aget(**kwargs)
 
@@ -22,6 +33,9 @@ class YouGileUser(models.Model):
     class Meta:
         verbose_name = "Пользователь YouGile"
         verbose_name_plural = "Пользователи YouGile"
+        constraints = [
+            models.UniqueConstraint(Lower('telegram_username'), name='yougileuser_telegram_username_ci_unique'),
+        ]
 
     def __str__(self):
         return f"{self.yougile_email or self.telegram_id}"
@@ -0,0 +1,33 @@
+from django.db import models
+from django.db.models.functions import Lower
+
+
+class YougileEmployeeManager(models.Manager):
+    def by_email(self, email):
+        return self.annotate(email_lower=Lower('email')).filter(email_lower=email.strip().lower())
+
+    def by_emails(self, emails):
+        return self.annotate(email_lower=Lower('email')).filter(
+            email_lower__in=[email.strip().lower() for email in emails]
+        )
+
+
+class YougileEmployee(models.Model):
+    yougile_id = models.CharField("ID в YouGile", max_length=255, primary_key=True)
+    email = models.EmailField("Email", null=True, blank=True)
+    real_name = models.CharField("Имя", max_length=255, null=True, blank=True)
+    is_admin = models.BooleanField("Администратор", default=False)
+    sync_hash = models.CharField("Отпечаток данных", max_length=40)
+    synced_at = models.DateTimeField("Синхронизирован", auto_now=True)
+
+    objects = YougileEmployeeManager()
+
+    class Meta:
+        verbose_name = "Сотрудник YouGile"
+        verbose_name_plural = "Сотрудники YouGile"
+        indexes = [
+            models.Index(Lower('email'), name='yougileemployee_email_ci_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.real_name or self.email or self.yougile_id}"
@@ -0,0 +1,29 @@
+import functools
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+
+
+def configure_sqlite(sender, connection, **kwargs):
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+        cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'app_taskrecord_fts'")
+        if cursor.fetchone():
+            cursor.execute("SELECT rowid FROM app_taskrecord_fts LIMIT 0")
+
+
+def database_sync_to_async(func):
+    @functools.wraps(func)
+    def run(*args, **kwargs):
+        close_old_connections()
+        return func(*args, **kwargs)
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await sync_to_async(run, thread_sensitive=settings.DB_THREAD_SENSITIVE)(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,123 @@
+import asyncio
+import hashlib
+import json
+import logging
+import time
+
+from django.conf import settings
+
+from app.internal.models.yougile_employee import YougileEmployee
+from app.internal.services.yougile_service import YougileService
+
+logger = logging.getLogger(__name__)
+
+SYNCED_FIELDS = ('email', 'realName', 'isAdmin')
+
+
+class EmployeeService:
+    _sync_task = None
+
+    @staticmethod
+    def _fingerprint(user):
+        data = json.dumps([user.get(field) for field in SYNCED_FIELDS], ensure_ascii=False)
+        return hashlib.sha1(data.encode()).hexdigest()
+
+    @staticmethod
+    def _to_employee(user, fingerprint):
+        email = (user.get('email') or '').strip() or None
+        return YougileEmployee(
+            yougile_id=user['id'],
+            email=email,
+            real_name=user.get('realName'),
+            is_admin=bool(user.get('isAdmin')),
+            sync_hash=fingerprint,
+        )
+
+    @staticmethod
+    async def _upsert(employees):
+        await YougileEmployee.objects.abulk_create(
+            employees,
+            update_conflicts=True,
+            unique_fields=['yougile_id'],
+            update_fields=['email', 'real_name', 'is_admin', 'sync_hash', 'synced_at'],
+        )
+
+    @staticmethod
+    async def sync(chunk_size=None, full=False):
+        chunk_size = chunk_size or settings.YOUGILE_SYNC_CHUNK_SIZE
+        started = time.monotonic()
+        known = {}
+        if not full:
+            async for yougile_id, sync_hash in YougileEmployee.objects.values_list('yougile_id', 'sync_hash'):
+                known[yougile_id] = sync_hash
+
+        stats = {'fetched': 0, 'upserted': 0, 'unchanged': 0, 'deleted': 0}
+        seen = set()
+        pending = []
+        async for user in YougileService.get_instance().iter_users():
+            if user.get('deleted') or not user.get('id'):
+                continue
+            stats['fetched'] += 1
+            seen.add(user['id'])
+            fingerprint = EmployeeService._fingerprint(user)
+            if known.get(user['id']) == fingerprint:
+                stats['unchanged'] += 1
+                continue
+            pending.append(EmployeeService._to_employee(user, fingerprint))
+            if len(pending) >= chunk_size:
+                await EmployeeService._upsert(pending)
+                stats['upserted'] += len(pending)
+                pending = []
+        if pending:
+            await EmployeeService._upsert(pending)
+            stats['upserted'] += len(pending)
+
+        if full:
+            async for yougile_id in YougileEmployee.objects.values_list('yougile_id', flat=True):
+                known[yougile_id] = None
+        removed = [yougile_id for yougile_id in known if yougile_id not in seen]
+        for offset in range(0, len(removed), chunk_size):
+            deleted, _ = await YougileEmployee.objects.filter(yougile_id__in=removed[offset:offset + chunk_size]).adelete()
+            stats['deleted'] += deleted
+
+        stats['elapsed'] = time.monotonic() - started
+        logger.info(
+            "Synced YouGile employees: %(fetched)d fetched, %(upserted)d upserted, "
+            "%(unchanged)d unchanged, %(deleted)d deleted in %(elapsed).2fs", stats,
+        )
+        return stats
+
+    @classmethod
+    async def _sync_loop(cls, interval):
+        while True:
+            try:
+                await cls.sync()
+            except Exception:
+                logger.exception("YouGile employee sync failed")
+            await asyncio.sleep(interval)
+
+    @classmethod
+    def start_periodic_sync(cls, interval):
+        if cls._sync_task is None or cls._sync_task.done():
+            cls._sync_task = asyncio.create_task(cls._sync_loop(interval))
+
+    @classmethod
+    async def stop_periodic_sync(cls):
+        if cls._sync_task is not None:
+            cls._sync_task.cancel()
+            try:
+                await cls._sync_task
+            except asyncio.CancelledError:
+                pass
+            cls._sync_task = None
+
+    @staticmethod
+    async def get_yougile_id_by_email(email):
+        return await YougileEmployee.objects.by_email(email).values_list('yougile_id', flat=True).afirst()
+
+    @staticmethod
+    async def get_yougile_ids_by_emails(emails):
+        result = {}
+        async for email, yougile_id in YougileEmployee.objects.by_emails(emails).values_list('email_lower', 'yougile_id'):
+            result.setdefault(email, yougile_id)
+        return result
@@ -0,0 +1,119 @@
+import hashlib
+import json
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from app.internal.models.event_subscription import EventSubscription
+from app.internal.models.received_event import ReceivedEvent
+from app.internal.models.task_record import TaskRecord
+from app.internal.services import metrics
+from app.internal.services.task_service import SYNCED_FIELDS, TaskService
+from app.internal.services.yougile_service import task_url
+
+logger = logging.getLogger(__name__)
+
+PREVIOUS_FIELDS = {'columnId': 'column_id', 'completed': 'completed', 'archived': 'archived', 'deleted': 'deleted'}
+PURGE_EVERY = 1000
+
+
+class EventService:
+    @staticmethod
+    def event_key(data):
+        if data.get('id'):
+            return str(data['id'])
+        body = json.dumps(data, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+        return hashlib.sha1(body.encode()).hexdigest()
+
+    @staticmethod
+    def mark_received(data):
+        try:
+            with transaction.atomic():
+                event = ReceivedEvent.objects.create(key=EventService.event_key(data))
+        except IntegrityError:
+            return False
+        if event.id % PURGE_EVERY == 0:
+            expired = timezone.now() - timedelta(seconds=settings.YOUGILE_EVENT_DEDUPE_TTL)
+            ReceivedEvent.objects.filter(received_at__lt=expired).delete()
+        return True
+
+    @staticmethod
+    def _before(record, previous):
+        if record is not None:
+            return {field: getattr(record, field) for field in SYNCED_FIELDS}
+        if previous:
+            return {field: previous[key] for key, field in PREVIOUS_FIELDS.items() if key in previous}
+        return None
+
+    @staticmethod
+    def _status_change(state, before):
+        if state.get('deleted') and not before.get('deleted'):
+            return "удалена"
+        if state.get('completed') and before.get('completed') is False:
+            return "выполнена"
+        if before.get('completed') and state.get('completed') is False:
+            return "снова открыта"
+        if state.get('archived') and before.get('archived') is False:
+            return "перенесена в архив"
+        if before.get('column_id') and state.get('column_id') and state['column_id'] != before['column_id']:
+            return "перемещена в другую колонку"
+        return None
+
+    @staticmethod
+    def _new_assignees(event_type, task, record, previous):
+        assigned = task.get('assigned') or []
+        if previous and 'assigned' in previous:
+            earlier = previous['assigned'] or []
+        elif record is not None:
+            earlier = [record.executor_id] if record.executor_id else []
+        elif event_type == 'task-created':
+            earlier = []
+        else:
+            return []
+        return [user_id for user_id in assigned if user_id not in earlier]
+
+    @staticmethod
+    def notifications(event_type, task, previous=None):
+        task_id = task['id']
+        record = TaskRecord.objects.filter(yougile_id=task_id).first()
+        state = {'deleted': True} if event_type == 'task-deleted' else TaskService._state(task)
+        before = EventService._before(record, previous)
+        change = EventService._status_change(state, before) if before is not None else None
+        assignees = [] if state.get('deleted') else EventService._new_assignees(event_type, task, record, previous)
+
+        if record is not None and any(getattr(record, field) != value for field, value in state.items()):
+            TaskRecord.objects.filter(id=record.id).update(**state, synced_at=timezone.now())
+        if not change and not assignees:
+            return []
+
+        query = Q(kind=EventSubscription.KIND_TASK, target_id=task_id) if change else Q()
+        if assignees:
+            query |= Q(kind=EventSubscription.KIND_USER, target_id__in=assignees)
+        title = task.get('title') or (record.title if record is not None else task_id)
+        link = task_url(task_id)
+        notifications = []
+        for kind, chat_id in EventSubscription.objects.filter(query).values_list('kind', 'chat_id'):
+            if kind == EventSubscription.KIND_TASK:
+                notifications.append((chat_id, f"Задача «{title}» {change}\n{link}"))
+            else:
+                notifications.append((chat_id, f"Вас назначили исполнителем задачи «{title}»\n{link}"))
+        return notifications
+
+    @staticmethod
+    def ingest(data):
+        event_type = data.get('event') or ''
+        task = data.get('payload') or {}
+        if not event_type.startswith('task-') or not task.get('id'):
+            metrics.yougile_events_total.inc(status="ignored")
+            return []
+        with transaction.atomic():
+            if not EventService.mark_received(data):
+                metrics.yougile_events_total.inc(status="duplicate")
+                return []
+            notifications = EventService.notifications(event_type, task, data.get('prevData'))
+        metrics.yougile_events_total.inc(status="processed")
+        return notifications
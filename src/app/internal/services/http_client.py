@@ -0,0 +1,43 @@
+import asyncio
+import aiohttp
+from django.conf import settings
+
+
+class HttpClient:
+    _session = None
+
+    @classmethod
+    def _create_session(cls):
+        connector = aiohttp.TCPConnector(
+            limit=settings.YOUGILE_HTTP_POOL_LIMIT,
+            limit_per_host=settings.YOUGILE_HTTP_POOL_LIMIT_PER_HOST,
+            keepalive_timeout=settings.YOUGILE_HTTP_KEEPALIVE,
+            ttl_dns_cache=300,
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=settings.YOUGILE_HTTP_TIMEOUT,
+            connect=settings.YOUGILE_HTTP_CONNECT_TIMEOUT,
+        )
+        return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+    @classmethod
+    def _is_usable(cls):
+        if cls._session is None or cls._session.closed:
+            return False
+        return cls._session._loop is asyncio.get_running_loop()
+
+    @classmethod
+    async def start(cls):
+        return cls.get_session()
+
+    @classmethod
+    async def close(cls):
+        if cls._session is not None and not cls._session.closed:
+            await cls._session.close()
+        cls._session = None
+
+    @classmethod
+    def get_session(cls):
+        if not cls._is_usable():
+            cls._session = cls._create_session()
+        return cls._session
@@ -0,0 +1,111 @@
+import time
+from contextlib import contextmanager
+
+REGISTRY = []
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{str(value)}"' for key, value in labels)
+    return "{" + pairs + "}"
+
+
+class Counter:
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        REGISTRY.append(self)
+
+    def _key(self, labels):
+        return tuple((name, labels.get(name, "")) for name in self.labelnames)
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self._values.get(self._key(labels), 0)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        for key, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(key)} {value}")
+        return lines
+
+
+class Histogram:
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._values = {}
+        REGISTRY.append(self)
+
+    def observe(self, value, **labels):
+        key = tuple((name, labels.get(name, "")) for name in self.labelnames)
+        counts, total, count = self._values.get(key, ([0] * len(self.buckets), 0.0, 0))
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[index] += 1
+        self._values[key] = (counts, total + value, count + 1)
+
+    @contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for key, (counts, total, count) in sorted(self._values.items()):
+            for bound, bucket_count in zip(self.buckets, counts):
+                lines.append(f"{self.name}_bucket{_format_labels(key + (('le', bound),))} {bucket_count}")
+            lines.append(f"{self.name}_bucket{_format_labels(key + (('le', '+Inf'),))} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {count}")
+        return lines
+
+
+def render():
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+yougile_requests_total = Counter(
+    "yougile_requests_total", "YouGile API requests by method, path and status", ("method", "path", "status")
+)
+yougile_request_duration_seconds = Histogram(
+    "yougile_request_duration_seconds", "YouGile API request latency", ("method", "path")
+)
+yougile_tasks_created_total = Counter("yougile_tasks_created_total", "Tasks created in YouGile")
+yougile_task_failures_total = Counter("yougile_task_failures_total", "Tasks that could not be created in YouGile")
+yougile_attachments_total = Counter(
+    "yougile_attachments_total", "Telegram files forwarded to YouGile tasks by outcome", ("status",)
+)
+yougile_user_directory_lookups_total = Counter(
+    "yougile_user_directory_lookups_total", "YouGile user directory email lookups by result", ("result",)
+)
+bot_handler_duration_seconds = Histogram("bot_handler_duration_seconds", "Telegram handler latency", ("handler",))
+bot_handler_errors_total = Counter("bot_handler_errors_total", "Unhandled exceptions in Telegram handlers", ("handler",))
+bot_updates_dropped_total = Counter(
+    "bot_updates_dropped_total", "Telegram updates dropped before reaching a handler", ("reason",)
+)
+telegram_send_wait_seconds = Histogram(
+    "telegram_send_wait_seconds", "Time Bot API requests spent waiting for the rate governor", ("method",)
+)
+telegram_flood_waits_total = Counter("telegram_flood_waits_total", "Bot API 429 responses", ("method",))
+yougile_events_total = Counter("yougile_events_total", "YouGile webhook events by outcome", ("status",))
+bot_notifications_total = Counter("bot_notifications_total", "Event notifications by delivery outcome", ("status",))
+bot_notification_latency_seconds = Histogram(
+    "bot_notification_latency_seconds", "Time from receiving a YouGile event to delivering its notification"
+)
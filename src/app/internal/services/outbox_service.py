@@ -0,0 +1,115 @@
+from datetime import timedelta
+from django.conf import settings
+from django.db.models import F, Q, Subquery
+from django.db.models.functions import Abs, Mod
+from django.utils import timezone
+from app.internal.models.task_outbox import TaskOutbox
+from app.internal.services.db import database_sync_to_async
+
+
+class OutboxService:
+    @staticmethod
+    @database_sync_to_async
+    def enqueue(telegram_id, chat_id, title, description=None, column_id=None, executor_id=None,
+                executor_username=None, reply_message_id=None, attachments=None, project_id=None):
+        return TaskOutbox.objects.create(
+            telegram_id=telegram_id,
+            chat_id=chat_id,
+            reply_message_id=reply_message_id,
+            title=title,
+            description=description,
+            project_id=project_id,
+            column_id=column_id,
+            executor_id=executor_id,
+            executor_username=executor_username,
+            attachments=attachments or [],
+        )
+
+    @staticmethod
+    @database_sync_to_async
+    def enqueue_batch(telegram_id, chat_id, reply_message_id, tasks, project_id=None, column_id=None):
+        return TaskOutbox.objects.bulk_create([
+            TaskOutbox(
+                telegram_id=telegram_id,
+                chat_id=chat_id,
+                reply_message_id=reply_message_id,
+                batched=True,
+                project_id=project_id,
+                column_id=column_id,
+                **task,
+            )
+            for task in tasks
+        ])
+
+    @staticmethod
+    @database_sync_to_async
+    def get_batch(chat_id, reply_message_id):
+        return list(
+            TaskOutbox.objects.filter(chat_id=chat_id, reply_message_id=reply_message_id, batched=True).order_by('id')
+        )
+
+    @staticmethod
+    def _due(now):
+        return Q(status=TaskOutbox.STATUS_PENDING, next_attempt_at__lte=now) | Q(
+            status=TaskOutbox.STATUS_PROCESSING, locked_until__lte=now
+        )
+
+    @staticmethod
+    @database_sync_to_async
+    def claim_due(limit, shard=None):
+        now = timezone.now()
+        lease = now + timedelta(seconds=settings.OUTBOX_LEASE_SECONDS)
+        due = TaskOutbox.objects.filter(OutboxService._due(now))
+        if shard is not None:
+            index, count = shard
+            due = due.annotate(shard=Mod(Abs('chat_id'), count)).filter(shard=index)
+        due_ids = due.order_by('next_attempt_at', 'id').values_list('id', flat=True)
+        claimed = []
+        for entry_id in list(due_ids[:limit]):
+            updated = TaskOutbox.objects.filter(OutboxService._due(now), id=entry_id).update(
+                status=TaskOutbox.STATUS_PROCESSING, locked_until=lease
+            )
+            if updated:
+                claimed.append(entry_id)
+        if not claimed:
+            return []
+        return list(TaskOutbox.objects.filter(id__in=claimed).order_by('id'))
+
+    @staticmethod
+    @database_sync_to_async
+    def mark_sent(entry_id, yougile_task_id):
+        TaskOutbox.objects.filter(id=entry_id).update(
+            status=TaskOutbox.STATUS_SENT, yougile_task_id=yougile_task_id, locked_until=None,
+            attempts=F('attempts') + 1, updated_at=timezone.now(),
+        )
+
+    @staticmethod
+    @database_sync_to_async
+    def release(entry_ids, behind):
+        TaskOutbox.objects.filter(id__in=entry_ids, status=TaskOutbox.STATUS_PROCESSING).update(
+            status=TaskOutbox.STATUS_PENDING, locked_until=None, updated_at=timezone.now(),
+            next_attempt_at=Subquery(TaskOutbox.objects.filter(id=behind).values('next_attempt_at')[:1]),
+        )
+
+    @staticmethod
+    @database_sync_to_async
+    def mark_failed(entry, error):
+        TaskOutbox.objects.filter(id=entry.id, status=TaskOutbox.STATUS_PROCESSING).update(
+            status=TaskOutbox.STATUS_FAILED, attempts=entry.attempts + 1, last_error=error, locked_until=None,
+            updated_at=timezone.now(),
+        )
+
+    @staticmethod
+    @database_sync_to_async
+    def mark_retry(entry, error):
+        attempts = entry.attempts + 1
+        if attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+            status = TaskOutbox.STATUS_FAILED
+        else:
+            status = TaskOutbox.STATUS_PENDING
+        delay = min(settings.OUTBOX_RETRY_MAX_DELAY, settings.OUTBOX_RETRY_BASE_DELAY * 2 ** entry.attempts)
+        TaskOutbox.objects.filter(id=entry.id, status=TaskOutbox.STATUS_PROCESSING).update(
+            status=status, attempts=attempts, last_error=error, locked_until=None,
+            next_attempt_at=timezone.now() + timedelta(seconds=delay), updated_at=timezone.now(),
+        )
+        return status
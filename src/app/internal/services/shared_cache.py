@@ -0,0 +1,27 @@
+import logging
+import time
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+
+async def load(key, ttl):
+    try:
+        entry = await cache.aget(key)
+    except Exception as e:
+        logger.warning("Shared cache read %s failed: %s", key, e)
+        return None
+    if entry is None:
+        return None
+    age = time.time() - entry['stored_at']
+    if age >= ttl:
+        return None
+    return entry['value'], age
+
+
+async def store(key, value, ttl):
+    try:
+        await cache.aset(key, {'stored_at': time.time(), 'value': value}, timeout=ttl)
+    except Exception as e:
+        logger.warning("Shared cache write %s failed: %s", key, e)
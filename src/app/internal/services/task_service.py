@@ -0,0 +1,228 @@
+import asyncio
+import logging
+import re
+import time
+from contextlib import aclosing
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import F, Q
+from django.utils import timezone
+
+from app.internal.models.event_subscription import EventSubscription
+from app.internal.models.task_record import TaskRecord
+from app.internal.services.db import database_sync_to_async
+from app.internal.services.yougile_service import YougileService
+
+logger = logging.getLogger(__name__)
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+SYNCED_FIELDS = ('column_id', 'executor_id', 'completed', 'archived', 'deleted')
+SEARCH_TERM = re.compile(r'\w+')
+
+SQLITE_SEARCH = (
+    "SELECT t.* FROM app_taskrecord_fts f JOIN app_taskrecord t ON t.id = f.rowid "
+    "WHERE app_taskrecord_fts MATCH %s AND NOT t.deleted AND (t.telegram_id = %s OR t.executor_id = %s "
+    "OR t.chat_id IN (SELECT chat_id FROM app_taskrecord WHERE telegram_id = %s)){before} "
+    "ORDER BY f.rowid DESC LIMIT %s"
+)
+POSTGRES_SEARCH = (
+    "SELECT * FROM app_taskrecord "
+    "WHERE to_tsvector('simple', title || ' ' || coalesce(description, '')) @@ to_tsquery('simple', %s) "
+    "AND NOT deleted AND (telegram_id = %s OR executor_id = %s "
+    "OR chat_id IN (SELECT chat_id FROM app_taskrecord WHERE telegram_id = %s)){before} "
+    "ORDER BY id DESC LIMIT %s"
+)
+
+
+class TaskService:
+    _sync_task = None
+
+    @staticmethod
+    def build(task, telegram_id, chat_id, description=None, executor_id=None, executor_username=None):
+        return TaskRecord(
+            yougile_id=task['id'],
+            telegram_id=telegram_id,
+            chat_id=chat_id,
+            title=task['title'],
+            description=description,
+            column_id=task.get('column_id'),
+            executor_id=executor_id,
+            executor_username=executor_username,
+        )
+
+    @staticmethod
+    @database_sync_to_async
+    def save(records):
+        TaskRecord.objects.bulk_create(records, ignore_conflicts=True)
+        EventSubscription.objects.bulk_create(
+            [
+                EventSubscription(
+                    kind=EventSubscription.KIND_TASK, target_id=record.yougile_id,
+                    chat_id=record.chat_id, telegram_id=record.telegram_id,
+                )
+                for record in records
+            ],
+            ignore_conflicts=True,
+        )
+
+    @staticmethod
+    def encode_cursor(record):
+        return f"{(record.created_at - EPOCH) // timedelta(microseconds=1)}.{record.id}"
+
+    @staticmethod
+    def decode_cursor(cursor):
+        micros, _, record_id = cursor.partition('.')
+        return EPOCH + timedelta(microseconds=int(micros)), int(record_id)
+
+    @staticmethod
+    def _page(queryset, cursor, limit):
+        limit = limit or settings.BOT_TASKS_PAGE_SIZE
+        if cursor:
+            created_at, record_id = TaskService.decode_cursor(cursor)
+            queryset = queryset.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=record_id))
+        records = list(queryset.filter(deleted=False).order_by('-created_at', '-id')[:limit + 1])
+        if len(records) <= limit:
+            return records, None
+        records = records[:limit]
+        return records, TaskService.encode_cursor(records[-1])
+
+    @staticmethod
+    @database_sync_to_async
+    def list_created(telegram_id, cursor=None, limit=None):
+        return TaskService._page(TaskRecord.objects.filter(telegram_id=telegram_id), cursor, limit)
+
+    @staticmethod
+    @database_sync_to_async
+    def list_assigned(yougile_id, cursor=None, limit=None):
+        return TaskService._page(TaskRecord.objects.filter(executor_id=yougile_id), cursor, limit)
+
+    @staticmethod
+    def _search_terms(text):
+        return SEARCH_TERM.findall(text.lower())[:settings.TASK_SEARCH_MAX_TERMS]
+
+    @staticmethod
+    @database_sync_to_async
+    def search(text, telegram_id, yougile_id, before=None, limit=None):
+        terms = TaskService._search_terms(text)
+        if not terms:
+            return []
+        limit = limit or settings.BOT_INLINE_RESULTS
+        if connection.vendor == 'sqlite':
+            sql = SQLITE_SEARCH.format(before=" AND f.rowid < %s" if before else "")
+            match = ' '.join(f'"{term}"*' for term in terms)
+        elif connection.vendor == 'postgresql':
+            sql = POSTGRES_SEARCH.format(before=" AND id < %s" if before else "")
+            match = ' & '.join(f'{term}:*' for term in terms)
+        else:
+            chats = TaskRecord.objects.filter(telegram_id=telegram_id).values('chat_id')
+            queryset = TaskRecord.objects.filter(
+                Q(telegram_id=telegram_id) | Q(executor_id=yougile_id) | Q(chat_id__in=chats), deleted=False
+            )
+            if before:
+                queryset = queryset.filter(id__lt=before)
+            for term in terms:
+                queryset = queryset.filter(Q(title__icontains=term) | Q(description__icontains=term))
+            return list(queryset.order_by('-id')[:limit])
+        params = [match, telegram_id, yougile_id, telegram_id] + ([before] if before else []) + [limit]
+        return list(TaskRecord.objects.raw(sql, params))
+
+    @staticmethod
+    @database_sync_to_async
+    def _open_records(limit):
+        records = TaskRecord.objects.filter(completed=False, deleted=False)
+        return list(records.order_by(F('synced_at').asc(nulls_first=True), 'id')[:limit])
+
+    @staticmethod
+    @database_sync_to_async
+    def _store(records):
+        TaskRecord.objects.bulk_update(records, SYNCED_FIELDS + ('synced_at',))
+
+    @staticmethod
+    def _state(task):
+        if task is None:
+            return {'deleted': True}
+        assigned = task.get('assigned') or []
+        return {
+            'column_id': task.get('columnId'),
+            'executor_id': assigned[0] if assigned else None,
+            'completed': bool(task.get('completed')),
+            'archived': bool(task.get('archived')),
+            'deleted': bool(task.get('deleted')),
+        }
+
+    @staticmethod
+    async def _fetch_missing(task_ids):
+        yougile = YougileService.get_instance()
+        semaphore = asyncio.Semaphore(settings.YOUGILE_BATCH_CONCURRENCY)
+
+        async def fetch(task_id):
+            async with semaphore:
+                return task_id, await yougile.get_task(task_id)
+
+        return dict(await asyncio.gather(*(fetch(task_id) for task_id in task_ids)))
+
+    @staticmethod
+    async def sync_statuses(limit=None):
+        started = time.monotonic()
+        records = {
+            record.yougile_id: record
+            for record in await TaskService._open_records(limit or settings.YOUGILE_TASK_SYNC_BATCH)
+        }
+        columns = {}
+        for record in records.values():
+            if record.column_id:
+                columns.setdefault(record.column_id, set()).add(record.yougile_id)
+
+        tasks = {}
+        yougile = YougileService.get_instance()
+        for column_id, wanted in columns.items():
+            async with aclosing(yougile.iter_tasks(column_id)) as column_tasks:
+                async for task in column_tasks:
+                    if task.get('id') in wanted:
+                        tasks[task['id']] = task
+                        wanted.discard(task['id'])
+                        if not wanted:
+                            break
+        tasks.update(await TaskService._fetch_missing([task_id for task_id in records if task_id not in tasks]))
+
+        now = timezone.now()
+        changed = 0
+        for task_id, record in records.items():
+            state = TaskService._state(tasks[task_id])
+            if any(getattr(record, field) != value for field, value in state.items()):
+                changed += 1
+                for field, value in state.items():
+                    setattr(record, field, value)
+            record.synced_at = now
+        if records:
+            await TaskService._store(list(records.values()))
+
+        stats = {'checked': len(records), 'changed': changed, 'elapsed': time.monotonic() - started}
+        logger.info("Synced YouGile task statuses: %(checked)d checked, %(changed)d changed in %(elapsed).2fs", stats)
+        return stats
+
+    @classmethod
+    async def _sync_loop(cls, interval):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await cls.sync_statuses()
+            except Exception:
+                logger.exception("YouGile task status sync failed")
+
+    @classmethod
+    def start_periodic_sync(cls, interval):
+        if cls._sync_task is None or cls._sync_task.done():
+            cls._sync_task = asyncio.create_task(cls._sync_loop(interval))
+
+    @classmethod
+    async def stop_periodic_sync(cls):
+        if cls._sync_task is not None:
+            cls._sync_task.cancel()
+            try:
+                await cls._sync_task
+            except asyncio.CancelledError:
+                pass
+            cls._sync_task = None
@@ -0,0 +1,73 @@
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+
+class UserCache:
+    _by_id = OrderedDict()
+    _executors = OrderedDict()
+    _usernames = {}
+
+    @classmethod
+    def _expired(cls, stored_at):
+        return time.monotonic() - stored_at >= settings.USER_CACHE_TTL
+
+    @classmethod
+    def _evict(cls, entries):
+        while len(entries) > settings.USER_CACHE_MAX_SIZE:
+            entries.popitem(last=False)
+
+    @classmethod
+    def get(cls, telegram_id):
+        entry = cls._by_id.get(telegram_id)
+        if entry is None:
+            return None
+        user, stored_at = entry
+        if cls._expired(stored_at):
+            cls.invalidate(telegram_id)
+            return None
+        cls._by_id.move_to_end(telegram_id)
+        return user
+
+    @classmethod
+    def put(cls, user):
+        cls.invalidate(user.telegram_id)
+        cls._by_id[user.telegram_id] = (user, time.monotonic())
+        cls._evict(cls._by_id)
+        if user.telegram_username:
+            cls.put_executor(user.telegram_username, user.telegram_id, user.yougile_id)
+        return user
+
+    @classmethod
+    def get_executor(cls, username):
+        key = username.lower()
+        entry = cls._executors.get(key)
+        if entry is None:
+            return None
+        telegram_id, yougile_id, stored_at = entry
+        if cls._expired(stored_at):
+            cls.invalidate(telegram_id)
+            return None
+        cls._executors.move_to_end(key)
+        return yougile_id
+
+    @classmethod
+    def put_executor(cls, username, telegram_id, yougile_id):
+        key = username.lower()
+        cls._executors[key] = (telegram_id, yougile_id, time.monotonic())
+        cls._usernames[telegram_id] = key
+        cls._evict(cls._executors)
+
+    @classmethod
+    def invalidate(cls, telegram_id):
+        cls._by_id.pop(telegram_id, None)
+        username = cls._usernames.pop(telegram_id, None)
+        if username is not None:
+            cls._executors.pop(username, None)
+
+    @classmethod
+    def clear(cls):
+        cls._by_id.clear()
+        cls._executors.clear()
+        cls._usernames.clear()
@@ -1,81 +1,145 @@
 from typing import Optional
 from django.utils import timezone
-from asgiref.sync import sync_to_async
+from app.internal.models.event_subscription import EventSubscription
 from app.internal.models.user import YouGileUser
+from app.internal.services.db import database_sync_to_async
+from app.internal.services.user_cache import UserCache
 
 
 class UserService:
     @staticmethod
-    @sync_to_async
-    def get_or_create_user(telegram_id):
-        user, created = YouGileUser.objects.get_or_create(telegram_id=telegram_id)
-        return user
+    async def get_or_create_user(telegram_id):
+        user = UserCache.get(telegram_id)
+        if user is not None:
+            return user
+        user, created = await UserService._get_or_create(telegram_id)
+        return UserCache.put(user)
 
     @staticmethod
-    @sync_to_async
-    def get_user_by_id(telegram_id):
-        try:
-            return YouGileUser.objects.get(telegram_id=telegram_id)
-        except YouGileUser.DoesNotExist:
-            return None
+    @database_sync_to_async
+    def _get_or_create(telegram_id):
+        return YouGileUser.objects.get_or_create(telegram_id=telegram_id)
 
     @staticmethod
-    @sync_to_async
-    def set_yougile_credentials(telegram_id, yougile_email, yougile_id=None):
-        try:
-            user = YouGileUser.objects.get(telegram_id=telegram_id)
-            user.yougile_email = yougile_email
-            if yougile_id:
-                user.yougile_id = yougile_id
-            user.save()
-            return True
-        except YouGileUser.DoesNotExist:
-            return False
-
-    @staticmethod
-    @sync_to_async
-    def set_default_yougile_column(telegram_id, column_id):
-        try:
-            user = YouGileUser.objects.get(telegram_id=telegram_id)
-            user.default_column_id = column_id
-            user.save()
-            return True
-        except YouGileUser.DoesNotExist:
-            return False
-
-    @staticmethod
-    @sync_to_async
-    def get_user_info(telegram_id):
-        try:
-            user = YouGileUser.objects.get(telegram_id=telegram_id)
-            return {
-                'telegram_id': user.telegram_id,
-                'yougile_email': user.yougile_email,
-                'yougile_id': user.yougile_id,
-                'default_project_id': user.default_project_id,
-                'default_column_id': user.default_column_id,
-                'has_yougile': bool(user.yougile_email),
-            }
-        except YouGileUser.DoesNotExist:
+    async def get_user_by_id(telegram_id):
+        user = UserCache.get(telegram_id)
+        if user is not None:
+            return user
+        user = await UserService._fetch_user(telegram_id)
+        if user is None:
             return None
+        return UserCache.put(user)
+
+    @staticmethod
+    @database_sync_to_async
+    def _fetch_user(telegram_id):
+        return YouGileUser.objects.filter(telegram_id=telegram_id).first()
+
+    @staticmethod
+    @database_sync_to_async
+    def _update(telegram_id, **fields):
+        return YouGileUser.objects.filter(telegram_id=telegram_id).update(**fields)
+
+    @staticmethod
+    async def _update_user(telegram_id, **fields):
+        updated = await UserService._update(telegram_id, **fields)
+        UserCache.invalidate(telegram_id)
+        return bool(updated)
+
+    @staticmethod
+    async def set_yougile_credentials(telegram_id, yougile_email, yougile_id=None):
+        fields = {'yougile_email': yougile_email}
+        if yougile_id:
+            fields['yougile_id'] = yougile_id
+        updated = await UserService._update_user(telegram_id, **fields)
+        if updated and yougile_id:
+            await UserService._subscribe_assignments(telegram_id, yougile_id)
+        return updated
+
+    @staticmethod
+    @database_sync_to_async
+    def _subscribe_assignments(telegram_id, yougile_id):
+        subscriptions = EventSubscription.objects.filter(kind=EventSubscription.KIND_USER, telegram_id=telegram_id)
+        subscriptions.exclude(target_id=yougile_id).delete()
+        EventSubscription.objects.get_or_create(
+            kind=EventSubscription.KIND_USER, target_id=yougile_id, chat_id=telegram_id,
+            defaults={'telegram_id': telegram_id},
+        )
+
+    @staticmethod
+    async def set_default_yougile_column(telegram_id, column_id, project_id=None):
+        fields = {'default_column_id': column_id}
+        if project_id:
+            fields['default_project_id'] = project_id
+        return await UserService._update_user(telegram_id, **fields)
 
     @staticmethod
-    @sync_to_async
-    def set_telegram_username(telegram_id, username):
-        try:
-            user = YouGileUser.objects.get(telegram_id=telegram_id)
-            user.telegram_username = username
-            user.save()
-            return True
-        except YouGileUser.DoesNotExist:
-            return False
-
-    @staticmethod
-    @sync_to_async
-    def get_yougile_id_by_telegram_username(username):
-        try:
-            clean_username = username.replace('@', '')
-            user = YouGileUser.objects.get(telegram_username=clean_username)
-            return user.yougile_id
-        except YouGileUser.DoesNotExist:
+    async def get_user_info(telegram_id):
+        user = await UserService.get_user_by_id(telegram_id)
+        if user is None:
             return None
+        return {
+            'telegram_id': user.telegram_id,
+            'yougile_email': user.yougile_email,
+            'yougile_id': user.yougile_id,
+            'default_project_id': user.default_project_id,
+            'default_column_id': user.default_column_id,
+            'has_yougile': bool(user.yougile_email),
+        }
+
+    @staticmethod
+    @database_sync_to_async
+    def _release_username(telegram_id, username):
+        previous_owners = YouGileUser.objects.by_telegram_username(username).exclude(telegram_id=telegram_id)
+        owner_ids = list(previous_owners.values_list('telegram_id', flat=True))
+        YouGileUser.objects.filter(telegram_id__in=owner_ids).update(telegram_username=None)
+        return owner_ids
+
+    @staticmethod
+    async def set_telegram_username(telegram_id, username):
+        for owner_id in await UserService._release_username(telegram_id, username):
+            UserCache.invalidate(owner_id)
+        return await UserService._update_user(telegram_id, telegram_username=username)
+
+    @staticmethod
+    async def get_yougile_id_by_telegram_username(username):
+        clean_username = username.replace('@', '')
+        yougile_id = UserCache.get_executor(clean_username)
+        if yougile_id is not None:
+            return yougile_id
+        telegram_id, yougile_id = await UserService._lookup_executor(clean_username)
+        if telegram_id is not None:
+            UserCache.put_executor(clean_username, telegram_id, yougile_id)
+        return yougile_id
+
+    @staticmethod
+    @database_sync_to_async
+    def _lookup_executor(username):
+        row = YouGileUser.objects.by_telegram_username(username).values_list('telegram_id', 'yougile_id').first()
+        if row is None:
+            return None, None
+        return row
+
+    @staticmethod
+    async def get_yougile_ids_by_telegram_usernames(usernames):
+        result = {}
+        missing = []
+        for username in usernames:
+            clean_username = username.replace('@', '').lower()
+            yougile_id = UserCache.get_executor(clean_username)
+            if yougile_id is not None:
+                result[clean_username] = yougile_id
+            else:
+                missing.append(clean_username)
+        if missing:
+            for telegram_id, username, yougile_id in await UserService._lookup_executors(missing):
+                UserCache.put_executor(username, telegram_id, yougile_id)
+                if yougile_id:
+                    result[username.lower()] = yougile_id
+        return result
+
+    @staticmethod
+    @database_sync_to_async
+    def _lookup_executors(usernames):
+        users = YouGileUser.objects.by_telegram_usernames(usernames)
+        return list(users.values_list('telegram_id', 'telegram_username', 'yougile_id'))
@@ -0,0 +1,122 @@
+import asyncio
+import logging
+import time
+from contextlib import aclosing
+
+from django.conf import settings
+
+from app.internal.services import metrics, shared_cache
+
+logger = logging.getLogger(__name__)
+
+SHARED_KEY = 'yougile:user_directory'
+
+
+class YougileUserDirectory:
+    def __init__(self, service):
+        self.service = service
+        self.ttl = settings.YOUGILE_USER_DIRECTORY_TTL
+        self.max_size = settings.YOUGILE_USER_DIRECTORY_MAX_SIZE
+        self.miss_refresh_interval = settings.YOUGILE_USER_DIRECTORY_MISS_REFRESH_INTERVAL
+        self._emails = {}
+        self._etag = None
+        self._last_modified = None
+        self._loaded_at = None
+        self._last_refresh_at = 0.0
+        self._truncated = False
+        self._lock = asyncio.Lock()
+        self._refresh_task = None
+
+    @staticmethod
+    def _normalize(email):
+        return email.strip().lower()
+
+    @property
+    def is_fresh(self):
+        return self._loaded_at is not None and time.monotonic() - self._loaded_at < self.ttl
+
+    def _rebuild(self, users):
+        emails = {}
+        truncated = False
+        for user in users:
+            email = user.get('email')
+            if not email:
+                continue
+            if len(emails) >= self.max_size:
+                truncated = True
+                break
+            emails[self._normalize(email)] = user.get('id')
+        self._emails = emails
+        self._truncated = truncated
+
+    async def refresh(self, force=False):
+        async with self._lock:
+            if not force and self.is_fresh:
+                return True
+            if not force:
+                shared = await shared_cache.load(SHARED_KEY, self.ttl)
+                if shared is not None:
+                    (self._emails, self._truncated, self._etag, self._last_modified), age = shared
+                    self._loaded_at = time.monotonic() - age
+                    return True
+            self._last_refresh_at = time.monotonic()
+            result = await self.service.fetch_users(etag=self._etag, last_modified=self._last_modified)
+            if result is None:
+                return False
+            if not result['not_modified']:
+                self._rebuild(result['users'])
+                self._etag = result['etag']
+                self._last_modified = result['last_modified']
+            self._loaded_at = time.monotonic()
+            await shared_cache.store(SHARED_KEY, (self._emails, self._truncated, self._etag, self._last_modified), self.ttl)
+            return True
+
+    async def find_id_by_email(self, email):
+        key = self._normalize(email)
+        if not self.is_fresh:
+            await self.refresh()
+        user_id = self._emails.get(key)
+        if user_id:
+            metrics.yougile_user_directory_lookups_total.inc(result="hit")
+            return user_id
+
+        metrics.yougile_user_directory_lookups_total.inc(result="miss")
+        if time.monotonic() - self._last_refresh_at >= self.miss_refresh_interval:
+            await self.refresh(force=True)
+            user_id = self._emails.get(key)
+            if user_id:
+                return user_id
+        if self._truncated:
+            return await self._scan_for_email(key)
+        return None
+
+    async def _scan_for_email(self, key):
+        try:
+            async with aclosing(self.service.iter_users()) as users:
+                async for user in users:
+                    if self._normalize(user.get('email') or '') == key:
+                        return user.get('id')
+        except Exception as e:
+            logger.warning("YouGile user scan failed: %s", e)
+        return None
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(self.ttl)
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("YouGile user directory refresh failed")
+
+    def start_background_refresh(self):
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop_background_refresh(self):
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
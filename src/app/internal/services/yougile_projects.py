@@ -0,0 +1,171 @@
+import asyncio
+import logging
+import time
+
+from django.conf import settings
+
+from app.internal.services import shared_cache
+
+logger = logging.getLogger(__name__)
+
+SHARED_KEY = 'yougile:project_tree'
+
+
+def _title_key(item):
+    return (item.get('title') or '').lower()
+
+
+class YougileProjectTree:
+    def __init__(self, service):
+        self.service = service
+        self.ttl = settings.YOUGILE_COLUMNS_TTL
+        self._projects = {}
+        self._boards = {}
+        self._boards_by_project = {}
+        self._columns_by_board = {}
+        self._column_boards = {}
+        self._loaded_at = None
+        self._shared_stale = False
+        self._lock = asyncio.Lock()
+        self._refresh_task = None
+
+    @property
+    def is_loaded(self):
+        return self._loaded_at is not None
+
+    @property
+    def is_fresh(self):
+        return self.is_loaded and time.monotonic() - self._loaded_at < self.ttl
+
+    async def _load(self, path, params=None):
+        return [
+            item
+            async for page in self.service.iter_pages(path, params)
+            for item in page
+            if not item.get('deleted')
+        ]
+
+    def _index_boards(self, boards):
+        for board in boards:
+            self._boards[board['id']] = board
+            self._boards_by_project.setdefault(board.get('projectId'), []).append(board['id'])
+
+    def _index_columns(self, columns):
+        for column in columns:
+            self._columns_by_board.setdefault(column.get('boardId'), []).append(column)
+            self._column_boards[column['id']] = column.get('boardId')
+
+    def _apply(self, projects, boards, columns):
+        self._projects = {project['id']: project for project in sorted(projects, key=_title_key)}
+        self._boards, self._boards_by_project = {}, {}
+        self._columns_by_board, self._column_boards = {}, {}
+        self._index_boards(sorted(boards, key=_title_key))
+        self._index_columns(columns)
+
+    async def refresh(self, force=False):
+        async with self._lock:
+            if not force and self.is_fresh:
+                return True
+            if not force and not self._shared_stale:
+                shared = await shared_cache.load(SHARED_KEY, self.ttl)
+                if shared is not None:
+                    (projects, boards, columns), age = shared
+                    self._apply(projects, boards, columns)
+                    self._loaded_at = time.monotonic() - age
+                    return True
+            try:
+                projects, boards, columns = await asyncio.gather(
+                    self._load('/projects'), self._load('/boards'), self._load('/columns')
+                )
+            except Exception as e:
+                logger.warning("Failed to load YouGile project tree: %s", e)
+                return False
+            self._apply(projects, boards, columns)
+            self._loaded_at = time.monotonic()
+            self._shared_stale = False
+            await shared_cache.store(SHARED_KEY, (projects, boards, columns), self.ttl)
+            logger.info(
+                "Loaded YouGile project tree: %d projects, %d boards, %d columns",
+                len(self._projects), len(self._boards), len(self._column_boards),
+            )
+            return True
+
+    async def refresh_project(self, project_id):
+        async with self._lock:
+            try:
+                boards = await self._load('/boards', {'projectId': project_id})
+                columns = await asyncio.gather(*(self._load('/columns', {'boardId': board['id']}) for board in boards))
+            except Exception as e:
+                logger.warning("Failed to refresh YouGile project %s: %s", project_id, e)
+                return False
+            for board_id in self._boards_by_project.pop(project_id, []):
+                self._boards.pop(board_id, None)
+                for column in self._columns_by_board.pop(board_id, []):
+                    self._column_boards.pop(column['id'], None)
+            self._index_boards(sorted(boards, key=_title_key))
+            for board_columns in columns:
+                self._index_columns(board_columns)
+            return True
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(self.ttl)
+            await self.refresh()
+
+    def start_background_refresh(self):
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop_background_refresh(self):
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+    async def ensure_loaded(self):
+        if not self.is_loaded:
+            await self.refresh()
+        return self.is_loaded
+
+    def projects(self):
+        return list(self._projects.values())
+
+    def get_project(self, project_id):
+        return self._projects.get(project_id)
+
+    def boards(self, project_id):
+        return [self._boards[board_id] for board_id in self._boards_by_project.get(project_id, [])]
+
+    def get_board(self, board_id):
+        return self._boards.get(board_id)
+
+    def columns(self, board_id):
+        return list(self._columns_by_board.get(board_id, []))
+
+    def project_columns(self, project_id):
+        return [
+            column
+            for board_id in self._boards_by_project.get(project_id, [])
+            for column in self._columns_by_board.get(board_id, [])
+        ]
+
+    def column_project_id(self, column_id):
+        board = self._boards.get(self._column_boards.get(column_id))
+        return board.get('projectId') if board else None
+
+    def has_column(self, column_id):
+        return column_id in self._column_boards
+
+    def default_column_id(self, project_id):
+        for board_id in self._boards_by_project.get(project_id, []):
+            columns = self._columns_by_board.get(board_id)
+            if columns:
+                return columns[0].get('id')
+        return None
+
+    def invalidate(self):
+        self._loaded_at = None
+        self._shared_stale = True
@@ -1,37 +1,208 @@
+import asyncio
+import html
 import json
+import logging
+import random
+import time
 import aiohttp
+from collections import OrderedDict, namedtuple
+from contextlib import aclosing
+from email.utils import parsedate_to_datetime
 from typing import Optional, Dict
+from uuid import uuid4
+from aiohttp.payload import AsyncIterablePayload
 from django.conf import settings
 
+from app.internal.services import metrics
+from app.internal.services.http_client import HttpClient
+from app.internal.services.rate_limiter import TokenBucket
+from app.internal.services.yougile_directory import YougileUserDirectory
+from app.internal.services.yougile_projects import YougileProjectTree
+
+logger = logging.getLogger(__name__)
+
+YougileResponse = namedtuple('YougileResponse', 'status data headers text')
+
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+TRANSIENT_CLIENT_STATUSES = (408, 429)
+
+
+def task_url(task_id):
+    return f"https://yougile.com/app/task/{task_id}"
+
+
+def file_url(path):
+    return f"https://yougile.com{path}" if path.startswith('/') else path
+
+
+class YougileApiError(Exception):
+    def __init__(self, path, status, text=''):
+        super().__init__(f"YouGile {path} returned HTTP {status}: {text[:200]}")
+        self.path = path
+        self.status = status
+
+
+class YougileTaskRejected(Exception):
+    def __init__(self, reason, status=None):
+        super().__init__(reason)
+        self.status = status
+
 
 class YougileService:
-    BASE_URL = "https://yougile.com/api-v2"
+    _instance = None
+    _rate_limiter = None
+
     def __init__(self):
+        self.base_url = settings.YOUGILE_BASE_URL
         self.api_key = settings.YOUGILE_API_KEY
         self.project_id = settings.YOUGILE_PROJECT_ID
         self.default_column_id = settings.YOUGILE_COLUMN_ID
 
         if not self.api_key:
             raise ValueError("YOUGILE_API_KEY not configured")
-        if not self.project_id:
-            raise ValueError("YOUGILE_PROJECT_ID not configured")
+
+        self.page_size = settings.YOUGILE_PAGE_SIZE
+        self.user_directory = YougileUserDirectory(self)
+        self.project_tree = YougileProjectTree(self)
+        self._created_tasks = OrderedDict()
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def get_rate_limiter(cls):
+        if cls._rate_limiter is None:
+            cls._rate_limiter = TokenBucket(settings.YOUGILE_RATE_LIMIT_PER_MINUTE / 60, settings.YOUGILE_RATE_LIMIT_BURST)
+        return cls._rate_limiter
 
     @property
     def _headers(self):
         return {"Content-Type": "application/json", "Authorization": f"Bearer {self.api_key}"}
 
-    async def create_task(self, title, description = None, column_id = None, executor_id = None):
-        url = f"{self.BASE_URL}/tasks"
+    @staticmethod
+    def _retry_after(headers):
+        value = headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
 
-        final_column_id = column_id or self.default_column_id
-        if not final_column_id:
-            columns = await self.get_project_columns()
-            if columns:
-                final_column_id = columns[0].get('id')
+    @staticmethod
+    def _backoff(attempt):
+        delay = min(settings.YOUGILE_RETRY_MAX_DELAY, settings.YOUGILE_RETRY_BASE_DELAY * 2 ** attempt)
+        return random.uniform(0, delay)
 
-        if not final_column_id:
-            print("Нет column_id")
+    async def _request(self, method, path, params=None, json_data=None, headers=None, idempotent=True, recover=None,
+                       route=None):
+        url = f"{self.base_url}{path}"
+        route = route or path
+        request_headers = self._headers
+        if headers:
+            request_headers.update(headers)
+        timeout = aiohttp.ClientTimeout(total=settings.YOUGILE_REQUEST_TIMEOUT)
+        rate_limiter = self.get_rate_limiter()
+        session = HttpClient.get_session()
+        unrecoverable = not idempotent and recover is None
+
+        attempt = 0
+        while True:
+            await rate_limiter.acquire()
+            ambiguous = False
+            try:
+                with metrics.yougile_request_duration_seconds.time(method=method, path=route):
+                    async with session.request(
+                        method, url, params=params, json=json_data, headers=request_headers, timeout=timeout
+                    ) as resp:
+                        text = await resp.text()
+                        response = YougileResponse(resp.status, None, resp.headers, text)
+            except aiohttp.ClientConnectorError as e:
+                metrics.yougile_requests_total.inc(method=method, path=route, status="connect_error")
+                logger.warning("YouGile %s %s: connection failed (attempt %s): %s", method, path, attempt + 1, e)
+                if attempt >= settings.YOUGILE_MAX_RETRIES:
+                    raise
+                delay = self._backoff(attempt)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                metrics.yougile_requests_total.inc(method=method, path=route, status="error")
+                logger.warning("YouGile %s %s: request failed (attempt %s): %r", method, path, attempt + 1, e)
+                if attempt >= settings.YOUGILE_MAX_RETRIES or unrecoverable:
+                    raise
+                ambiguous = True
+                delay = self._backoff(attempt)
+            else:
+                metrics.yougile_requests_total.inc(method=method, path=route, status=response.status)
+                if (
+                    response.status not in RETRYABLE_STATUSES or attempt >= settings.YOUGILE_MAX_RETRIES
+                    or (unrecoverable and response.status != 429)
+                ):
+                    try:
+                        data = json.loads(text) if text else None
+                    except ValueError:
+                        data = None
+                    return response._replace(data=data)
+                retry_after = self._retry_after(response.headers)
+                if response.status == 429 and retry_after is not None:
+                    rate_limiter.pause(retry_after)
+                delay = retry_after if retry_after is not None else self._backoff(attempt)
+                logger.warning(
+                    "YouGile %s %s: HTTP %s (attempt %s), retrying in %.2fs",
+                    method, path, response.status, attempt + 1, delay,
+                )
+                ambiguous = response.status != 429
+
+            attempt += 1
+            await asyncio.sleep(delay)
+            if ambiguous and not idempotent and recover is not None:
+                recovered = await recover()
+                if recovered is not None:
+                    return YougileResponse(200, recovered, {}, '')
+
+    async def _find_created_task(self, title, column_id, created_after_ms):
+        params = {"title": title, "columnId": column_id, "limit": 50}
+        response = await self._request('GET', '/task-list', params=params)
+        if response.status != 200 or not response.data:
+            return None
+        for task in response.data.get('content', []):
+            if task.get('title') == title and task.get('timestamp', 0) >= created_after_ms:
+                return task
+        return None
+
+    def _remember_task(self, idempotency_key, task):
+        self._created_tasks[idempotency_key] = task
+        while len(self._created_tasks) > settings.YOUGILE_IDEMPOTENCY_CACHE_SIZE:
+            self._created_tasks.popitem(last=False)
+        return task
+
+    async def resolve_column_id(self, column_id=None, project_id=None):
+        if column_id:
+            return column_id
+        project_id = project_id or self.project_id
+        if not project_id or project_id == self.project_id:
+            if self.default_column_id:
+                return self.default_column_id
+        if not project_id or not await self.project_tree.ensure_loaded():
             return None
+        return self.project_tree.default_column_id(project_id)
+
+    async def create_task(self, title, description = None, column_id = None, executor_id = None, idempotency_key = None,
+                          project_id=None):
+        idempotency_key = idempotency_key or uuid4().hex
+        if idempotency_key in self._created_tasks:
+            return self._created_tasks[idempotency_key]
+
+        final_column_id = await self.resolve_column_id(column_id, project_id)
+        if not final_column_id:
+            logger.error("Cannot create task: no column_id configured for project %s", project_id or self.project_id)
+            metrics.yougile_task_failures_total.inc()
+            raise YougileTaskRejected(f"no column configured for project {project_id or self.project_id}")
 
         payload = {"title": title, "columnId": final_column_id}
 
@@ -40,48 +211,213 @@ class YougileService:
         if executor_id:
             payload["assigned"] = [executor_id]
 
-        print(f"1. URL: {url}")
-        print(f"2. Headers: {{")
-        print(f"   'Content-Type': 'application/json',")
-        print(f"   'Authorization': 'Bearer {self.api_key[:10]}...'")
-        print(f"}}")
-        print(f"3. Payload: {json.dumps(payload, indent=2, ensure_ascii=False)}")
-
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=self._headers, json=payload) as resp:
-                response_text = await resp.text()
-                print(f"Статус: {resp.status}")
-                print(f"Заголовки: {dict(resp.headers)}")
-                print(f"Тело: {response_text}")
-                if resp.status in (200, 201):
-                    try:
-                        data = json.loads(response_text)
-                        return {'id': data.get('id'), 'title': title, 'url': f"https://yougile.com/app/task/{data.get('id')}"}
-                    except:
-                        return None
-                else:
-                    print(f"Ошибка {resp.status}: {response_text}")
+        logger.debug("Creating task in column %s (executor: %s, key: %s)", final_column_id, executor_id, idempotency_key)
+        created_after_ms = int(time.time() * 1000) - settings.YOUGILE_CLOCK_SKEW_MS
+
+        async def recover():
+            return await self._find_created_task(title, final_column_id, created_after_ms)
+
+        try:
+            response = await self._request(
+                'POST', '/tasks', json_data=payload, headers={"Idempotency-Key": idempotency_key},
+                idempotent=False, recover=recover,
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            metrics.yougile_task_failures_total.inc()
+            raise
+
+        if response.status in (200, 201) and response.data:
+            task_id = response.data.get('id')
+            metrics.yougile_tasks_created_total.inc()
+            logger.info("Created YouGile task %s", task_id)
+            return self._remember_task(idempotency_key, {
+                'id': task_id,
+                'title': title,
+                'column_id': final_column_id,
+                'url': task_url(task_id),
+            })
+        metrics.yougile_task_failures_total.inc()
+        logger.warning("YouGile rejected task: HTTP %s: %.500s", response.status, response.text)
+        if 400 <= response.status < 500 and response.status not in TRANSIENT_CLIENT_STATUSES:
+            raise YougileTaskRejected(f"HTTP {response.status}: {response.text[:200]}", response.status)
+        return None
+
+    async def create_tasks(self, tasks):
+        semaphore = asyncio.Semaphore(settings.YOUGILE_BATCH_CONCURRENCY)
+
+        async def create(task):
+            async with semaphore:
+                try:
+                    return await self.create_task(**task)
+                except (YougileTaskRejected, aiohttp.ClientError, asyncio.TimeoutError):
                     return None
 
-    async def get_project_columns(self):
-        url = f"{self.BASE_URL}/columns"
+        return await asyncio.gather(*(create(task) for task in tasks))
+
+    async def get_project_columns(self, project_id=None):
+        if not await self.project_tree.ensure_loaded():
+            return []
+        return self.project_tree.project_columns(project_id or self.project_id)
+
+    async def _fetch_page(self, path, params, offset, headers=None):
+        params = dict(params, limit=self.page_size, offset=offset)
+        response = await self._request('GET', path, params=params, headers=headers)
+        if response.status != 200 or response.data is None:
+            raise YougileApiError(path, response.status, response.text)
+        return response
+
+    def _next_offset(self, response, offset):
+        content = response.data.get('content', [])
+        paging = response.data.get('paging')
+        has_next = paging.get('next') if paging else len(content) >= self.page_size
+        if content and has_next:
+            return offset + len(content)
+        return None
+
+    async def iter_pages(self, path, params=None, first_response=None, prefetch=True):
+        params = params or {}
+        offset = 0
+        response = first_response
+        pending = None
+        if response is None:
+            pending = asyncio.ensure_future(self._fetch_page(path, params, offset))
+        try:
+            while True:
+                if pending is not None:
+                    response = await pending
+                    pending = None
+                next_offset = self._next_offset(response, offset)
+                if next_offset is not None and prefetch:
+                    pending = asyncio.ensure_future(self._fetch_page(path, params, next_offset))
+                yield response.data.get('content', [])
+                if next_offset is None:
+                    return
+                if pending is None:
+                    pending = asyncio.ensure_future(self._fetch_page(path, params, next_offset))
+                offset = next_offset
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+
+    async def iter_users(self, prefetch=True):
+        async with aclosing(self.iter_pages('/users', prefetch=prefetch)) as pages:
+            async for page in pages:
+                for user in page:
+                    yield user
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=self._headers) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    all_columns = data.get('content', [])
-                    project_columns = [col for col in all_columns if col.get('projectId') == self.project_id]
-                    return project_columns
-                return []
+    async def iter_projects(self, prefetch=True):
+        async with aclosing(self.iter_pages('/projects', prefetch=prefetch)) as pages:
+            async for page in pages:
+                for project in page:
+                    yield project
+
+    async def iter_boards(self, project_id=None, prefetch=True):
+        params = {'projectId': project_id} if project_id else None
+        async with aclosing(self.iter_pages('/boards', params, prefetch=prefetch)) as pages:
+            async for page in pages:
+                for board in page:
+                    yield board
+
+    async def iter_columns(self, project_id=None, board_id=None, prefetch=True):
+        if project_id and not board_id:
+            board_ids = [board['id'] async for board in self.iter_boards(project_id)]
+        else:
+            board_ids = [board_id]
+        for current_board_id in board_ids:
+            params = {'boardId': current_board_id} if current_board_id else None
+            async with aclosing(self.iter_pages('/columns', params, prefetch=prefetch)) as pages:
+                async for page in pages:
+                    for column in page:
+                        yield column
+
+    async def iter_tasks(self, column_id=None, prefetch=True):
+        params = {'columnId': column_id} if column_id else None
+        async with aclosing(self.iter_pages('/task-list', params, prefetch=prefetch)) as pages:
+            async for page in pages:
+                for task in page:
+                    yield task
+
+    async def get_task(self, task_id):
+        response = await self._request('GET', f'/tasks/{task_id}', route='/tasks/{id}')
+        if response.status == 404:
+            return None
+        if response.status != 200 or response.data is None:
+            raise YougileApiError(f'/tasks/{task_id}', response.status, response.text)
+        return response.data
+
+    async def upload_file(self, file_name, mime_type, chunks):
+        writer = aiohttp.MultipartWriter('form-data')
+        part = writer.append_payload(
+            AsyncIterablePayload(chunks, content_type=mime_type or 'application/octet-stream')
+        )
+        part.set_content_disposition('form-data', name='file', filename=file_name)
+        timeout = aiohttp.ClientTimeout(total=settings.ATTACHMENT_TIMEOUT)
+        headers = {"Authorization": f"Bearer {self.api_key}"}
+
+        await self.get_rate_limiter().acquire()
+        try:
+            with metrics.yougile_request_duration_seconds.time(method='POST', path='/upload-file'):
+                async with HttpClient.get_session().post(
+                    f"{self.base_url}/upload-file", data=writer, headers=headers, timeout=timeout
+                ) as resp:
+                    status, text = resp.status, await resp.text()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            metrics.yougile_requests_total.inc(method='POST', path='/upload-file', status="error")
+            raise
+        metrics.yougile_requests_total.inc(method='POST', path='/upload-file', status=status)
+        try:
+            data = json.loads(text) if text else None
+        except ValueError:
+            data = None
+        if status not in (200, 201) or not data or not data.get('url'):
+            raise YougileApiError('/upload-file', status, text)
+        return file_url(data['url'])
+
+    async def post_files(self, task_id, files):
+        lines = ["Вложения из Telegram:"] + [f"{name}: {url}" for name, url in files]
+        links = "<br>".join(f'<a href="{url}">{html.escape(name)}</a>' for name, url in files)
+        payload = {"text": "\n".join(lines), "textHtml": f"Вложения из Telegram:<br>{links}", "label": ""}
+        response = await self._request(
+            'POST', f'/chats/{task_id}/messages', json_data=payload, idempotent=False, route='/chats/{id}/messages'
+        )
+        if response.status not in (200, 201):
+            raise YougileApiError(f'/chats/{task_id}/messages', response.status, response.text)
+
+    async def subscribe_webhook(self, url, event='task-*'):
+        response = await self._request('GET', '/webhooks')
+        if response.status == 200 and isinstance(response.data, list):
+            for webhook in response.data:
+                if webhook.get('url') == url and webhook.get('event') == event and not webhook.get('deleted'):
+                    return webhook.get('id'), False
+        response = await self._request('POST', '/webhooks', json_data={'url': url, 'event': event}, idempotent=False)
+        if response.status not in (200, 201) or not response.data:
+            raise YougileApiError('/webhooks', response.status, response.text)
+        return response.data.get('id'), True
+
+    async def fetch_users(self, etag=None, last_modified=None):
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        response = await self._request('GET', '/users', params={"limit": self.page_size, "offset": 0}, headers=headers)
+        if response.status == 304:
+            return {'not_modified': True, 'users': [], 'etag': etag, 'last_modified': last_modified}
+        if response.status != 200 or response.data is None:
+            return None
+        try:
+            async with aclosing(self.iter_pages('/users', first_response=response)) as pages:
+                users = [user async for page in pages for user in page]
+        except YougileApiError as e:
+            logger.warning("Failed to load YouGile users: %s", e)
+            return None
+        return {
+            'not_modified': False,
+            'users': users,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+        }
 
     async def find_user_by_email(self, email):
-        url = f"{self.BASE_URL}/users"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=self._headers) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    for user in data.get('content', []):
-                        if user.get('email') == email:
-                            return user.get('id')
-                return None
\ No newline at end of file
+        return await self.user_directory.find_id_by_email(email)
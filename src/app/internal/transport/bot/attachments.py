@@ -0,0 +1,80 @@
+import asyncio
+import logging
+
+import aiohttp
+from django.conf import settings
+from telegram.error import TelegramError
+
+from app.internal.services import metrics
+from app.internal.services.http_client import HttpClient
+from app.internal.services.yougile_service import YougileApiError, YougileService
+
+logger = logging.getLogger(__name__)
+
+
+def message_attachments(message):
+    attachments = []
+    for source in (message, message.reply_to_message):
+        if source is None:
+            continue
+        if source.photo:
+            photo = source.photo[-1]
+            attachments.append({
+                'file_id': photo.file_id,
+                'file_name': f"photo_{source.message_id}.jpg",
+                'mime_type': 'image/jpeg',
+                'file_size': photo.file_size,
+            })
+        if source.document:
+            document = source.document
+            attachments.append({
+                'file_id': document.file_id,
+                'file_name': document.file_name or f"document_{source.message_id}",
+                'mime_type': document.mime_type,
+                'file_size': document.file_size,
+            })
+    return attachments
+
+
+async def stream_attachment(bot, attachment):
+    telegram_file = await bot.get_file(attachment['file_id'])
+    timeout = aiohttp.ClientTimeout(total=settings.ATTACHMENT_TIMEOUT)
+    async with HttpClient.get_session().get(telegram_file.file_path, timeout=timeout) as response:
+        response.raise_for_status()
+        return await YougileService.get_instance().upload_file(
+            attachment['file_name'],
+            attachment.get('mime_type'),
+            response.content.iter_chunked(settings.ATTACHMENT_CHUNK_SIZE),
+        )
+
+
+async def forward_attachments(bot, task_id, attachments):
+    semaphore = asyncio.Semaphore(settings.ATTACHMENT_CONCURRENCY)
+
+    def failed(attachment, reason):
+        metrics.yougile_attachments_total.inc(status="error")
+        logger.warning("Could not attach %s to task %s: %s", attachment['file_name'], task_id, reason)
+        return None
+
+    async def forward(attachment):
+        async with semaphore:
+            try:
+                url = await stream_attachment(bot, attachment)
+            except aiohttp.ClientResponseError as e:
+                return failed(attachment, f"HTTP {e.status}")
+            except aiohttp.ClientError as e:
+                return failed(attachment, type(e).__name__)
+            except (TelegramError, YougileApiError, asyncio.TimeoutError) as e:
+                return failed(attachment, repr(e))
+            metrics.yougile_attachments_total.inc(status="uploaded")
+            return attachment['file_name'], url
+
+    uploaded = [result for result in await asyncio.gather(*(forward(a) for a in attachments)) if result]
+    if not uploaded:
+        return 0
+    try:
+        await YougileService.get_instance().post_files(task_id, uploaded)
+    except (YougileApiError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.warning("Could not link %d attachments to task %s: %r", len(uploaded), task_id, e)
+        return 0
+    return len(uploaded)
@@ -0,0 +1,74 @@
+from telegram import MessageEntity, Update
+from telegram.ext import CallbackQueryHandler, CommandHandler, InlineQueryHandler, MessageHandler, filters
+
+from app.internal.services import metrics
+from app.internal.transport.bot.parser import mentions_bot
+
+HANDLER_UPDATE_TYPES = {
+    CommandHandler: (Update.MESSAGE,),
+    MessageHandler: (Update.MESSAGE,),
+    CallbackQueryHandler: (Update.CALLBACK_QUERY,),
+    InlineQueryHandler: (Update.INLINE_QUERY,),
+}
+
+
+class BotMention(filters.MessageFilter):
+    __slots__ = ()
+
+    def filter(self, message):
+        bot_mention = f"@{message.get_bot().username}".lower()
+        if message.text is not None:
+            text, entities, parse_entity = message.text, message.entities, message.parse_entity
+        else:
+            text, entities, parse_entity = message.caption, message.caption_entities, message.parse_caption_entity
+        for entity in entities or ():
+            if entity.type == MessageEntity.MENTION and parse_entity(entity).lower() == bot_mention:
+                return True
+        if not entities and mentions_bot(text, message.get_bot().username):
+            return True
+        metrics.bot_updates_dropped_total.inc(reason="no_mention")
+        return False
+
+
+BOT_MENTION = BotMention(name="filters.BotMention")
+
+
+def allowed_updates(handlers):
+    update_types = []
+    for handler in handlers:
+        for handler_type, types in HANDLER_UPDATE_TYPES.items():
+            if isinstance(handler, handler_type):
+                update_types.extend(t for t in types if t not in update_types)
+                break
+        else:
+            raise ValueError(f"Не удалось определить тип обновлений для {type(handler).__name__}")
+    return update_types
+
+
+class RawUpdateFilter:
+    def __init__(self, update_types, bot_username=None):
+        self.update_types = set(update_types)
+        self.bot_username = bot_username
+
+    def drop_reason(self, data):
+        update_type = next((key for key in data if key != "update_id"), None)
+        if update_type not in self.update_types:
+            return "update_type"
+        if update_type != Update.MESSAGE:
+            return None
+        message = data[update_type]
+        text = message.get("text", message.get("caption"))
+        if text is None:
+            return "no_text"
+        if text.startswith("/") or not self.bot_username:
+            return None
+        if not mentions_bot(text, self.bot_username):
+            return "no_mention"
+        return None
+
+    def accept(self, data):
+        reason = self.drop_reason(data)
+        if reason is None:
+            return True
+        metrics.bot_updates_dropped_total.inc(reason=reason)
+        return False
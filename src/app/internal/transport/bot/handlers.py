@@ -1,9 +1,38 @@
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
-from telegram.ext import ContextTypes, CommandHandler, MessageHandler, filters
-import re
-
+from telegram import InlineQueryResultArticle, InputTextMessageContent
+from telegram.ext import CallbackQueryHandler, CommandHandler, InlineQueryHandler, MessageHandler, filters
+import functools
+import logging
+from django.conf import settings
+
+from app.internal.services import metrics
+from app.internal.services.employee_service import EmployeeService
+from app.internal.services.outbox_service import OutboxService
+from app.internal.services.task_service import TaskService
 from app.internal.services.user_service import UserService
-from app.internal.services.yougile_service import YougileService
+from app.internal.services.yougile_service import YougileService, task_url
+from app.internal.transport.bot.attachments import message_attachments
+from app.internal.transport.bot.filters import BOT_MENTION
+from app.internal.transport.bot.keyboards import boards_keyboard, columns_keyboard, projects_keyboard, tasks_keyboard
+from app.internal.transport.bot.outbox_worker import OutboxWorker
+from app.internal.transport.bot.parser import is_email, mentions_bot, parse_tasks
+
+logger = logging.getLogger(__name__)
+
+
+def instrumented(handler):
+    name = handler.__name__
+
+    @functools.wraps(handler)
+    async def wrapper(update, context):
+        with metrics.bot_handler_duration_seconds.time(handler=name):
+            try:
+                return await handler(update, context)
+            except Exception:
+                metrics.bot_handler_errors_total.inc(handler=name)
+                logger.exception("Unhandled error in handler %s", name)
+                raise
+
+    return wrapper
 
 
 class BotHandlers:
@@ -22,11 +51,14 @@ class BotHandlers:
             f"/link_yougile - Привязать аккаунт YouGile\n"
             f"/link_username - Привязать Telegram username (чтобы вас могли назначать)\n"
             f"/set_default_column - Выбрать колонку по умолчанию\n"
-            f"/me - Информация о вашем аккаунте\n\n"
+            f"/me - Информация о вашем аккаунте\n"
+            f"/my_tasks - Задачи, которые вы создали\n"
+            f"/assigned - Задачи, назначенные на вас\n\n"
             f"Просто упомяни меня в сообщении, чтобы создать задачу:\n"
             f"@bot Название задачи - описание\n\n"
-            f"Чтобы назначить исполнителя, добавьте @username в конце:\n"
-            f"@bot Название задачи - описание @исполнитель"
+            f"Чтобы назначить исполнителя, добавьте @username или email сотрудника в YouGile в конце:\n"
+            f"@bot Название задачи - описание @исполнитель\n"
+            f"@bot Название задачи - описание ivanov@company.ru"
         )
         await update.message.reply_text(welcome_message)
 
@@ -40,12 +72,12 @@ class BotHandlers:
             )
             return
         email = context.args[0]
-        await update.message.reply_text("Проверяю email в YouGile...")
+        status = await update.message.reply_text("Проверяю email в YouGile...")
         try:
-            yougile = YougileService()
-            user_id = await yougile.find_user_by_email(email)
+            yougile = YougileService.get_instance()
+            user_id = await EmployeeService.get_yougile_id_by_email(email) or await yougile.find_user_by_email(email)
             if not user_id:
-                await update.message.reply_text(
+                await status.edit_text(
                     f"Пользователь с email {email} не найден в вашей компании YouGile\n"
                     f"Убедитесь, что:\n"
                     f"1. Вы используете корпоративный email\n"
@@ -58,7 +90,7 @@ class BotHandlers:
             if update.effective_user.username:
                 await UserService.set_telegram_username(telegram_id, update.effective_user.username)
 
-            await update.message.reply_text(
+            await status.edit_text(
                 f"Аккаунт YouGile успешно привязан!\n\n"
                 f"Email: {email}\n"
                 f"YouGile ID: {user_id[:8]}...\n\n"
@@ -69,12 +101,14 @@ class BotHandlers:
             )
 
         except ValueError as e:
-            await update.message.reply_text(
+            logger.error("YouGile configuration error: %s", e)
+            await status.edit_text(
                 f"Ошибка конфигурации YouGile\n"
                 f"Сообщите администратору: {str(e)}"
             )
         except Exception as e:
-            await update.message.reply_text(
+            logger.exception("YouGile request failed")
+            await status.edit_text(
                 f"Не удалось подключиться к YouGile\n"
                 f"Попробуйте позже или сообщите администратору"
             )
@@ -139,24 +173,17 @@ class BotHandlers:
     @staticmethod
     async def handle_mention(update, context):
         bot_username = context.bot.username
-        message_text = update.message.text
-        message_entities = update.message.entities or []
-        bot_mentioned = False
-        for entity in message_entities:
-            if entity.type == "mention":
-                mention = message_text[entity.offset:entity.offset + entity.length]
-                if mention.lower() == f"@{bot_username}".lower():
-                    bot_mentioned = True
-                    task_text = message_text[:entity.offset] + message_text[entity.offset + entity.length:]
-                    task_text = task_text.strip()
-                    break
-
-        if not bot_mentioned:
-            if f"@{bot_username}" not in message_text:
-                return
-            task_text = message_text.replace(f"@{bot_username}", "").strip()
+        message = update.message
+        message_text = message.text or message.caption
+        if not mentions_bot(message_text, bot_username):
+            return
+
+        entities = message.entities if message.text else message.caption_entities
+        parsed_tasks = parse_tasks(message_text, entities, bot_username)
+        if parsed_tasks is None:
+            return
 
-        if not task_text:
+        if not parsed_tasks:
             await update.message.reply_text(
                 "Вы не указали название задачи\n"
                 "Пример: @bot Исправить баг с авторизацией - срочно"
@@ -180,65 +207,195 @@ class BotHandlers:
         if not db_user.telegram_username and update.effective_user.username:
             await UserService.set_telegram_username(telegram_id, update.effective_user.username)
 
-        await update.message.reply_text("🔄 Создаю задачу в YouGile...")
+        if len(parsed_tasks) > 1:
+            await BotHandlers._create_task_batch(update, db_user, parsed_tasks)
+            return
 
-        executor_username = None
-        executor_id = None
-        all_mentions = re.findall(r'@(\w+)', task_text)
+        title, description, executor_username = parsed_tasks[0]
+        try:
+            YougileService.get_instance()
+        except ValueError as e:
+            logger.error("YouGile configuration error: %s", e)
+            await update.message.reply_text(
+                f"Ошибка конфигурации YouGile\n"
+                f"Сообщите администратору"
+            )
+            return
 
-        if all_mentions:
-            executor_username = all_mentions[-1]
-            task_text = task_text.replace(f"@{executor_username}", "").strip()
+        executor_id = None
+        status_lines = ["🔄 Создаю задачу в YouGile..."]
+        if executor_username and is_email(executor_username):
+            executor_id = await EmployeeService.get_yougile_id_by_email(executor_username)
+            if executor_id:
+                status_lines.append(f"Исполнитель {executor_username} найден в YouGile")
+            else:
+                status_lines.append(
+                    f"Сотрудник с email {executor_username} не найден в YouGile\n"
+                    f"Задача будет создана без исполнителя"
+                )
+        elif executor_username:
             executor_id = await UserService.get_yougile_id_by_telegram_username(executor_username)
-
             if executor_id:
-                await update.message.reply_text(f"Исполнитель @{executor_username} найден в YouGile")
+                status_lines.append(f"Исполнитель @{executor_username} найден в YouGile")
             else:
-                await update.message.reply_text(
+                status_lines.append(
                     f"Пользователь @{executor_username} не привязал YouGile аккаунт\n"
                     f"Задача будет создана без исполнителя"
                 )
-        parts = task_text.split(' - ', 1)
-        title = parts[0]
-        description = parts[1] if len(parts) > 1 else None
-        try:
-            yougile = YougileService()
 
-            task = await yougile.create_task(title=title, description=description, column_id=db_user.default_column_id or None,
-                executor_id=executor_id
-            )
+        attachments = BotHandlers._accepted_attachments(message, status_lines)
+        placeholder = await update.message.reply_text("\n".join(status_lines))
+        await OutboxService.enqueue(
+            telegram_id=telegram_id,
+            chat_id=update.effective_chat.id,
+            reply_message_id=placeholder.message_id,
+            title=title,
+            description=description,
+            project_id=db_user.default_project_id,
+            column_id=db_user.default_column_id,
+            executor_id=executor_id,
+            executor_username=executor_username,
+            attachments=attachments,
+        )
+        OutboxWorker.notify()
 
-            if task:
-                response = (
-                    f"Задача создана!\n\n"
-                    f"{task['title']}\n"
-                    f"Открыть в YouGile({task['url']})\n"
+    @staticmethod
+    def _accepted_attachments(message, status_lines):
+        attachments = []
+        for attachment in message_attachments(message):
+            if (attachment['file_size'] or 0) > settings.ATTACHMENT_MAX_SIZE:
+                status_lines.append(
+                    f"Файл {attachment['file_name']} больше {settings.ATTACHMENT_MAX_SIZE // (1024 * 1024)} МБ "
+                    f"и не будет прикреплён"
                 )
-
-                if description:
-                    response += f"{description}\n"
-
-                if executor_id and executor_username:
-                    response += f"Исполнитель: @{executor_username}\n"
-                elif executor_username:
-                    response += f"Исполнитель: @{executor_username} (не привязан)\n"
-
-                await update.message.reply_text(response, parse_mode='Markdown', disable_web_page_preview=True)
             else:
-                await update.message.reply_text(
-                    "Не удалось создать задачу. Проверьте логи"
-                )
+                attachments.append(attachment)
+        return attachments
 
+    @staticmethod
+    async def _create_task_batch(update, db_user, parsed):
+        if len(parsed) > settings.BOT_MAX_BATCH_TASKS:
+            await update.message.reply_text(
+                f"Слишком много задач в одном сообщении\n"
+                f"Максимум: {settings.BOT_MAX_BATCH_TASKS}"
+            )
+            return
+
+        try:
+            YougileService.get_instance()
         except ValueError as e:
+            logger.error("YouGile configuration error: %s", e)
             await update.message.reply_text(
                 f"Ошибка конфигурации YouGile\n"
                 f"Сообщите администратору"
             )
-        except Exception as e:
-            await update.message.reply_text(
-                f"Ошибка при создании задачи\n"
-                f"Попробуйте позже"
+            return
+
+        executors = {executor for _, _, executor in parsed if executor}
+        emails = {executor for executor in executors if is_email(executor)}
+        executor_ids = await UserService.get_yougile_ids_by_telegram_usernames(executors - emails)
+        if emails:
+            executor_ids.update(await EmployeeService.get_yougile_ids_by_emails(emails))
+
+        tasks = []
+        for title, description, executor in parsed:
+            tasks.append({
+                'title': title,
+                'description': description,
+                'executor_id': executor_ids.get(executor.lower()) if executor else None,
+                'executor_username': executor,
+            })
+
+        status_lines = [f"🔄 Создаю задачи в YouGile: {len(tasks)}"]
+        attachments = BotHandlers._accepted_attachments(update.message, status_lines)
+        if attachments:
+            tasks[0]['attachments'] = attachments
+            status_lines.append(f"Файлы будут прикреплены к первой задаче «{tasks[0]['title']}»")
+
+        placeholder = await update.message.reply_text("\n".join(status_lines))
+        await OutboxService.enqueue_batch(
+            telegram_id=db_user.telegram_id,
+            chat_id=update.effective_chat.id,
+            reply_message_id=placeholder.message_id,
+            tasks=tasks,
+            project_id=db_user.default_project_id,
+            column_id=db_user.default_column_id,
+        )
+        OutboxWorker.notify()
+
+    @staticmethod
+    async def _tasks_page(kind, telegram_id, cursor=None):
+        if kind == 'mine':
+            header = "Задачи, которые вы создали:"
+            records, next_cursor = await TaskService.list_created(telegram_id, cursor)
+        else:
+            db_user = await UserService.get_user_by_id(telegram_id)
+            if not db_user or not db_user.yougile_id:
+                return "Сначала привяжите аккаунт YouGile:\n/link_yougile ваш@email.com", None
+            header = "Задачи, назначенные на вас:"
+            records, next_cursor = await TaskService.list_assigned(db_user.yougile_id, cursor)
+
+        if not records:
+            return ("Задач пока нет" if cursor is None else "Больше задач нет"), None
+        lines = [header, ""]
+        for record in records:
+            mark = "✅" if record.completed else "🗄" if record.archived else "•"
+            lines.append(f"{mark} {record.title} — {task_url(record.yougile_id)}")
+        return "\n".join(lines), tasks_keyboard(kind, next_cursor)
+
+    @staticmethod
+    async def my_tasks(update, context):
+        text, reply_markup = await BotHandlers._tasks_page('mine', update.effective_user.id)
+        await update.message.reply_text(text, reply_markup=reply_markup, disable_web_page_preview=True)
+
+    @staticmethod
+    async def assigned(update, context):
+        text, reply_markup = await BotHandlers._tasks_page('assigned', update.effective_user.id)
+        await update.message.reply_text(text, reply_markup=reply_markup, disable_web_page_preview=True)
+
+    @staticmethod
+    async def tasks_callback(update, context):
+        query = update.callback_query
+        await query.answer()
+        _, kind, cursor = query.data.split(':', 2)
+        text, reply_markup = await BotHandlers._tasks_page(kind, query.from_user.id, cursor)
+        await query.edit_message_text(text, reply_markup=reply_markup, disable_web_page_preview=True)
+
+    @staticmethod
+    async def inline_search(update, context):
+        inline_query = update.inline_query
+        db_user = await UserService.get_user_by_id(inline_query.from_user.id)
+        if not db_user or not db_user.yougile_email:
+            await inline_query.answer([], cache_time=0, is_personal=True)
+            return
+
+        before = int(inline_query.offset) if inline_query.offset.isdigit() else None
+        records = await TaskService.search(inline_query.query, db_user.telegram_id, db_user.yougile_id, before)
+        results = [
+            InlineQueryResultArticle(
+                id=record.yougile_id,
+                title=record.title,
+                description=(record.description or '')[:100] or None,
+                url=task_url(record.yougile_id),
+                input_message_content=InputTextMessageContent(
+                    f"{record.title}\n{task_url(record.yougile_id)}", disable_web_page_preview=True
+                ),
             )
+            for record in records
+        ]
+        next_offset = str(records[-1].id) if len(records) >= settings.BOT_INLINE_RESULTS else ''
+        await inline_query.answer(
+            results, cache_time=settings.BOT_INLINE_CACHE_TIME, is_personal=True, next_offset=next_offset
+        )
+
+    @staticmethod
+    async def _project_keyboard(tree, project_id):
+        if not tree.boards(project_id):
+            await tree.refresh_project(project_id)
+        boards = tree.boards(project_id)
+        if len(boards) == 1:
+            return columns_keyboard(tree, boards[0]['id'])
+        return boards_keyboard(tree, project_id)
 
     @staticmethod
     async def set_default_column(update, context):
@@ -252,28 +409,25 @@ class BotHandlers:
             )
             return
 
-        await update.message.reply_text("📋 Загружаю список колонок...")
-
         try:
-            yougile = YougileService()
-            columns = await yougile.get_project_columns()
-
-            if not columns:
+            tree = YougileService.get_instance().project_tree
+            if not await tree.ensure_loaded() or not tree.projects():
+                tree.invalidate()
                 await update.message.reply_text(
-                    "Не удалось загрузить колонки\n"
-                    "Убедитесь, что у вас есть доступ к проекту"
+                    "Не удалось загрузить проекты\n"
+                    "Убедитесь, что у вас есть доступ к YouGile"
                 )
                 return
 
-            keyboard = []
-            for col in columns[:10]:
-                title = col.get('title', 'Без названия')
-                col_id = col.get('id')
-                keyboard.append([InlineKeyboardButton(f"", callback_data=f"column_{col_id}")])
-            reply_markup = InlineKeyboardMarkup(keyboard)
-            await update.message.reply_text("Выберите колонку для новых задач:", reply_markup=reply_markup)
+            projects = tree.projects()
+            if len(projects) == 1:
+                text, reply_markup = await BotHandlers._project_keyboard(tree, projects[0]['id'])
+            else:
+                text, reply_markup = projects_keyboard(tree)
+            await update.message.reply_text(text, reply_markup=reply_markup)
 
         except Exception as e:
+            logger.exception("YouGile request failed")
             await update.message.reply_text(
                 "Ошибка при загрузке колонок\n"
                 "Попробуйте позже"
@@ -284,11 +438,19 @@ class BotHandlers:
         query = update.callback_query
         await query.answer()
 
-        if query.data.startswith('column_'):
-            column_id = query.data.replace('column_', '')
-            telegram_id = query.from_user.id
+        action, _, argument = query.data.partition(':')
+        tree = YougileService.get_instance().project_tree
+        if not await tree.ensure_loaded():
+            await query.edit_message_text(
+                "Не удалось загрузить проекты\n"
+                "Попробуйте позже"
+            )
+            return
 
-            success = await UserService.set_default_yougile_column(telegram_id, column_id)
+        if action == 'column':
+            telegram_id = query.from_user.id
+            project_id = tree.column_project_id(argument)
+            success = await UserService.set_default_yougile_column(telegram_id, argument, project_id)
             if success:
                 await query.edit_message_text(
                     "Колонка по умолчанию сохранена!\n"
@@ -299,14 +461,42 @@ class BotHandlers:
                     "Не удалось сохранить колонку\n"
                     "Попробуйте еще раз"
                 )
+            return
+
+        if action == 'projects':
+            text, reply_markup = projects_keyboard(tree, int(argument or 0))
+        elif action == 'project':
+            text, reply_markup = await BotHandlers._project_keyboard(tree, argument)
+        elif action == 'boards':
+            project_id, _, page = argument.rpartition(':')
+            text, reply_markup = boards_keyboard(tree, project_id, int(page))
+        elif action == 'board':
+            text, reply_markup = columns_keyboard(tree, argument)
+        elif action == 'columns':
+            board_id, _, page = argument.rpartition(':')
+            text, reply_markup = columns_keyboard(tree, board_id, int(page))
+        else:
+            return
+        if text != query.message.text or reply_markup != query.message.reply_markup:
+            await query.edit_message_text(text, reply_markup=reply_markup)
 
 
 def get_handlers():
     return [
-        CommandHandler("start", BotHandlers.start),
-        CommandHandler("link_yougile", BotHandlers.link_yougile),
-        CommandHandler("link_username", BotHandlers.link_username),
-        CommandHandler("set_default_column", BotHandlers.set_default_column),
-        CommandHandler("me", BotHandlers.me),
-        MessageHandler(filters.TEXT & ~filters.COMMAND, BotHandlers.handle_mention),
+        CommandHandler("start", instrumented(BotHandlers.start)),
+        CommandHandler("link_yougile", instrumented(BotHandlers.link_yougile)),
+        CommandHandler("link_username", instrumented(BotHandlers.link_username)),
+        CommandHandler("set_default_column", instrumented(BotHandlers.set_default_column)),
+        CommandHandler("me", instrumented(BotHandlers.me)),
+        CommandHandler("my_tasks", instrumented(BotHandlers.my_tasks)),
+        CommandHandler("assigned", instrumented(BotHandlers.assigned)),
+        CallbackQueryHandler(
+            instrumented(BotHandlers.button_callback), pattern=r'^(projects?|boards?|columns?):'
+        ),
+        CallbackQueryHandler(instrumented(BotHandlers.tasks_callback), pattern=r'^tasks:(mine|assigned):'),
+        MessageHandler(
+            (filters.TEXT | filters.CAPTION) & ~filters.COMMAND & BOT_MENTION,
+            instrumented(BotHandlers.handle_mention),
+        ),
+        InlineQueryHandler(instrumented(BotHandlers.inline_search)),
     ]
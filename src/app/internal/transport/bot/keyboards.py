@@ -0,0 +1,71 @@
+from django.conf import settings
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+
+
+def _title(item):
+    return item.get('title') or 'Без названия'
+
+
+def paged_keyboard(items, page, item_callback, page_callback, back_callback=None):
+    page_size = settings.BOT_KEYBOARD_PAGE_SIZE
+    pages = max(1, (len(items) + page_size - 1) // page_size)
+    page = min(max(page, 0), pages - 1)
+
+    rows = [
+        [InlineKeyboardButton(_title(item), callback_data=item_callback(item))]
+        for item in items[page * page_size:(page + 1) * page_size]
+    ]
+    navigation = []
+    if page > 0:
+        navigation.append(InlineKeyboardButton("‹", callback_data=page_callback(page - 1)))
+    if pages > 1:
+        navigation.append(InlineKeyboardButton(f"{page + 1}/{pages}", callback_data=page_callback(page)))
+    if page < pages - 1:
+        navigation.append(InlineKeyboardButton("›", callback_data=page_callback(page + 1)))
+    if navigation:
+        rows.append(navigation)
+    if back_callback:
+        rows.append([InlineKeyboardButton("« Назад", callback_data=back_callback)])
+    return InlineKeyboardMarkup(rows)
+
+
+def projects_keyboard(tree, page=0):
+    return "Выберите проект:", paged_keyboard(
+        tree.projects(), page,
+        item_callback=lambda project: f"project:{project['id']}",
+        page_callback=lambda number: f"projects:{number}",
+    )
+
+
+def boards_keyboard(tree, project_id, page=0):
+    project = tree.get_project(project_id) or {}
+    back = "projects:0" if len(tree.projects()) > 1 else None
+    return f"Проект «{_title(project)}». Выберите доску:", paged_keyboard(
+        tree.boards(project_id), page,
+        item_callback=lambda board: f"board:{board['id']}",
+        page_callback=lambda number: f"boards:{project_id}:{number}",
+        back_callback=back,
+    )
+
+
+def columns_keyboard(tree, board_id, page=0):
+    board = tree.get_board(board_id) or {}
+    project_id = board.get('projectId')
+    if len(tree.boards(project_id)) > 1:
+        back = f"boards:{project_id}:0"
+    elif len(tree.projects()) > 1:
+        back = "projects:0"
+    else:
+        back = None
+    return f"Доска «{_title(board)}». Выберите колонку для новых задач:", paged_keyboard(
+        tree.columns(board_id), page,
+        item_callback=lambda column: f"column:{column['id']}",
+        page_callback=lambda number: f"columns:{board_id}:{number}",
+        back_callback=back,
+    )
+
+
+def tasks_keyboard(kind, cursor):
+    if not cursor:
+        return None
+    return InlineKeyboardMarkup([[InlineKeyboardButton("Ещё ›", callback_data=f"tasks:{kind}:{cursor}")]])
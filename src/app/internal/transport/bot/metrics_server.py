@@ -0,0 +1,26 @@
+from aiohttp import web
+
+from app.internal.services import metrics
+
+
+async def metrics_handler(request):
+    return web.Response(text=metrics.render(), content_type="text/plain")
+
+
+class MetricsServer:
+    def __init__(self, listen, port):
+        self.listen = listen
+        self.port = port
+        self._runner = None
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/metrics", metrics_handler)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.listen, self.port).start()
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
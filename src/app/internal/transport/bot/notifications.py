@@ -0,0 +1,85 @@
+import asyncio
+import logging
+import threading
+import time
+
+from django.conf import settings
+from telegram.error import TelegramError
+from telegram.ext import ExtBot
+
+from app.internal.services import metrics
+from app.internal.transport.bot.rate_limiter import TelegramRateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationQueue:
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self, token, size, workers):
+        self.token = token
+        self.workers = workers
+        self.bot = None
+        self._slots = threading.BoundedSemaphore(size)
+        self._loop = asyncio.new_event_loop()
+        self._queues = []
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="notification-queue", daemon=True)
+
+    @classmethod
+    def get_instance(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls(settings.TELEGRAM_BOT_TOKEN, settings.NOTIFY_QUEUE_SIZE, settings.NOTIFY_WORKERS)
+                cls._instance.start()
+        return cls._instance
+
+    def start(self):
+        self._thread.start()
+        self._ready.wait()
+
+    def offer(self, chat_id, text, received_at=None):
+        if not self._slots.acquire(blocking=False):
+            metrics.bot_notifications_total.inc(status="dropped")
+            logger.warning("Notification queue is full, dropping notification for chat %s", chat_id)
+            return False
+        queue = self._queues[abs(chat_id) % self.workers]
+        item = (chat_id, text, received_at or time.monotonic())
+        self._loop.call_soon_threadsafe(queue.put_nowait, item)
+        return True
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_until_complete(self._serve())
+
+    async def _serve(self):
+        self._queues = [asyncio.Queue() for _ in range(self.workers)]
+        self._ready.set()
+        bot = ExtBot(self.token, base_url=settings.TELEGRAM_API_BASE_URL, rate_limiter=TelegramRateLimiter())
+        while True:
+            try:
+                await bot.initialize()
+                break
+            except TelegramError as e:
+                logger.warning("Notification bot failed to initialize: %s", e)
+                await asyncio.sleep(5)
+        self.bot = bot
+        await asyncio.gather(*(self._drain(queue) for queue in self._queues))
+
+    async def _drain(self, queue):
+        while True:
+            chat_id, text, received_at = await queue.get()
+            try:
+                await self.bot.send_message(chat_id, text, disable_web_page_preview=True)
+            except TelegramError as e:
+                metrics.bot_notifications_total.inc(status="error")
+                logger.warning("Could not notify chat %s: %s", chat_id, e)
+            except Exception:
+                metrics.bot_notifications_total.inc(status="error")
+                logger.exception("Notification for chat %s failed", chat_id)
+            else:
+                metrics.bot_notifications_total.inc(status="sent")
+                metrics.bot_notification_latency_seconds.observe(time.monotonic() - received_at)
+            finally:
+                self._slots.release()
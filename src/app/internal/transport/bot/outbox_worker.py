@@ -0,0 +1,228 @@
+import asyncio
+import logging
+
+import aiohttp
+from django.conf import settings
+from telegram.error import TelegramError
+
+from app.internal.models.task_outbox import TaskOutbox
+from app.internal.services.outbox_service import OutboxService
+from app.internal.services.task_service import TaskService
+from app.internal.services.yougile_service import YougileService, YougileTaskRejected, task_url
+from app.internal.transport.bot.attachments import forward_attachments
+from app.internal.transport.bot.parser import executor_label, is_email
+
+logger = logging.getLogger(__name__)
+
+
+def unresolved_reason(entry):
+    return "не найден в YouGile" if is_email(entry.executor_username) else "не привязан"
+
+
+def render_task_created(entry, task, attached=None):
+    response = (
+        f"Задача создана!\n\n"
+        f"{task['title']}\n"
+        f"Открыть в YouGile: {task['url']}\n"
+    )
+    if entry.description:
+        response += f"{entry.description}\n"
+    if entry.executor_id and entry.executor_username:
+        response += f"Исполнитель: {executor_label(entry.executor_username)}\n"
+    elif entry.executor_username:
+        response += f"Исполнитель: {executor_label(entry.executor_username)} ({unresolved_reason(entry)})\n"
+    if entry.attachments:
+        response += f"Вложения: {attached} из {len(entry.attachments)}\n"
+    return response
+
+
+def render_batch(entries, attached=None):
+    attached = attached or {}
+    created = sum(1 for entry in entries if entry.status == TaskOutbox.STATUS_SENT)
+    lines = [f"Создано задач: {created} из {len(entries)}", ""]
+    for entry in entries:
+        if entry.status == TaskOutbox.STATUS_SENT:
+            line = f"✅ {entry.title} — {task_url(entry.yougile_task_id)}"
+        elif entry.status == TaskOutbox.STATUS_FAILED:
+            line = f"❌ {entry.title} — не удалось создать, сообщите администратору"
+        elif entry.attempts:
+            line = f"⏳ {entry.title} — будет создана, когда YouGile станет доступен"
+        else:
+            line = f"🔄 {entry.title}"
+        if entry.executor_id and entry.executor_username:
+            line += f" (исполнитель: {executor_label(entry.executor_username)})"
+        elif entry.executor_username:
+            line += f" ({executor_label(entry.executor_username)} {unresolved_reason(entry)})"
+        lines.append(line)
+        if entry.attachments and entry.status == TaskOutbox.STATUS_SENT:
+            if entry.id in attached:
+                lines.append(f"    Вложения: {attached[entry.id]} из {len(entry.attachments)}")
+            else:
+                lines.append(f"    Вложения: {len(entry.attachments)}")
+    return "\n".join(lines)
+
+
+def render_rejection(entry, error):
+    if error.status is None:
+        reason = "Не выбрана колонка для задач, настройте её: /set_default_column"
+    elif error.status in (401, 403):
+        reason = f"У бота нет доступа к YouGile (HTTP {error.status}), сообщите администратору"
+    elif error.status == 404:
+        reason = "Колонка не найдена в YouGile, выберите другую: /set_default_column"
+    else:
+        reason = f"YouGile отклонил задачу (HTTP {error.status})"
+    return f"Не удалось создать задачу «{entry.title}»\n{reason}"
+
+
+class OutboxWorker:
+    _active = set()
+
+    def __init__(self, bot, shard=None):
+        self.bot = bot
+        self.shard = shard
+        self._task = None
+        self._wakeup = asyncio.Event()
+        self._attached = {}
+
+    @classmethod
+    def notify(cls):
+        for worker in cls._active:
+            worker._wakeup.set()
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            OutboxWorker._active.add(self)
+
+    async def stop(self):
+        OutboxWorker._active.discard(self)
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                delivered = await self.drain()
+            except Exception:
+                logger.exception("Outbox drain failed")
+                delivered = 0
+            if delivered:
+                continue
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), settings.OUTBOX_POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+
+    async def drain(self):
+        entries = await OutboxService.claim_due(settings.OUTBOX_BATCH_SIZE, self.shard)
+        by_chat = {}
+        for entry in entries:
+            by_chat.setdefault(entry.chat_id, []).append(entry)
+
+        async def deliver_chat(chat_entries):
+            batches = set()
+            for index, entry in enumerate(chat_entries):
+                try:
+                    if await self.deliver(entry):
+                        batches.add(entry.reply_message_id)
+                except Exception as e:
+                    logger.exception("Outbox entry %s failed", entry.id)
+                    await self.postpone(entry, chat_entries[index + 1:], repr(e))
+                    break
+            for reply_message_id in batches:
+                await self.acknowledge_batch(chat_entries[0].chat_id, reply_message_id)
+
+        await asyncio.gather(
+            *(deliver_chat(chat_entries) for chat_entries in by_chat.values()), return_exceptions=True
+        )
+        return len(entries)
+
+    async def postpone(self, entry, later_entries, error):
+        try:
+            await OutboxService.mark_retry(entry, error)
+            if later_entries:
+                await OutboxService.release([later.id for later in later_entries], behind=entry.id)
+        except Exception:
+            logger.exception("Could not reschedule outbox entry %s, its chat waits for the lease to expire", entry.id)
+
+    async def deliver(self, entry):
+        yougile = YougileService.get_instance()
+        error = None
+        try:
+            task = await yougile.create_task(
+                title=entry.title,
+                description=entry.description,
+                column_id=entry.column_id,
+                executor_id=entry.executor_id,
+                idempotency_key=f"outbox-{entry.id}",
+                project_id=entry.project_id,
+            )
+        except YougileTaskRejected as e:
+            await OutboxService.mark_failed(entry, str(e))
+            logger.warning("Outbox entry %s rejected by YouGile: %s", entry.id, e)
+            if entry.batched:
+                return True
+            await self.acknowledge(entry, render_rejection(entry, e))
+            return
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            task = None
+            error = repr(e)
+
+        if task:
+            await OutboxService.mark_sent(entry.id, task['id'])
+            try:
+                await TaskService.save([TaskService.build(
+                    task, entry.telegram_id, entry.chat_id, entry.description, entry.executor_id,
+                    entry.executor_username,
+                )])
+            except Exception:
+                logger.exception("Could not record task %s created from outbox entry %s", task['id'], entry.id)
+            attached = None
+            if entry.attachments:
+                attached = await forward_attachments(self.bot, task['id'], entry.attachments)
+            if entry.batched:
+                if entry.attachments:
+                    self._attached[entry.id] = attached
+                return True
+            await self.acknowledge(entry, render_task_created(entry, task, attached))
+            return
+
+        error = error or "YouGile is unavailable"
+        status = await OutboxService.mark_retry(entry, error)
+        logger.warning("Outbox entry %s not delivered (attempt %s): %s", entry.id, entry.attempts + 1, error)
+        if entry.batched:
+            return status == TaskOutbox.STATUS_FAILED or entry.attempts == 0
+        if status == TaskOutbox.STATUS_FAILED:
+            await self.acknowledge(entry, f"Не удалось создать задачу «{entry.title}»\nСообщите администратору")
+        elif entry.attempts == 0:
+            await self.acknowledge(
+                entry,
+                f"YouGile сейчас недоступен\n"
+                f"Задача «{entry.title}» сохранена и будет создана автоматически",
+            )
+
+    async def acknowledge_batch(self, chat_id, reply_message_id):
+        try:
+            entries = await OutboxService.get_batch(chat_id, reply_message_id)
+        except Exception:
+            logger.exception("Could not load outbox batch %s in chat %s", reply_message_id, chat_id)
+            return
+        attached = {entry.id: self._attached.pop(entry.id) for entry in entries if entry.id in self._attached}
+        await self.acknowledge(entries[0], render_batch(entries, attached))
+
+    async def acknowledge(self, entry, text):
+        try:
+            if entry.reply_message_id:
+                await self.bot.edit_message_text(
+                    text, chat_id=entry.chat_id, message_id=entry.reply_message_id, disable_web_page_preview=True
+                )
+            else:
+                await self.bot.send_message(entry.chat_id, text, disable_web_page_preview=True)
+        except TelegramError:
+            logger.exception("Could not acknowledge outbox entry %s", entry.id)
@@ -0,0 +1,114 @@
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+ParsedTask = namedtuple('ParsedTask', 'title description executor_username')
+
+MENTION_PATTERN = re.compile(r'(?<!\w)@(\w+)')
+EMAIL_PATTERN = re.compile(r'(?<![\w.+-])[\w.+-]+@[\w-]+(?:\.[\w-]+)+')
+EXECUTOR_ENTITIES = ('mention', 'email')
+CHECKLIST_MARKER = re.compile(r'^\s*(?:(?:[-*•]|\d+[.)]|\[[ xX]?\])\s+)+')
+DESCRIPTION_SEPARATOR = ' - '
+
+
+@lru_cache(maxsize=16)
+def _bot_mention_pattern(bot_username):
+    return re.compile(r'@' + re.escape(bot_username) + r'\b', re.IGNORECASE)
+
+
+def is_email(executor):
+    return '@' in executor
+
+
+def executor_label(executor):
+    return executor if is_email(executor) else f"@{executor}"
+
+
+def mentions_bot(text, bot_username):
+    if not text or not bot_username or '@' not in text:
+        return False
+    return _bot_mention_pattern(bot_username).search(text) is not None
+
+
+def _utf16_index(text):
+    if text.isascii() or len(text.encode('utf-16-le')) == 2 * len(text):
+        return None
+    index = {}
+    unit = 0
+    for position, char in enumerate(text):
+        index[unit] = position
+        unit += 2 if ord(char) > 0xFFFF else 1
+    index[unit] = len(text)
+    return index
+
+
+def _mention_spans(text, entities):
+    spans = []
+    index = None
+    for entity in entities or ():
+        if entity.type not in EXECUTOR_ENTITIES:
+            continue
+        if index is None:
+            index = _utf16_index(text) or {}
+        end = entity.offset + entity.length
+        spans.append((index.get(entity.offset, entity.offset), index.get(end, end)))
+    if spans:
+        spans.sort()
+        return spans
+    spans = [match.span() for match in MENTION_PATTERN.finditer(text)]
+    if '.' in text:
+        spans.extend(match.span() for match in EMAIL_PATTERN.finditer(text))
+        spans.sort()
+    return spans
+
+
+def _build_task(line):
+    marker = CHECKLIST_MARKER.match(line)
+    if marker:
+        line = line[marker.end():]
+    title, separator, description = line.partition(DESCRIPTION_SEPARATOR)
+    return ' '.join(title.split()), description.strip() or None
+
+
+def parse_tasks(text, entities, bot_username):
+    spans = _mention_spans(text, entities)
+    bot_mention = f"@{bot_username}".lower()
+    bot_span = next((span for span in spans if text[span[0]:span[1]].lower() == bot_mention), None)
+    if bot_span is None:
+        return None
+
+    tasks = []
+    span_index = 0
+    line_start = 0
+    text_length = len(text)
+    while line_start <= text_length:
+        line_end = text.find('\n', line_start)
+        if line_end == -1:
+            line_end = text_length
+
+        line_spans = []
+        while span_index < len(spans) and spans[span_index][0] < line_end:
+            if spans[span_index] != bot_span:
+                line_spans.append(spans[span_index])
+            span_index += 1
+
+        removed = [bot_span] if line_start <= bot_span[0] < line_end else []
+        executor_username = None
+        if line_spans:
+            executor_span = line_spans[-1]
+            executor_username = text[executor_span[0]:executor_span[1]].removeprefix('@')
+            removed.append(executor_span)
+        removed.sort()
+
+        parts = []
+        cursor = line_start
+        for start, end in removed:
+            parts.append(text[cursor:start])
+            cursor = end
+        parts.append(text[cursor:line_end])
+
+        title, description = _build_task(''.join(parts))
+        if title:
+            tasks.append(ParsedTask(title, description, executor_username))
+        line_start = line_end + 1
+    return tasks
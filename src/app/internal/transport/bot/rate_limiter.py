@@ -0,0 +1,72 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from telegram.error import RetryAfter
+from telegram.ext import BaseRateLimiter
+
+from app.internal.services import metrics
+from app.internal.services.rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+class TelegramRateLimiter(BaseRateLimiter):
+    def __init__(self):
+        self.max_retries = settings.TELEGRAM_MAX_RETRIES
+        self.max_chats = settings.TELEGRAM_RATE_LIMIT_MAX_CHATS
+        self._global = None
+        self._chats = OrderedDict()
+        self._pending = None
+
+    async def initialize(self):
+        self._global = TokenBucket(settings.TELEGRAM_RATE_LIMIT_PER_SECOND, settings.TELEGRAM_RATE_LIMIT_BURST)
+        self._pending = asyncio.Semaphore(settings.TELEGRAM_MAX_PENDING_REQUESTS)
+
+    async def shutdown(self):
+        self._chats.clear()
+
+    @staticmethod
+    def _new_chat_bucket(chat_id):
+        if isinstance(chat_id, int) and chat_id < 0:
+            return TokenBucket(settings.TELEGRAM_GROUP_RATE_LIMIT_PER_MINUTE / 60, settings.TELEGRAM_CHAT_RATE_LIMIT_BURST)
+        return TokenBucket(settings.TELEGRAM_CHAT_RATE_LIMIT_PER_SECOND, settings.TELEGRAM_CHAT_RATE_LIMIT_BURST)
+
+    def _chat_bucket(self, chat_id):
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            bucket = self._chats[chat_id] = self._new_chat_bucket(chat_id)
+            while len(self._chats) > self.max_chats:
+                self._chats.popitem(last=False)
+        else:
+            self._chats.move_to_end(chat_id)
+        return bucket
+
+    async def process_request(self, callback, args, kwargs, endpoint, data, rate_limit_args):
+        chat_id = data.get('chat_id')
+        if chat_id is None:
+            return await callback(*args, **kwargs)
+        try:
+            chat_id = int(chat_id)
+        except (TypeError, ValueError):
+            pass
+
+        async with self._pending:
+            bucket = self._chat_bucket(chat_id)
+            attempt = 0
+            while True:
+                started = time.monotonic()
+                await bucket.acquire()
+                await self._global.acquire()
+                metrics.telegram_send_wait_seconds.observe(time.monotonic() - started, method=endpoint)
+                try:
+                    return await callback(*args, **kwargs)
+                except RetryAfter as e:
+                    metrics.telegram_flood_waits_total.inc(method=endpoint)
+                    if attempt >= self.max_retries:
+                        raise
+                    attempt += 1
+                    logger.warning("Telegram flood wait on %s for chat %s: %ss", endpoint, chat_id, e.retry_after)
+                    bucket.pause(e.retry_after)
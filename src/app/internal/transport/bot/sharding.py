@@ -0,0 +1,130 @@
+import asyncio
+import logging
+import multiprocessing
+import signal
+
+from django.conf import settings
+from telegram import Bot
+from telegram.error import NetworkError, RetryAfter
+
+from app.internal.transport.bot.filters import RawUpdateFilter, allowed_updates
+from app.internal.transport.bot.metrics_server import MetricsServer
+
+logger = logging.getLogger(__name__)
+
+SHARED_RATE_LIMITS = ('TELEGRAM_RATE_LIMIT_PER_SECOND', 'YOUGILE_RATE_LIMIT_PER_MINUTE')
+SHARED_BURSTS = ('TELEGRAM_RATE_LIMIT_BURST', 'YOUGILE_RATE_LIMIT_BURST')
+
+
+def shard_key(data):
+    payload = next((value for key, value in data.items() if key != "update_id"), None) or {}
+    chat = payload.get("chat") or (payload.get("message") or {}).get("chat")
+    if chat:
+        return chat["id"]
+    sender = payload.get("from")
+    return sender["id"] if sender else data["update_id"]
+
+
+def shard_for(data, shards):
+    return abs(shard_key(data)) % shards
+
+
+def share_limits(workers):
+    for name in SHARED_RATE_LIMITS:
+        setattr(settings, name, getattr(settings, name) / workers)
+    for name in SHARED_BURSTS:
+        setattr(settings, name, max(1, getattr(settings, name) // workers))
+
+
+def run_worker(token, index, workers, source):
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    import django
+
+    django.setup()
+
+    from app.internal.bot import TelegramBot
+
+    share_limits(workers)
+    bot = TelegramBot(token, primary=index == 0, shard=(index, workers))
+    asyncio.run(bot.serve_queue(source))
+
+
+class ShardedRunner:
+    def __init__(self, token, workers):
+        from app.internal.transport.bot.handlers import get_handlers
+
+        self.token = token
+        self.workers = workers
+        self.allowed_updates = allowed_updates(get_handlers())
+
+    def run(self):
+        context = multiprocessing.get_context("spawn")
+        queues = [context.Queue(settings.BOT_MAX_PENDING_UPDATES) for _ in range(self.workers)]
+        processes = [
+            context.Process(
+                target=run_worker, args=(self.token, index, self.workers, queue), name=f"runbot-worker-{index}"
+            )
+            for index, queue in enumerate(queues)
+        ]
+        for process in processes:
+            process.start()
+        try:
+            asyncio.run(self._poll(queues, processes))
+        finally:
+            for queue, process in zip(queues, processes):
+                if process.is_alive():
+                    queue.put(None)
+            for process in processes:
+                process.join(settings.BOT_WORKER_SHUTDOWN_TIMEOUT)
+                if process.is_alive():
+                    logger.warning("Worker %s did not stop in time, terminating", process.name)
+                    process.terminate()
+
+    async def _poll(self, queues, processes):
+        loop = asyncio.get_running_loop()
+        stop_event = asyncio.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop_event.set)
+
+        metrics_server = None
+        if settings.BOT_METRICS_PORT:
+            metrics_server = MetricsServer(settings.BOT_METRICS_LISTEN, settings.BOT_METRICS_PORT)
+            await metrics_server.start()
+            logger.info(
+                "Metrics on ports %d (polling) and %d-%d (workers)", settings.BOT_METRICS_PORT,
+                settings.BOT_METRICS_PORT + 1, settings.BOT_METRICS_PORT + self.workers,
+            )
+        try:
+            await self._poll_updates(queues, processes, stop_event)
+        finally:
+            if metrics_server is not None:
+                await metrics_server.stop()
+
+    async def _poll_updates(self, queues, processes, stop_event):
+        loop = asyncio.get_running_loop()
+        async with Bot(self.token, base_url=settings.TELEGRAM_API_BASE_URL) as bot:
+            update_filter = RawUpdateFilter(self.allowed_updates, bot.username)
+            await bot.delete_webhook(drop_pending_updates=True)
+            logger.info("Polling for @%s with %d worker processes", bot.username, self.workers)
+            offset = None
+            while not stop_event.is_set():
+                dead = [process.name for process in processes if not process.is_alive()]
+                if dead:
+                    raise RuntimeError(f"Worker processes exited: {', '.join(dead)}")
+                try:
+                    updates = await bot.get_updates(
+                        offset=offset, timeout=settings.BOT_POLL_TIMEOUT, allowed_updates=self.allowed_updates
+                    )
+                except RetryAfter as e:
+                    await asyncio.sleep(e.retry_after)
+                    continue
+                except NetworkError as e:
+                    logger.warning("getUpdates failed: %s", e)
+                    await asyncio.sleep(1)
+                    continue
+                for update in updates:
+                    offset = update.update_id + 1
+                    data = update.to_dict()
+                    if update_filter.accept(data):
+                        await loop.run_in_executor(None, queues[shard_for(data, len(queues))].put, data)
@@ -0,0 +1,43 @@
+import asyncio
+
+from telegram import Update
+from telegram.ext import BaseUpdateProcessor
+
+
+class ChatOrderedUpdateProcessor(BaseUpdateProcessor):
+    def __init__(self, max_workers, max_pending_updates):
+        super().__init__(max(max_workers, max_pending_updates))
+        self._workers = asyncio.BoundedSemaphore(max_workers)
+        self._chat_locks = {}
+
+    @staticmethod
+    def _chat_id(update):
+        if isinstance(update, Update) and update.effective_chat:
+            return update.effective_chat.id
+        return None
+
+    async def do_process_update(self, update, coroutine):
+        chat_id = self._chat_id(update)
+        if chat_id is None:
+            async with self._workers:
+                await coroutine
+            return
+
+        lock, waiters = self._chat_locks.get(chat_id, (asyncio.Lock(), 0))
+        self._chat_locks[chat_id] = (lock, waiters + 1)
+        try:
+            async with lock:
+                async with self._workers:
+                    await coroutine
+        finally:
+            lock, waiters = self._chat_locks[chat_id]
+            if waiters <= 1:
+                del self._chat_locks[chat_id]
+            else:
+                self._chat_locks[chat_id] = (lock, waiters - 1)
+
+    async def initialize(self):
+        pass
+
+    async def shutdown(self):
+        pass
@@ -0,0 +1,50 @@
+import hmac
+
+from aiohttp import web
+from telegram import Update
+
+
+class WebhookServer:
+    SECRET_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+
+    def __init__(self, application, secret_token, listen, port, url_path, update_filter=None):
+        self.application = application
+        self.update_filter = update_filter
+        self.secret_token = secret_token
+        self.listen = listen
+        self.port = port
+        self.url_path = "/" + url_path.strip("/")
+        self._runner = None
+
+    async def handle_update(self, request):
+        token = request.headers.get(self.SECRET_HEADER, "")
+        if not hmac.compare_digest(token, self.secret_token):
+            return web.Response(status=403)
+        try:
+            data = await request.json()
+        except ValueError:
+            return web.Response(status=400)
+
+        if self.update_filter is not None and not self.update_filter.accept(data):
+            return web.Response()
+        update = Update.de_json(data, self.application.bot)
+        await self.application.update_queue.put(update)
+        return web.Response()
+
+    def make_app(self):
+        app = web.Application()
+        app.router.add_post(self.url_path, self.handle_update)
+        return app
+
+    async def start(self):
+        self._runner = web.AppRunner(self.make_app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.listen, self.port)
+        await site.start()
+        if not self.port:
+            self.port = site._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
@@ -0,0 +1,37 @@
+import hmac
+import json
+import time
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+
+from app.internal.services import metrics as bot_metrics
+from app.internal.services.event_service import EventService
+from app.internal.transport.bot.notifications import NotificationQueue
+
+
+def metrics(request):
+    return HttpResponse(bot_metrics.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@csrf_exempt
+@require_POST
+def yougile_events(request, secret):
+    received_at = time.monotonic()
+    if not settings.YOUGILE_WEBHOOK_SECRET or not hmac.compare_digest(secret, settings.YOUGILE_WEBHOOK_SECRET):
+        return HttpResponse(status=403)
+    try:
+        data = json.loads(request.body)
+    except ValueError:
+        return HttpResponse(status=400)
+    if not isinstance(data, dict):
+        return HttpResponse(status=400)
+
+    notifications = EventService.ingest(data)
+    if notifications:
+        queue = NotificationQueue.get_instance()
+        for chat_id, text in notifications:
+            queue.offer(chat_id, text, received_at)
+    return HttpResponse()
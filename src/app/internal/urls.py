@@ -1,7 +1,8 @@
 from django.urls import path
 
-
+from app.internal.transport.rest.handlers import metrics, yougile_events
 
 urlpatterns = [
-
-]
\ No newline at end of file
+    path("metrics", metrics),
+    path("yougile/events/<str:secret>", yougile_events),
+]
@@ -0,0 +1,81 @@
+import json
+from django.core.management.base import BaseCommand, CommandError
+from benchmarks.harness import BASELINE_DIR, LoadProfile, compare, load_baseline, run_load, save_baseline
+
+
+class Command(BaseCommand):
+    help = "Нагрузочный прогон обработчиков бота против локальных заглушек Telegram и YouGile"
+
+    def add_arguments(self, parser):
+        defaults = LoadProfile()
+        parser.add_argument("--updates", type=int, default=defaults.updates, help="Количество обновлений")
+        parser.add_argument("--chats", type=int, default=defaults.chats, help="Количество чатов и пользователей")
+        parser.add_argument("--workers", type=int, default=defaults.workers, help="BOT_CONCURRENT_UPDATES")
+        parser.add_argument("--telegram-latency", type=float, default=defaults.telegram_latency)
+        parser.add_argument("--telegram-error-rate", type=float, default=defaults.telegram_error_rate)
+        parser.add_argument("--yougile-latency", type=float, default=defaults.yougile_latency)
+        parser.add_argument("--yougile-error-rate", type=float, default=defaults.yougile_error_rate)
+        parser.add_argument("--seed", type=int, default=defaults.seed)
+        parser.add_argument("--drain-timeout", type=float, default=60, help="Сколько ждать разбора outbox, секунд")
+        parser.add_argument(
+            "--baseline", default=str(BASELINE_DIR / "loadtest.json"), help="JSON с эталонными результатами"
+        )
+        parser.add_argument("--update-baseline", action="store_true", help="Записать результат как новый эталон")
+        parser.add_argument(
+            "--counts-only", action="store_true", help="Записать в эталон только число запросов к БД и HTTP"
+        )
+        parser.add_argument("--time-tolerance", type=float, default=0.3, help="Допуск для задержек и пропускной способности")
+        parser.add_argument("--count-tolerance", type=float, default=0.05, help="Допуск для числа запросов к БД и HTTP")
+        parser.add_argument("--json", action="store_true", help="Вывести результат в JSON")
+
+    def handle(self, *args, **options):
+        profile = LoadProfile(
+            updates=options["updates"],
+            chats=options["chats"],
+            workers=options["workers"],
+            telegram_latency=options["telegram_latency"],
+            telegram_error_rate=options["telegram_error_rate"],
+            yougile_latency=options["yougile_latency"],
+            yougile_error_rate=options["yougile_error_rate"],
+            seed=options["seed"],
+        )
+        result = run_load(profile, options["drain_timeout"])
+
+        if options["json"]:
+            self.stdout.write(json.dumps(result, indent=2, sort_keys=True))
+        else:
+            self.write_report(result)
+
+        if options["update_baseline"]:
+            save_baseline(options["baseline"], result, options["counts_only"])
+            self.stdout.write(self.style.SUCCESS(f"Эталон сохранён: {options['baseline']}"))
+            return
+
+        try:
+            baseline = load_baseline(options["baseline"])
+        except FileNotFoundError:
+            raise CommandError(f"Эталон не найден: {options['baseline']}, запишите его с --update-baseline")
+        regressions = compare(result, baseline, options["time_tolerance"], options["count_tolerance"])
+        if regressions:
+            raise CommandError("Регрессия относительно эталона:\n" + "\n".join(regressions))
+        self.stdout.write(self.style.SUCCESS("Результат в пределах эталона"))
+
+    def write_report(self, result):
+        self.stdout.write(
+            f"{result['updates']} обновлений за {result['handled_s']:.2f}с "
+            f"({result['throughput_per_s']:.1f}/с), outbox разобран за {result['drained_s']:.2f}с, "
+            f"ошибок обработчиков: {result['handler_errors']}"
+        )
+        self.stdout.write(
+            f"задержка: p50={result['p50_ms']:.1f}мс p95={result['p95_ms']:.1f}мс p99={result['p99_ms']:.1f}мс"
+        )
+        for scenario, stats in result["scenarios"].items():
+            self.stdout.write(
+                f"  {scenario:<9} n={stats['count']:<5} p50={stats['p50_ms']:.1f}мс "
+                f"p95={stats['p95_ms']:.1f}мс p99={stats['p99_ms']:.1f}мс"
+            )
+        self.stdout.write(
+            f"запросов к БД на обновление: {result['db_queries_per_update']:.2f}, "
+            f"HTTP-вызовов на обновление: {result['http_calls_per_update']:.2f} "
+            f"(Telegram {result['telegram_calls_per_update']:.2f}, YouGile {result['yougile_calls_per_update']:.2f})"
+        )
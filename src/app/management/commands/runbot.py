@@ -1,10 +1,34 @@
 import os
-from django.core.management.base import BaseCommand
-from app.internal.bot import create_bot
+import tempfile
+from django.core.management.base import BaseCommand, CommandError
+from app.internal.bot import create_bot, get_token
+from app.internal.transport.bot.sharding import ShardedRunner
 
 
 class Command(BaseCommand):
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument("--webhook", action="store_true", help="Получать обновления через webhook вместо polling")
+        parser.add_argument(
+            "--workers", type=int, default=1, help="Количество процессов-обработчиков, обновления делятся по chat_id"
+        )
+
     def handle(self, *args, **options):
+        if options["workers"] > 1:
+            if options["webhook"]:
+                raise CommandError("--workers поддерживается только в режиме polling")
+            if not os.environ.get("CACHE_URL"):
+                cache_dir = os.path.join(tempfile.gettempdir(), "yougile-bot-cache")
+                os.environ["CACHE_URL"] = f"filecache://{cache_dir}"
+                self.stdout.write(f"CACHE_URL не задан, процессы делят файловый кэш: {cache_dir}")
+            self.stdout.write(self.style.SUCCESS(f"Успешный старт, процессов: {options['workers']}"))
+            ShardedRunner(get_token(), options["workers"]).run()
+            return
+
         self.stdout.write(self.style.SUCCESS("Успешный старт"))
         bot = create_bot()
-        bot.run_polling()
\ No newline at end of file
+        if options["webhook"]:
+            bot.run_webhook()
+        else:
+            bot.run_polling()
@@ -0,0 +1,31 @@
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from app.internal.services.http_client import HttpClient
+from app.internal.services.yougile_service import YougileApiError, YougileService
+
+
+class Command(BaseCommand):
+    help = "Подписать бота на события задач YouGile"
+
+    def add_arguments(self, parser):
+        parser.add_argument("base_url", help="Публичный адрес сайта, например https://bot.example.com")
+        parser.add_argument("--event", default="task-*", help="Шаблон событий YouGile")
+
+    def handle(self, *args, **options):
+        if not settings.YOUGILE_WEBHOOK_SECRET:
+            raise CommandError("YOUGILE_WEBHOOK_SECRET не задан")
+        url = f"{options['base_url'].rstrip('/')}/api/yougile/events/{settings.YOUGILE_WEBHOOK_SECRET}"
+
+        async def subscribe():
+            try:
+                return await YougileService.get_instance().subscribe_webhook(url, options["event"])
+            finally:
+                await HttpClient.close()
+
+        try:
+            webhook_id, created = async_to_sync(subscribe)()
+        except YougileApiError as e:
+            raise CommandError(str(e))
+        status = "создана" if created else "уже существует"
+        self.stdout.write(self.style.SUCCESS(f"Подписка {webhook_id} на {options['event']} {status}"))
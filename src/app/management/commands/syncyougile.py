@@ -0,0 +1,27 @@
+from asgiref.sync import async_to_sync
+from django.core.management.base import BaseCommand
+from app.internal.services.employee_service import EmployeeService
+from app.internal.services.http_client import HttpClient
+
+
+class Command(BaseCommand):
+    help = "Синхронизировать список сотрудников YouGile с локальной базой"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=None, help="Размер пачки для записи в базу")
+        parser.add_argument("--full", action="store_true", help="Перезаписать все строки, не сравнивая отпечатки")
+
+    def handle(self, *args, **options):
+        async def sync():
+            try:
+                return await EmployeeService.sync(chunk_size=options["chunk_size"], full=options["full"])
+            finally:
+                await HttpClient.close()
+
+        stats = async_to_sync(sync)()
+        rate = stats["fetched"] / stats["elapsed"] if stats["elapsed"] else 0
+        self.stdout.write(self.style.SUCCESS(
+            f"Получено: {stats['fetched']}, обновлено: {stats['upserted']}, "
+            f"без изменений: {stats['unchanged']}, удалено: {stats['deleted']} "
+            f"за {stats['elapsed']:.2f}с ({rate:.0f} строк/с)"
+        ))
@@ -0,0 +1,59 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:38
+
+import django.contrib.auth.models
+import django.contrib.auth.validators
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='YouGileUser',
+            fields=[
+                ('telegram_id', models.IntegerField(primary_key=True, serialize=False, unique=True, verbose_name='ID в Telegram')),
+                ('telegram_username', models.CharField(blank=True, max_length=255, null=True, verbose_name='Username в Telegram')),
+                ('yougile_id', models.CharField(blank=True, max_length=255, null=True, verbose_name='ID в YouGile')),
+                ('yougile_email', models.EmailField(blank=True, max_length=254, null=True, verbose_name='Email в YouGile')),
+                ('default_project_id', models.CharField(blank=True, max_length=255, null=True, verbose_name='Проект по умолчанию')),
+                ('default_column_id', models.CharField(blank=True, max_length=255, null=True, verbose_name='Колонка по умолчанию')),
+            ],
+            options={
+                'verbose_name': 'Пользователь YouGile',
+                'verbose_name_plural': 'Пользователи YouGile',
+            },
+        ),
+        migrations.CreateModel(
+            name='AdminUser',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('password', models.CharField(max_length=128, verbose_name='password')),
+                ('last_login', models.DateTimeField(blank=True, null=True, verbose_name='last login')),
+                ('is_superuser', models.BooleanField(default=False, help_text='Designates that this user has all permissions without explicitly assigning them.', verbose_name='superuser status')),
+                ('username', models.CharField(error_messages={'unique': 'A user with that username already exists.'}, help_text='Required. 150 characters or fewer. Letters, digits and @/./+/-/_ only.', max_length=150, unique=True, validators=[django.contrib.auth.validators.UnicodeUsernameValidator()], verbose_name='username')),
+                ('first_name', models.CharField(blank=True, max_length=150, verbose_name='first name')),
+                ('last_name', models.CharField(blank=True, max_length=150, verbose_name='last name')),
+                ('email', models.EmailField(blank=True, max_length=254, verbose_name='email address')),
+                ('is_staff', models.BooleanField(default=False, help_text='Designates whether the user can log into this admin site.', verbose_name='staff status')),
+                ('is_active', models.BooleanField(default=True, help_text='Designates whether this user should be treated as active. Unselect this instead of deleting accounts.', verbose_name='active')),
+                ('date_joined', models.DateTimeField(default=django.utils.timezone.now, verbose_name='date joined')),
+                ('groups', models.ManyToManyField(blank=True, help_text='The groups this user belongs to. A user will get all permissions granted to each of their groups.', related_name='user_set', related_query_name='user', to='auth.group', verbose_name='groups')),
+                ('user_permissions', models.ManyToManyField(blank=True, help_text='Specific permissions for this user.', related_name='user_set', related_query_name='user', to='auth.permission', verbose_name='user permissions')),
+            ],
+            options={
+                'verbose_name': 'user',
+                'verbose_name_plural': 'users',
+                'abstract': False,
+            },
+            managers=[
+                ('objects', django.contrib.auth.models.UserManager()),
+            ],
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:38
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+def clear_duplicate_usernames(apps, schema_editor):
+    YouGileUser = apps.get_model('app', 'YouGileUser')
+    owners = {}
+    users = YouGileUser.objects.exclude(telegram_username__isnull=True).order_by('yougile_id', '-telegram_id')
+    for user in users.iterator():
+        key = user.telegram_username.lower()
+        owner = owners.get(key)
+        if owner is None:
+            owners[key] = user
+            continue
+        if not owner.yougile_id and user.yougile_id:
+            owners[key] = user
+            user = owner
+        YouGileUser.objects.filter(pk=user.pk).update(telegram_username=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(clear_duplicate_usernames, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='yougileuser',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('telegram_username'), name='yougileuser_telegram_username_ci_unique'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:51
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0002_yougileuser_telegram_username_ci_unique'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskOutbox',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('telegram_id', models.BigIntegerField(verbose_name='ID автора в Telegram')),
+                ('chat_id', models.BigIntegerField(verbose_name='ID чата')),
+                ('reply_message_id', models.BigIntegerField(blank=True, null=True, verbose_name='ID ответа бота')),
+                ('title', models.CharField(max_length=1024, verbose_name='Название')),
+                ('description', models.TextField(blank=True, null=True, verbose_name='Описание')),
+                ('column_id', models.CharField(blank=True, max_length=255, null=True, verbose_name='Колонка')),
+                ('executor_id', models.CharField(blank=True, max_length=255, null=True, verbose_name='ID исполнителя в YouGile')),
+                ('executor_username', models.CharField(blank=True, max_length=255, null=True, verbose_name='Username исполнителя')),
+                ('status', models.CharField(choices=[('pending', 'Ожидает отправки'), ('processing', 'Отправляется'), ('sent', 'Создана'), ('failed', 'Ошибка')], default='pending', max_length=16, verbose_name='Статус')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='Попыток')),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Следующая попытка')),
+                ('locked_until', models.DateTimeField(blank=True, null=True, verbose_name='Заблокирована до')),
+                ('last_error', models.TextField(blank=True, null=True, verbose_name='Последняя ошибка')),
+                ('yougile_task_id', models.CharField(blank=True, max_length=255, null=True, verbose_name='ID задачи в YouGile')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Создана')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Обновлена')),
+            ],
+            options={
+                'verbose_name': 'Задача в очереди',
+                'verbose_name_plural': 'Очередь задач',
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='taskoutbox_status_next_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.30 on 2026-10-18 13:06
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0003_taskoutbox'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='YougileEmployee',
+            fields=[
+                ('yougile_id', models.CharField(max_length=255, primary_key=True, serialize=False, verbose_name='ID в YouGile')),
+                ('email', models.EmailField(blank=True, max_length=254, null=True, verbose_name='Email')),
+                ('login', models.CharField(blank=True, db_index=True, max_length=255, null=True, verbose_name='Логин (часть email до @)')),
+                ('real_name', models.CharField(blank=True, max_length=255, null=True, verbose_name='Имя')),
+                ('is_admin', models.BooleanField(default=False, verbose_name='Администратор')),
+                ('sync_hash', models.CharField(max_length=40, verbose_name='Отпечаток данных')),
+                ('synced_at', models.DateTimeField(auto_now=True, verbose_name='Синхронизирован')),
+            ],
+            options={
+                'verbose_name': 'Сотрудник YouGile',
+                'verbose_name_plural': 'Сотрудники YouGile',
+                'indexes': [models.Index(django.db.models.functions.text.Lower('email'), name='yougileemployee_email_ci_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 4.2.30 on 2026-10-18 15:42
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0004_yougileemployee'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('yougile_id', models.CharField(max_length=255, unique=True, verbose_name='ID задачи в YouGile')),
+                ('telegram_id', models.BigIntegerField(verbose_name='ID автора в Telegram')),
+                ('chat_id', models.BigIntegerField(verbose_name='ID чата')),
+                ('title', models.CharField(max_length=1024, verbose_name='Название')),
+                ('description', models.TextField(blank=True, null=True, verbose_name='Описание')),
+                ('column_id', models.CharField(blank=True, max_length=255, null=True, verbose_name='Колонка')),
+                ('executor_id', models.CharField(blank=True, max_length=255, null=True, verbose_name='ID исполнителя в YouGile')),
+                ('executor_username', models.CharField(blank=True, max_length=255, null=True, verbose_name='Username исполнителя')),
+                ('completed', models.BooleanField(default=False, verbose_name='Выполнена')),
+                ('archived', models.BooleanField(default=False, verbose_name='В архиве')),
+                ('deleted', models.BooleanField(default=False, verbose_name='Удалена')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Создана')),
+                ('synced_at', models.DateTimeField(blank=True, null=True, verbose_name='Статус обновлён')),
+            ],
+            options={
+                'verbose_name': 'Созданная задача',
+                'verbose_name_plural': 'Созданные задачи',
+                'indexes': [
+                    models.Index(fields=['telegram_id', '-created_at', '-id'], name='taskrecord_creator_idx'),
+                    models.Index(fields=['executor_id', '-created_at', '-id'], name='taskrecord_executor_idx'),
+                    models.Index(fields=['chat_id', '-created_at', '-id'], name='taskrecord_chat_idx'),
+                    models.Index(condition=models.Q(('completed', False), ('deleted', False)), fields=['column_id'], name='taskrecord_open_idx'),
+                ],
+            },
+        ),
+    ]
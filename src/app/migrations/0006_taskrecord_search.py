@@ -0,0 +1,52 @@
+from django.db import migrations
+
+SQLITE_FORWARD = [
+    "CREATE VIRTUAL TABLE app_taskrecord_fts USING fts5("
+    "title, description, content='app_taskrecord', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    "CREATE TRIGGER app_taskrecord_fts_ai AFTER INSERT ON app_taskrecord BEGIN "
+    "INSERT INTO app_taskrecord_fts(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER app_taskrecord_fts_ad AFTER DELETE ON app_taskrecord BEGIN "
+    "INSERT INTO app_taskrecord_fts(app_taskrecord_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); END",
+    "CREATE TRIGGER app_taskrecord_fts_au AFTER UPDATE OF title, description ON app_taskrecord BEGIN "
+    "INSERT INTO app_taskrecord_fts(app_taskrecord_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); "
+    "INSERT INTO app_taskrecord_fts(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+    "INSERT INTO app_taskrecord_fts(app_taskrecord_fts) VALUES ('rebuild')",
+]
+SQLITE_BACKWARD = [
+    "DROP TRIGGER IF EXISTS app_taskrecord_fts_au",
+    "DROP TRIGGER IF EXISTS app_taskrecord_fts_ad",
+    "DROP TRIGGER IF EXISTS app_taskrecord_fts_ai",
+    "DROP TABLE IF EXISTS app_taskrecord_fts",
+]
+POSTGRES_FORWARD = [
+    "CREATE INDEX taskrecord_search_idx ON app_taskrecord "
+    "USING gin (to_tsvector('simple', title || ' ' || coalesce(description, '')))",
+]
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS taskrecord_search_idx",
+]
+
+
+def run(statements):
+    def apply(apps, schema_editor):
+        for statement in statements.get(schema_editor.connection.vendor, ()):
+            schema_editor.execute(statement)
+
+    return apply
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0005_taskrecord'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run({'sqlite': SQLITE_FORWARD, 'postgresql': POSTGRES_FORWARD}),
+            run({'sqlite': SQLITE_BACKWARD, 'postgresql': POSTGRES_BACKWARD}),
+        ),
+    ]
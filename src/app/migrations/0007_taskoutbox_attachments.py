@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-18 19:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0006_taskrecord_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='taskoutbox',
+            name='attachments',
+            field=models.JSONField(blank=True, default=list, verbose_name='Вложения'),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 4.2.30 on 2026-10-18 13:57
+
+from django.db import migrations, models
+
+
+def backfill(apps, schema_editor):
+    EventSubscription = apps.get_model('app', 'EventSubscription')
+    TaskRecord = apps.get_model('app', 'TaskRecord')
+    YouGileUser = apps.get_model('app', 'YouGileUser')
+    tasks = TaskRecord.objects.values_list('yougile_id', 'chat_id', 'telegram_id').iterator()
+    EventSubscription.objects.bulk_create(
+        (EventSubscription(kind='task', target_id=task_id, chat_id=chat_id, telegram_id=telegram_id)
+         for task_id, chat_id, telegram_id in tasks),
+        batch_size=1000, ignore_conflicts=True,
+    )
+    users = YouGileUser.objects.exclude(yougile_id=None).values_list('telegram_id', 'yougile_id').iterator()
+    EventSubscription.objects.bulk_create(
+        (EventSubscription(kind='user', target_id=yougile_id, chat_id=telegram_id, telegram_id=telegram_id)
+         for telegram_id, yougile_id in users),
+        batch_size=1000, ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0007_taskoutbox_attachments'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventSubscription',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('task', 'Изменения задачи'), ('user', 'Назначения исполнителя')], max_length=8, verbose_name='Тип')),
+                ('target_id', models.CharField(max_length=255, verbose_name='ID задачи или пользователя в YouGile')),
+                ('chat_id', models.BigIntegerField(verbose_name='ID чата')),
+                ('telegram_id', models.BigIntegerField(blank=True, null=True, verbose_name='ID подписчика в Telegram')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Создана')),
+            ],
+            options={
+                'verbose_name': 'Подписка на события',
+                'verbose_name_plural': 'Подписки на события',
+                'indexes': [models.Index(fields=['telegram_id', 'kind'], name='eventsubscription_user_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='eventsubscription',
+            constraint=models.UniqueConstraint(fields=('kind', 'target_id', 'chat_id'), name='eventsubscription_target_uniq'),
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
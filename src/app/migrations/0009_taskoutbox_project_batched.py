@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-18 14:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0008_eventsubscription'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='taskoutbox',
+            name='batched',
+            field=models.BooleanField(default=False, verbose_name='Часть пакета'),
+        ),
+        migrations.AddField(
+            model_name='taskoutbox',
+            name='project_id',
+            field=models.CharField(blank=True, max_length=255, null=True, verbose_name='Проект'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.30 on 2026-10-18 14:40
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0009_taskoutbox_project_batched'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReceivedEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=255, unique=True, verbose_name='Ключ события')),
+                ('received_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now, verbose_name='Получено')),
+            ],
+            options={
+                'verbose_name': 'Полученное событие YouGile',
+                'verbose_name_plural': 'Полученные события YouGile',
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-18 14:43
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0010_receivedevent'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='yougileemployee',
+            name='login',
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-18 15:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0011_remove_yougileemployee_login'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='taskrecord',
+            index=models.Index(condition=models.Q(('completed', False), ('deleted', False)), fields=['synced_at', 'id'], name='taskrecord_sync_idx'),
+        ),
+    ]
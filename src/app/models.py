@@ -1,2 +1,7 @@
 from app.internal.models.user import YouGileUser
 from app.internal.models.admin_user import AdminUser
+from app.internal.models.event_subscription import EventSubscription
+from app.internal.models.received_event import ReceivedEvent
+from app.internal.models.task_outbox import TaskOutbox
+from app.internal.models.task_record import TaskRecord
+from app.internal.models.yougile_employee import YougileEmployee
\ No newline at end of file
@@ -0,0 +1,42 @@
+import os
+import statistics
+
+
+def setup_django(**env):
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    os.environ.setdefault("DJANGO_SECRET_KEY", "benchmark")
+    os.environ.setdefault("YOUGILE_API_KEY", "benchmark-key")
+    os.environ.setdefault("YOUGILE_PROJECT_ID", "project-1")
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    os.environ.setdefault("YOUGILE_RATE_LIMIT_PER_MINUTE", "6000000")
+    os.environ.setdefault("YOUGILE_RATE_LIMIT_BURST", "100000")
+    os.environ.setdefault("TELEGRAM_RATE_LIMIT_PER_SECOND", "1000000")
+    os.environ.setdefault("TELEGRAM_RATE_LIMIT_BURST", "1000000")
+    os.environ.setdefault("TELEGRAM_CHAT_RATE_LIMIT_PER_SECOND", "1000000")
+    os.environ.setdefault("TELEGRAM_GROUP_RATE_LIMIT_PER_MINUTE", "60000000")
+    os.environ.setdefault("TELEGRAM_CHAT_RATE_LIMIT_BURST", "100000")
+    os.environ.setdefault("DB_THREAD_SENSITIVE", "true")
+    for key, value in env.items():
+        os.environ[key] = str(value)
+
+    import django
+
+    django.setup()
+
+
+def percentile(samples, p):
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(samples):
+    return {
+        "count": len(samples),
+        "mean_ms": statistics.fmean(samples) * 1000 if samples else 0.0,
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p95_ms": percentile(samples, 95) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+    }
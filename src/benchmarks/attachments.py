@@ -0,0 +1,89 @@
+import argparse
+import asyncio
+import resource
+import time
+
+from benchmarks import setup_django
+from benchmarks.stubs import TelegramStub, ThreadedStub, YougileStub
+
+MB = 1024 * 1024
+
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def buffered_attachment(bot, attachment):
+    from app.internal.services.yougile_service import YougileService
+
+    telegram_file = await bot.get_file(attachment['file_id'])
+    data = bytes(await telegram_file.download_as_bytearray())
+
+    async def chunks():
+        yield data
+
+    return await YougileService.get_instance().upload_file(attachment['file_name'], attachment['mime_type'], chunks())
+
+
+def attachments(telegram, prefix, count, size):
+    files = []
+    for index in range(count):
+        file_id = f"{prefix}-{index}"
+        telegram.files[file_id] = size
+        files.append({"file_id": file_id, "file_name": f"{file_id}.log", "mime_type": "text/plain", "file_size": size})
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Peak RSS while forwarding Telegram files into YouGile")
+    parser.add_argument("--size-mb", type=int, default=50)
+    parser.add_argument("--files", type=int, default=3)
+    parser.add_argument("--buffered", action="store_true", help="also run the download-then-upload baseline")
+    args = parser.parse_args()
+    size = args.size_mb * MB
+    setup_django(ATTACHMENT_MAX_SIZE=size, TELEGRAM_BOT_TOKEN="123:attachments")
+
+    from telegram import Bot
+
+    from app.internal.services.http_client import HttpClient
+    from app.internal.services.yougile_service import YougileService
+    from app.internal.transport.bot.attachments import forward_attachments
+
+    telegram = TelegramStub()
+    yougile = YougileStub()
+    with ThreadedStub(telegram), ThreadedStub(yougile):
+        YougileService.get_instance().base_url = yougile.base_url
+
+        async def run():
+            bot = Bot("123:attachments", base_url=telegram.base_url, base_file_url=telegram.file_url)
+            try:
+                async with bot:
+                    await forward_attachments(bot, "task-0", attachments(telegram, "warmup", 1, MB))
+                    cases = [("streamed", lambda: forward_attachments(
+                        bot, "task-1", attachments(telegram, "streamed", args.files, size)
+                    ))]
+                    if args.buffered:
+                        cases.append(("buffered", lambda: asyncio.gather(*(
+                            buffered_attachment(bot, attachment)
+                            for attachment in attachments(telegram, "buffered", args.files, size)
+                        ))))
+                    for name, call in cases:
+                        before = peak_rss_mb()
+                        started = time.perf_counter()
+                        await call()
+                        elapsed = time.perf_counter() - started
+                        print(
+                            f"{name:>8}: {args.files} x {args.size_mb} MB in {elapsed:.2f}s "
+                            f"({args.files * args.size_mb / elapsed:.0f} MB/s), "
+                            f"peak RSS {before:.0f} -> {peak_rss_mb():.0f} MB (+{peak_rss_mb() - before:.0f} MB)"
+                        )
+            finally:
+                await HttpClient.close()
+
+        asyncio.run(run())
+        sizes = {upload["size"] for upload in yougile.uploads}
+        print(f"uploads received: {len(yougile.uploads)}, sizes: {sorted(sizes)}, task messages: {len(yougile.messages)}")
+
+
+if __name__ == "__main__":
+    main()
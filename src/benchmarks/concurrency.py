@@ -0,0 +1,105 @@
+import argparse
+import asyncio
+import time
+
+from asgiref.sync import sync_to_async
+
+from benchmarks import setup_django
+from benchmarks.fakes import update_payload
+from benchmarks.stubs import TelegramStub, YougileStub
+
+BOT_USERNAME = "benchbot"
+
+
+@sync_to_async
+def seed_users(count):
+    from app.internal.models.user import YouGileUser
+
+    YouGileUser.objects.all().delete()
+    YouGileUser.objects.bulk_create(
+        YouGileUser(
+            telegram_id=i,
+            telegram_username=f"user{i}",
+            yougile_id=f"yg-{i}",
+            yougile_email=f"user{i}@example.com",
+            default_column_id="column-1",
+        )
+        for i in range(1, count + 1)
+    )
+
+
+async def replay(workers, updates, chats, latency):
+    from django.conf import settings
+    from telegram import Update
+
+    from app.internal.bot import TelegramBot
+    from app.internal.services.user_cache import UserCache
+    from app.internal.services.yougile_service import YougileService
+
+    telegram = await TelegramStub(BOT_USERNAME).start()
+    yougile = await YougileStub(latency=latency).start()
+    YougileService.get_instance().base_url = yougile.base_url
+    settings.TELEGRAM_API_BASE_URL = telegram.base_url
+    settings.BOT_CONCURRENT_UPDATES = workers
+    UserCache.clear()
+    await seed_users(chats)
+
+    bot = TelegramBot("123:benchmark")
+    application = bot.application
+    await application.initialize()
+    await bot.on_startup(application)
+    await application.start()
+
+    started = time.perf_counter()
+    for i in range(updates):
+        chat = i % chats + 1
+        text = f"@{BOT_USERNAME} Task {chat}-{i // chats} - body"
+        payload = update_payload(i + 1, -chat, chat, text, username=f"user{chat}", bot_username=BOT_USERNAME)
+        await application.update_queue.put(Update.de_json(payload, application.bot))
+    while telegram.calls.get("sendMessage", 0) < updates:
+        await asyncio.sleep(0.005)
+    handled = time.perf_counter() - started
+    while len(yougile.tasks) < updates:
+        await asyncio.sleep(0.005)
+    delivered = time.perf_counter() - started
+
+    await application.stop()
+    await bot.on_shutdown(application)
+    await application.shutdown()
+    await telegram.stop()
+    await yougile.stop()
+
+    last_seen = {}
+    ordered = True
+    for task in yougile.tasks:
+        chat, seq = map(int, task["title"].split()[1].split("-"))
+        if seq <= last_seen.get(chat, -1):
+            ordered = False
+        last_seen[chat] = seq
+    return updates / handled, updates / delivered, ordered
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Throughput of handle_mention vs concurrent update workers")
+    parser.add_argument("--updates", type=int, default=400)
+    parser.add_argument("--chats", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+    setup_django()
+
+    from django.db import connection
+
+    connection.creation.create_test_db(verbosity=0)
+    baseline = None
+    for workers in args.workers:
+        handled, delivered, ordered = asyncio.run(replay(workers, args.updates, args.chats, args.latency))
+        baseline = baseline or handled
+        print(
+            f"workers={workers:>3}: handled {handled:8.1f} updates/s (speedup {handled / baseline:5.2f}x), "
+            f"tasks delivered {delivered:8.1f}/s, per-chat order {'kept' if ordered else 'BROKEN'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
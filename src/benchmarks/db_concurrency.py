@@ -0,0 +1,110 @@
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks import summarize
+
+
+def seed_users(count):
+    from app.internal.models.user import YouGileUser
+
+    YouGileUser.objects.all().delete()
+    YouGileUser.objects.bulk_create(
+        YouGileUser(telegram_id=i, telegram_username=f"user{i}", yougile_id=f"yg-{i}", default_column_id="column-1")
+        for i in range(1, count + 1)
+    )
+
+
+async def workload(operations, chats, concurrency, write_ratio):
+    from app.internal.services.user_service import UserService
+
+    semaphore = asyncio.Semaphore(concurrency)
+    write_every = round(1 / write_ratio) if write_ratio else 0
+    samples = []
+
+    async def operation(i):
+        chat_id = i % chats + 1
+        async with semaphore:
+            started = time.perf_counter()
+            if write_every and i % write_every == 0:
+                await UserService.set_default_yougile_column(chat_id, f"column-{i}")
+            else:
+                await UserService.get_user_by_id(chat_id)
+            samples.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(operation(i) for i in range(operations)))
+    return time.perf_counter() - started, samples
+
+
+def run_single(args):
+    from benchmarks import setup_django
+
+    setup_django(USER_CACHE_TTL=0)
+
+    from django.core.management import call_command
+    from django.db import connection
+
+    call_command("migrate", verbosity=0)
+    seed_users(args.chats)
+    elapsed, samples = asyncio.run(workload(args.operations, args.chats, args.concurrency, args.write_ratio))
+    report = summarize(samples)
+    report["vendor"] = connection.vendor
+    report["ops_per_s"] = args.operations / elapsed
+    print(json.dumps(report))
+
+
+def spawn(args, database_url, journal_mode, thread_sensitive):
+    env = dict(
+        os.environ,
+        DATABASE_URL=database_url,
+        SQLITE_JOURNAL_MODE=journal_mode,
+        DB_THREAD_SENSITIVE="true" if thread_sensitive else "false",
+    )
+    command = [
+        sys.executable, "-m", "benchmarks.db_concurrency", "--single",
+        "--operations", str(args.operations), "--chats", str(args.chats),
+        "--concurrency", str(args.concurrency), "--write-ratio", str(args.write_ratio),
+    ]
+    output = subprocess.run(command, env=env, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="UserService throughput under concurrent per-chat access")
+    parser.add_argument("--operations", type=int, default=5000)
+    parser.add_argument("--chats", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--write-ratio", type=float, default=0.1)
+    parser.add_argument("--database-url", default=os.environ.get("BENCH_DATABASE_URL"))
+    parser.add_argument("--single", action="store_true")
+    args = parser.parse_args()
+    if args.single:
+        run_single(args)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        runs = []
+        for journal_mode in ("delete", "wal"):
+            for thread_sensitive in (True, False):
+                database_url = f"sqlite:///{tmp}/{journal_mode}-{int(thread_sensitive)}.sqlite3"
+                runs.append((f"sqlite {journal_mode}", database_url, journal_mode, thread_sensitive))
+        if args.database_url:
+            for thread_sensitive in (True, False):
+                runs.append(("server", args.database_url, "wal", thread_sensitive))
+        for label, database_url, journal_mode, thread_sensitive in runs:
+            report = spawn(args, database_url, journal_mode, thread_sensitive)
+            mode = "thread_sensitive" if thread_sensitive else "thread_pool"
+            print(
+                f"{label:<12} {mode:<17} {report['ops_per_s']:8.0f} ops/s "
+                f"p50={report['p50_ms']:.2f}ms p99={report['p99_ms']:.2f}ms ({report['vendor']})"
+            )
+
+
+if __name__ == "__main__":
+    main()
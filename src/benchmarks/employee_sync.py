@@ -0,0 +1,69 @@
+import argparse
+import random
+
+from asgiref.sync import async_to_sync
+
+from benchmarks import setup_django
+from benchmarks.stubs import ThreadedStub, YougileStub
+
+
+def make_users(count, start=0):
+    return [
+        {"id": f"user-{i}", "email": f"employee{i}@example.com", "realName": f"Employee {i}", "isAdmin": i % 50 == 0}
+        for i in range(start, start + count)
+    ]
+
+
+def mutate(users, ratio, rng):
+    changed = max(1, int(len(users) * ratio))
+    for user in rng.sample(users, changed):
+        user["realName"] += " (renamed)"
+    removed = set(rng.sample(range(len(users)), changed // 2))
+    users[:] = [user for i, user in enumerate(users) if i not in removed]
+    users.extend(make_users(changed // 2, start=10 ** 9))
+    return changed, len(removed), changed // 2
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mirror YouGile users into the YougileEmployee table")
+    parser.add_argument("--users", type=int, default=100000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--change-ratio", type=float, default=0.01)
+    args = parser.parse_args()
+    setup_django()
+
+    from django.db import connection
+
+    connection.creation.create_test_db(verbosity=0)
+
+    from app.internal.models.yougile_employee import YougileEmployee
+    from app.internal.services.employee_service import EmployeeService
+    from app.internal.services.http_client import HttpClient
+    from app.internal.services.yougile_service import YougileService
+
+    async def sync(full=False):
+        try:
+            return await EmployeeService.sync(chunk_size=args.chunk_size, full=full)
+        finally:
+            await HttpClient.close()
+
+    def report(name, stats):
+        rate = stats["fetched"] / stats["elapsed"]
+        print(f"{name:>22}: {stats['elapsed']:6.2f}s, {rate:8.0f} rows/s fetched, "
+              f"upserted={stats['upserted']} unchanged={stats['unchanged']} deleted={stats['deleted']}")
+
+    stub = YougileStub(users=make_users(args.users))
+    with ThreadedStub(stub):
+        YougileService.get_instance().base_url = stub.base_url
+        print(f"{args.users} YouGile users, chunk size {args.chunk_size}")
+        report("initial sync", async_to_sync(sync)())
+        report("no changes", async_to_sync(sync)())
+        changed, removed, added = mutate(stub.users, args.change_ratio, random.Random(1))
+        print(f"changed {changed} rows, removed {removed}, added {added}")
+        report("incremental", async_to_sync(sync)())
+        report("full rewrite", async_to_sync(sync)(full=True))
+        assert YougileEmployee.objects.count() == len(stub.users)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import argparse
+import json
+import re
+import tempfile
+import threading
+import time
+import urllib.request
+from pathlib import Path
+from wsgiref.simple_server import WSGIRequestHandler, make_server
+
+from asgiref.sync import async_to_sync
+
+from benchmarks import setup_django, summarize
+from benchmarks.stubs import TelegramStub, ThreadedStub
+
+SECRET = "replay-secret"
+TITLE = re.compile(r"«Task (\d+)»")
+
+
+class QuietHandler(WSGIRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+def seed(tasks, chats):
+    from app.internal.models.event_subscription import EventSubscription
+    from app.internal.models.task_record import TaskRecord
+    from app.internal.services.task_service import TaskService
+
+    records = [
+        TaskRecord(yougile_id=f"task-{i}", telegram_id=i % chats + 1, chat_id=-(i % chats + 1), title=f"Task {i}",
+                   column_id="column-1")
+        for i in range(tasks)
+    ]
+    async_to_sync(TaskService.save)(records)
+    EventSubscription.objects.bulk_create(
+        EventSubscription(kind=EventSubscription.KIND_USER, target_id=f"yg-{user}", chat_id=user, telegram_id=user)
+        for user in range(1, chats + 1)
+    )
+
+
+def event(i, chats):
+    task = {"id": f"task-{i}", "title": f"Task {i}", "columnId": "column-1"}
+    if i % 3 == 0:
+        return {"event": "task-updated", "payload": dict(task, completed=True)}
+    if i % 3 == 1:
+        return {"event": "task-updated", "payload": dict(task, columnId="column-2")}
+    assignee = f"yg-{i % chats + 1}"
+    return {"event": "task-updated", "payload": dict(task, assigned=[assignee]), "prevData": {"assigned": []}}
+
+
+def post(url, data):
+    request = urllib.request.Request(url, json.dumps(data).encode(), {"Content-Type": "application/json"})
+    with urllib.request.urlopen(request) as response:
+        response.read()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay YouGile webhook events and measure notification latency")
+    parser.add_argument("--rate", type=float, default=100)
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--chats", type=int, default=200)
+    parser.add_argument("--duplicate-every", type=int, default=10)
+    parser.add_argument("--target", type=float, default=1.0, help="p99 latency budget in seconds")
+    parser.add_argument("--timeout", type=float, default=60)
+    args = parser.parse_args()
+
+    telegram = TelegramStub()
+    with tempfile.TemporaryDirectory() as tmp, ThreadedStub(telegram):
+        setup_django(
+            DATABASE_URL=f"sqlite:///{Path(tmp) / 'events.sqlite3'}",
+            TELEGRAM_BOT_TOKEN="123:events",
+            TELEGRAM_API_BASE_URL=telegram.base_url,
+            YOUGILE_WEBHOOK_SECRET=SECRET,
+        )
+
+        from django.core.management import call_command
+        from django.core.wsgi import get_wsgi_application
+
+        call_command("migrate", verbosity=0)
+        seed(args.events, args.chats)
+
+        server = make_server("127.0.0.1", 0, get_wsgi_application(), handler_class=QuietHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_port}/api/yougile/events/{SECRET}"
+        try:
+            post(url, {"event": "task-updated", "payload": {"id": "warmup"}})
+            sent_at = {}
+            started = time.perf_counter()
+            for i in range(args.events):
+                delay = started + i / args.rate - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                data = event(i, args.chats)
+                sent_at[i] = time.perf_counter()
+                post(url, data)
+                if args.duplicate_every and i % args.duplicate_every == 0:
+                    post(url, data)
+            replay_elapsed = time.perf_counter() - started
+
+            while len(telegram.sent) < args.events and time.perf_counter() - started < args.timeout:
+                time.sleep(0.01)
+        finally:
+            server.shutdown()
+
+        latencies = []
+        for (_, _, text), delivered_at in zip(list(telegram.sent), list(telegram.sent_at)):
+            match = TITLE.search(text)
+            if match:
+                latencies.append(delivered_at - sent_at[int(match.group(1))])
+        stats = summarize(latencies)
+        print(
+            f"replayed {args.events} events in {replay_elapsed:.2f}s ({args.events / replay_elapsed:.0f}/s), "
+            f"{len(latencies)}/{args.events} notifications delivered"
+        )
+        print(
+            f"event -> notification: p50={stats['p50_ms']:.1f}ms p95={stats['p95_ms']:.1f}ms "
+            f"p99={stats['p99_ms']:.1f}ms max={max(latencies, default=0) * 1000:.1f}ms"
+        )
+        ok = len(latencies) == args.events and stats["p99_ms"] <= args.target * 1000
+        print(f"{'PASS' if ok else 'FAIL'}: p99 budget {args.target * 1000:.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
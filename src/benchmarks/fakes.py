@@ -0,0 +1,104 @@
+import itertools
+import re
+from types import SimpleNamespace
+
+_message_ids = itertools.count(1)
+
+
+class FakeMessage:
+    def __init__(self, text, chat_id, entities=None):
+        self.text = text
+        self.chat_id = chat_id
+        self.entities = entities or []
+        self.caption = None
+        self.caption_entities = []
+        self.message_id = next(_message_ids)
+        self.photo = []
+        self.document = None
+        self.reply_to_message = None
+        self.replies = []
+
+    async def reply_text(self, text, **kwargs):
+        self.replies.append(text)
+        sent = SimpleNamespace(text=text, message_id=next(_message_ids), chat_id=self.chat_id)
+
+        async def edit_text(new_text, **edit_kwargs):
+            self.replies.append(new_text)
+            sent.text = new_text
+            return sent
+
+        sent.edit_text = edit_text
+        return sent
+
+
+def mention_update(bot_username, text, telegram_id, username=None, chat_id=None):
+    message_text = f"@{bot_username} {text}"
+    entities = [
+        SimpleNamespace(type="mention", offset=match.start(), length=match.end() - match.start())
+        for match in re.finditer(r"@\w+", message_text)
+    ]
+    message = FakeMessage(message_text, chat_id or telegram_id, entities)
+    user = SimpleNamespace(id=telegram_id, username=username, first_name=username or "user")
+    return SimpleNamespace(message=message, effective_user=user, effective_chat=SimpleNamespace(id=message.chat_id))
+
+
+def fake_context(bot_username, args=None):
+    return SimpleNamespace(bot=SimpleNamespace(username=bot_username), args=args or [])
+
+
+def update_payload(update_id, chat_id, user_id, text, username=None, bot_username="benchbot"):
+    entities = []
+    if text.startswith("/"):
+        entities.append({"type": "bot_command", "offset": 0, "length": len(text.split()[0])})
+    mention = f"@{bot_username}"
+    if mention in text:
+        entities.append({"type": "mention", "offset": text.index(mention), "length": len(mention)})
+    sender = {"id": user_id, "is_bot": False, "first_name": username or "user"}
+    if username:
+        sender["username"] = username
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": 0,
+            "chat": {"id": chat_id, "type": "group" if chat_id < 0 else "private"},
+            "from": sender,
+            "text": text,
+            "entities": entities,
+        },
+    }
+
+
+def callback_payload(update_id, chat_id, user_id, data, username=None, message_text=""):
+    sender = {"id": user_id, "is_bot": False, "first_name": username or "user"}
+    if username:
+        sender["username"] = username
+    return {
+        "update_id": update_id,
+        "callback_query": {
+            "id": str(update_id),
+            "from": sender,
+            "chat_instance": str(chat_id),
+            "data": data,
+            "message": {
+                "message_id": update_id,
+                "date": 0,
+                "chat": {"id": chat_id, "type": "group" if chat_id < 0 else "private"},
+                "text": message_text,
+            },
+        },
+    }
+
+
+class FakeBot:
+    def __init__(self):
+        self.sent = []
+        self.edited = {}
+
+    async def send_message(self, chat_id, text, **kwargs):
+        self.sent.append((chat_id, text))
+        return SimpleNamespace(chat_id=chat_id, text=text, message_id=next(_message_ids))
+
+    async def edit_message_text(self, text, chat_id=None, message_id=None, **kwargs):
+        self.edited[(chat_id, message_id)] = text
+        return SimpleNamespace(chat_id=chat_id, text=text, message_id=message_id)
@@ -0,0 +1,292 @@
+import asyncio
+import json
+import random
+import tempfile
+import threading
+import time
+from collections import namedtuple
+from pathlib import Path
+
+from asgiref.sync import sync_to_async
+
+from benchmarks import summarize
+from benchmarks.fakes import callback_payload, update_payload
+from benchmarks.stubs import TelegramStub, YougileStub
+
+BOT_USERNAME = "benchbot"
+BOT_TOKEN = "123:loadtest"
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+
+LoadProfile = namedtuple(
+    'LoadProfile',
+    'updates chats workers telegram_latency telegram_error_rate yougile_latency yougile_error_rate seed',
+    defaults=(500, 50, 8, 0.005, 0.0, 0.02, 0.0, 1),
+)
+
+SCENARIO_WEIGHTS = {
+    'mention': 50,
+    'batch': 5,
+    'start': 10,
+    'me': 10,
+    'callback': 10,
+    'chatter': 15,
+}
+
+HIGHER_IS_WORSE = ('p50_ms', 'p95_ms', 'p99_ms')
+COUNTERS = ('db_queries_per_update', 'http_calls_per_update')
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, execute, sql, params, many, context):
+        with self._lock:
+            self.count += 1
+        return execute(sql, params, many, context)
+
+    def attach(self, sender=None, connection=None, **kwargs):
+        if self not in connection.execute_wrappers:
+            connection.execute_wrappers.append(self)
+
+    def detach(self, connection):
+        if self in connection.execute_wrappers:
+            connection.execute_wrappers.remove(self)
+
+
+def harness_settings(profile, telegram, yougile):
+    return {
+        'TELEGRAM_API_BASE_URL': telegram.base_url,
+        'TELEGRAM_RATE_LIMIT_PER_SECOND': 1e6,
+        'TELEGRAM_RATE_LIMIT_BURST': 10 ** 6,
+        'TELEGRAM_CHAT_RATE_LIMIT_PER_SECOND': 1e6,
+        'TELEGRAM_GROUP_RATE_LIMIT_PER_MINUTE': 6e7,
+        'TELEGRAM_CHAT_RATE_LIMIT_BURST': 10 ** 6,
+        'YOUGILE_BASE_URL': yougile.base_url,
+        'YOUGILE_API_KEY': 'loadtest',
+        'YOUGILE_RATE_LIMIT_PER_MINUTE': 6e7,
+        'YOUGILE_RATE_LIMIT_BURST': 10 ** 6,
+        'YOUGILE_RETRY_BASE_DELAY': 0.01,
+        'YOUGILE_RETRY_MAX_DELAY': 0.1,
+        'YOUGILE_SYNC_INTERVAL': 0,
+        'YOUGILE_TASK_SYNC_INTERVAL': 0,
+        'BOT_CONCURRENT_UPDATES': profile.workers,
+        'BOT_METRICS_PORT': 0,
+        'OUTBOX_POLL_INTERVAL': 0.2,
+        'OUTBOX_RETRY_BASE_DELAY': 0.05,
+        'OUTBOX_RETRY_MAX_DELAY': 0.5,
+    }
+
+
+def seed_users(chats):
+    from app.internal.models.user import YouGileUser
+
+    YouGileUser.objects.bulk_create(
+        YouGileUser(
+            telegram_id=i,
+            telegram_username=f"user{i}",
+            yougile_id=f"yg-{i}",
+            yougile_email=f"user{i}@example.com",
+            default_project_id="project-1",
+            default_column_id="column-1",
+        )
+        for i in range(1, chats + 1)
+    )
+
+
+def build_payloads(profile):
+    rng = random.Random(profile.seed)
+    names = list(SCENARIO_WEIGHTS)
+    weights = list(SCENARIO_WEIGHTS.values())
+    payloads = []
+    for update_id in range(1, profile.updates + 1):
+        scenario = rng.choices(names, weights)[0]
+        user_id = rng.randint(1, profile.chats)
+        executor = rng.randint(1, profile.chats)
+        username = f"user{user_id}"
+        if scenario == 'mention':
+            text = f"@{BOT_USERNAME} Задача {update_id} - описание @user{executor}"
+            payload = update_payload(update_id, -user_id, user_id, text, username, BOT_USERNAME)
+        elif scenario == 'batch':
+            text = f"@{BOT_USERNAME}\n- Задача {update_id}.1\n- Задача {update_id}.2 @user{executor}\n- Задача {update_id}.3"
+            payload = update_payload(update_id, -user_id, user_id, text, username, BOT_USERNAME)
+        elif scenario == 'callback':
+            payload = callback_payload(update_id, user_id, user_id, "column:column-1", username)
+        elif scenario == 'chatter':
+            payload = update_payload(update_id, -user_id, user_id, f"обсуждаем релиз {update_id}", username, BOT_USERNAME)
+        else:
+            payload = update_payload(update_id, user_id, user_id, f"/{scenario}", username, BOT_USERNAME)
+        payloads.append((scenario, payload))
+    return payloads
+
+
+@sync_to_async(thread_sensitive=True)
+def outbox_pending():
+    from app.internal.models.task_outbox import TaskOutbox
+
+    return TaskOutbox.objects.filter(
+        status__in=(TaskOutbox.STATUS_PENDING, TaskOutbox.STATUS_PROCESSING)
+    ).exists()
+
+
+async def drive(profile, telegram, yougile, counter, drain_timeout):
+    from telegram import Update
+    from telegram.ext import TypeHandler
+
+    from app.internal.bot import TelegramBot
+    from app.internal.services.user_cache import UserCache
+    from app.internal.services.yougile_service import YougileService
+
+    YougileService._instance = None
+    YougileService._rate_limiter = None
+    UserCache.clear()
+
+    bot = TelegramBot(BOT_TOKEN)
+    application = bot.application
+    started_at = {}
+    latencies = {}
+    errors = []
+    done = asyncio.Event()
+
+    async def mark_started(update, context):
+        started_at[update.update_id] = time.perf_counter()
+
+    async def mark_done(update, context):
+        latencies[update.update_id] = time.perf_counter() - started_at[update.update_id]
+        if len(latencies) == profile.updates:
+            done.set()
+
+    async def record_error(update, context):
+        errors.append(repr(context.error))
+
+    application.add_handler(TypeHandler(Update, mark_started), group=-1)
+    application.add_handler(TypeHandler(Update, mark_done), group=99)
+    application.add_error_handler(record_error)
+
+    await application.initialize()
+    await bot.on_startup(application)
+    await application.start()
+
+    payloads = build_payloads(profile)
+    queries_before = counter.count
+    telegram_before = telegram.total_calls
+    yougile_before = yougile.requests
+    started = time.perf_counter()
+    for _, payload in payloads:
+        await application.update_queue.put(Update.de_json(payload, application.bot))
+    await done.wait()
+    handled = time.perf_counter() - started
+
+    polls = 0
+    deadline = time.perf_counter() + drain_timeout
+    while time.perf_counter() < deadline:
+        polls += 1
+        if not await outbox_pending():
+            break
+        await asyncio.sleep(0.05)
+    drained = time.perf_counter() - started
+    queries = counter.count - queries_before - polls
+    telegram_calls = telegram.total_calls - telegram_before
+    yougile_calls = yougile.requests - yougile_before
+
+    await application.stop()
+    await bot.on_shutdown(application)
+    await application.shutdown()
+
+    by_scenario = {}
+    for scenario, payload in payloads:
+        by_scenario.setdefault(scenario, []).append(latencies[payload['update_id']])
+    overall = summarize(list(latencies.values()))
+    return {
+        'profile': profile._asdict(),
+        'updates': profile.updates,
+        'handler_errors': len(errors),
+        'throughput_per_s': profile.updates / handled,
+        'handled_s': handled,
+        'drained_s': drained,
+        'p50_ms': overall['p50_ms'],
+        'p95_ms': overall['p95_ms'],
+        'p99_ms': overall['p99_ms'],
+        'scenarios': {
+            scenario: {key: value for key, value in summarize(samples).items() if key != 'mean_ms'}
+            for scenario, samples in sorted(by_scenario.items())
+        },
+        'db_queries_per_update': queries / profile.updates,
+        'http_calls_per_update': (telegram_calls + yougile_calls) / profile.updates,
+        'telegram_calls_per_update': telegram_calls / profile.updates,
+        'yougile_calls_per_update': yougile_calls / profile.updates,
+        'yougile_tasks': len(yougile.tasks),
+    }
+
+
+async def run_with_stubs(profile, counter, drain_timeout):
+    from django.test.utils import override_settings
+
+    telegram = await TelegramStub(
+        BOT_USERNAME, latency=profile.telegram_latency, error_rate=profile.telegram_error_rate
+    ).start()
+    yougile = await YougileStub(latency=profile.yougile_latency, error_rate=profile.yougile_error_rate).start()
+    try:
+        with override_settings(**harness_settings(profile, telegram, yougile)):
+            return await drive(profile, telegram, yougile, counter, drain_timeout)
+    finally:
+        await telegram.stop()
+        await yougile.stop()
+
+
+def run_load(profile, drain_timeout=60):
+    from django.db import connection
+    from django.db.backends.signals import connection_created
+
+    random.seed(profile.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        if connection.vendor == 'sqlite':
+            connection.settings_dict.setdefault('TEST', {})['NAME'] = str(Path(tmp) / 'loadtest.sqlite3')
+        old_name = connection.creation.create_test_db(verbosity=0, serialize=False)
+        counter = QueryCounter()
+        try:
+            seed_users(profile.chats)
+            connection_created.connect(counter.attach)
+            counter.attach(connection=connection)
+            return asyncio.run(run_with_stubs(profile, counter, drain_timeout))
+        finally:
+            connection_created.disconnect(counter.attach)
+            counter.detach(connection)
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+def compare(result, baseline, time_tolerance, count_tolerance):
+    regressions = []
+    if result['profile'] != baseline['profile']:
+        regressions.append("baseline was recorded with a different profile: %s" % baseline['profile'])
+        return regressions
+    if 'throughput_per_s' in baseline:
+        floor = baseline['throughput_per_s'] * (1 - time_tolerance)
+        if result['throughput_per_s'] < floor:
+            regressions.append(
+                "throughput_per_s %.1f < %.1f (baseline %.1f)" % (result['throughput_per_s'], floor, baseline['throughput_per_s'])
+            )
+    checks = [(key, time_tolerance) for key in HIGHER_IS_WORSE] + [(key, count_tolerance) for key in COUNTERS]
+    for key, tolerance in checks:
+        if key not in baseline:
+            continue
+        ceiling = baseline[key] * (1 + tolerance)
+        if result[key] > ceiling:
+            regressions.append("%s %.2f > %.2f (baseline %.2f)" % (key, result[key], ceiling, baseline[key]))
+    return regressions
+
+
+def load_baseline(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_baseline(path, result, counts_only=False):
+    if counts_only:
+        result = {key: result[key] for key in ('profile',) + COUNTERS}
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2, sort_keys=True)
+        f.write('\n')
@@ -0,0 +1,83 @@
+import argparse
+import asyncio
+import time
+
+from benchmarks import setup_django
+from benchmarks.fakes import FakeBot, fake_context, mention_update
+from benchmarks.stubs import YougileStub
+
+BOT_USERNAME = "benchbot"
+
+
+async def run(tasks):
+    from asgiref.sync import sync_to_async
+
+    from app.internal.models.task_outbox import TaskOutbox
+    from app.internal.services.http_client import HttpClient
+    from app.internal.services.yougile_service import YougileService
+    from app.internal.transport.bot.handlers import BotHandlers
+    from app.internal.transport.bot.outbox_worker import OutboxWorker
+    from benchmarks.user_queries import seed_users
+
+    await sync_to_async(seed_users)(1)
+    stub = await YougileStub().start()
+    stub.outage = True
+    YougileService.get_instance().base_url = stub.base_url
+    context = fake_context(BOT_USERNAME)
+
+    updates = []
+    started = time.perf_counter()
+    for i in range(tasks):
+        update = mention_update(BOT_USERNAME, f"Outbox task {i} - body", 1, "user1")
+        await BotHandlers.handle_mention(update, context)
+        updates.append(update)
+    reply_latency = (time.perf_counter() - started) / tasks
+
+    first_bot = FakeBot()
+    first_worker = OutboxWorker(first_bot)
+    await first_worker.drain()
+    await first_worker.stop()
+    pending = await TaskOutbox.objects.filter(status=TaskOutbox.STATUS_PENDING).acount()
+
+    stub.outage = False
+    second_bot = FakeBot()
+    second_worker = OutboxWorker(second_bot)
+    second_worker.start()
+    while await TaskOutbox.objects.exclude(status=TaskOutbox.STATUS_SENT).aexists():
+        await asyncio.sleep(0.05)
+    await second_worker.stop()
+
+    await HttpClient.close()
+    await stub.stop()
+    titles = [task["title"] for task in stub.tasks]
+    acknowledged = sum(1 for text in second_bot.edited.values() if text.startswith("Задача создана"))
+    return {
+        "reply_latency_ms": reply_latency * 1000,
+        "pending_after_outage": pending,
+        "outage_acks": len(first_bot.edited),
+        "created": len(set(titles)),
+        "duplicates": len(titles) - len(set(titles)),
+        "acknowledged": acknowledged,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Outbox delivery across a YouGile outage and a worker restart")
+    parser.add_argument("--tasks", type=int, default=50)
+    args = parser.parse_args()
+    setup_django(LOG_LEVEL="ERROR", OUTBOX_RETRY_BASE_DELAY=0.2, YOUGILE_MAX_RETRIES=1, YOUGILE_RETRY_BASE_DELAY=0.01)
+
+    from django.db import connection
+
+    connection.creation.create_test_db(verbosity=0)
+    stats = asyncio.run(run(args.tasks))
+    print(f"handler reply latency during outage: {stats['reply_latency_ms']:.2f}ms/message")
+    print(f"pending after outage: {stats['pending_after_outage']}/{args.tasks}, outage notices: {stats['outage_acks']}")
+    print(
+        f"after restart: created {stats['created']}/{args.tasks}, duplicates {stats['duplicates']}, "
+        f"replies edited {stats['acknowledged']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
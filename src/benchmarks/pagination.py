@@ -0,0 +1,81 @@
+import argparse
+import asyncio
+import time
+import tracemalloc
+from contextlib import aclosing
+
+from benchmarks import setup_django
+from benchmarks.stubs import ThreadedStub, YougileStub
+
+
+def make_users(count):
+    return [{"id": f"user-{i}", "email": f"employee{i}@example.com", "realName": f"Employee {i}"} for i in range(count)]
+
+
+async def full_scan(service, email):
+    result = await service.fetch_users()
+    for user in result["users"]:
+        if user["email"] == email:
+            return user["id"]
+    return None
+
+
+async def streamed_scan(service, email, work, prefetch):
+    async with aclosing(service.iter_pages("/users", prefetch=prefetch)) as pages:
+        async for page in pages:
+            if work:
+                await asyncio.sleep(work)
+            for user in page:
+                if user["email"] == email:
+                    return user["id"]
+    return None
+
+
+async def measure(scan, *args):
+    from app.internal.services.http_client import HttpClient
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    user_id = await scan(*args)
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    await HttpClient.close()
+    return user_id, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming YouGile pagination vs. loading the whole list")
+    parser.add_argument("--users", type=int, default=50000)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.02, help="stub latency per page, seconds")
+    parser.add_argument("--work", type=float, default=0.01, help="consumer work per page, seconds")
+    args = parser.parse_args()
+    setup_django(YOUGILE_PAGE_SIZE=args.page_size)
+
+    from app.internal.services.yougile_service import YougileService
+
+    stub = YougileStub(latency=args.latency, users=make_users(args.users))
+    with ThreadedStub(stub):
+        service = YougileService.get_instance()
+        service.base_url = stub.base_url
+        print(f"{args.users} users, page size {args.page_size}, {args.latency * 1000:.0f}ms per page")
+        for position in (0.01, 0.5, 0.99):
+            index = int(args.users * position)
+            email = f"employee{index}@example.com"
+            runs = (
+                ("full list", full_scan, (service, email)),
+                ("stream", streamed_scan, (service, email, args.work, False)),
+                ("stream+prefetch", streamed_scan, (service, email, args.work, True)),
+            )
+            print(f"match at position {index}:")
+            for name, scan, scan_args in runs:
+                stub.requests = 0
+                user_id, elapsed, peak = asyncio.run(measure(scan, *scan_args))
+                assert user_id == f"user-{index}"
+                print(f"  {name:>16}: {elapsed * 1000:8.1f}ms to match, peak {peak / 1024 / 1024:6.1f} MiB, "
+                      f"{stub.requests} pages requested")
+
+
+if __name__ == "__main__":
+    main()
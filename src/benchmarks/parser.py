@@ -0,0 +1,102 @@
+import argparse
+import random
+import re
+import time
+from types import SimpleNamespace
+
+from benchmarks import setup_django
+
+BOT_USERNAME = "benchbot"
+WORDS = "fix deploy review login page release bug report meeting notes api task please check today".split()
+
+
+def mention_entities(text):
+    return [SimpleNamespace(type="mention", offset=m.start(), length=m.end() - m.start()) for m in re.finditer(r"@\w+", text)]
+
+
+def build_corpus(size, mention_ratio, seed=1):
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        words = rng.choices(WORDS, k=rng.randint(3, 25))
+        roll = rng.random()
+        if roll < mention_ratio:
+            lines = [f"{' '.join(words[:4])} - {' '.join(words[4:])} @user{rng.randint(1, 50)}"]
+            if rng.random() < 0.2:
+                lines += [f"- {rng.choice(WORDS)} task @user{rng.randint(1, 50)}" for _ in range(rng.randint(1, 5))]
+            text = f"@{BOT_USERNAME} " + "\n".join(lines)
+        elif roll < mention_ratio + 0.1:
+            text = f"@user{rng.randint(1, 50)} {' '.join(words)}"
+        else:
+            text = " ".join(words)
+        corpus.append((text, mention_entities(text)))
+    return corpus
+
+
+def legacy_parse(message_text, message_entities, bot_username):
+    bot_mentioned = False
+    for entity in message_entities:
+        if entity.type == "mention":
+            mention = message_text[entity.offset:entity.offset + entity.length]
+            if mention.lower() == f"@{bot_username}".lower():
+                bot_mentioned = True
+                task_text = message_text[:entity.offset] + message_text[entity.offset + entity.length:]
+                task_text = task_text.strip()
+                break
+    if not bot_mentioned:
+        if f"@{bot_username}" not in message_text:
+            return None
+        task_text = message_text.replace(f"@{bot_username}", "").strip()
+    executor_username = None
+    all_mentions = re.findall(r'@(\w+)', task_text)
+    if all_mentions:
+        executor_username = all_mentions[-1]
+        task_text = task_text.replace(f"@{executor_username}", "").strip()
+    parts = task_text.split(' - ', 1)
+    return parts[0], parts[1] if len(parts) > 1 else None, executor_username
+
+
+def new_parse(message_text, message_entities, bot_username):
+    if not mentions_bot(message_text, bot_username):
+        return None
+    return parse_tasks(message_text, message_entities, bot_username)
+
+
+def measure(parse, corpus):
+    started = time.perf_counter()
+    matched = 0
+    for text, entities in corpus:
+        if parse(text, entities, BOT_USERNAME) is not None:
+            matched += 1
+    return time.perf_counter() - started, matched
+
+
+def report(name, corpus, elapsed, matched):
+    per_message = elapsed / len(corpus) * 1e9 if corpus else 0
+    print(f"  {name:>7}: {elapsed:.3f}s ({per_message:.0f} ns/message), {matched} parsed")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mention parser micro-benchmark")
+    parser.add_argument("--messages", type=int, default=1_000_000)
+    parser.add_argument("--mention-ratio", type=float, default=0.02)
+    args = parser.parse_args()
+    setup_django()
+
+    global mentions_bot, parse_tasks
+    from app.internal.transport.bot.parser import mentions_bot, parse_tasks
+
+    corpus = build_corpus(args.messages, args.mention_ratio)
+    groups = {
+        "all messages": corpus,
+        "bot mentions": [item for item in corpus if f"@{BOT_USERNAME}" in item[0]],
+        "other chatter": [item for item in corpus if f"@{BOT_USERNAME}" not in item[0]],
+    }
+    for group, items in groups.items():
+        print(f"{group} ({len(items)}):")
+        for name, parse in (("legacy", legacy_parse), ("parser", new_parse)):
+            report(name, items, *measure(parse, items))
+
+
+if __name__ == "__main__":
+    main()
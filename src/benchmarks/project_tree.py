@@ -0,0 +1,95 @@
+import argparse
+import asyncio
+import time
+
+from benchmarks import setup_django, summarize
+from benchmarks.stubs import YougileStub
+
+
+def make_tree(projects, boards_per_project, columns_per_board):
+    project_items, board_items, column_items = [], [], []
+    for p in range(projects):
+        project_items.append({"id": f"project-{p}", "title": f"Project {p:04d}"})
+        for b in range(boards_per_project):
+            board_id = f"board-{p}-{b}"
+            board_items.append({"id": board_id, "title": f"Board {b}", "projectId": f"project-{p}"})
+            for c in range(columns_per_board):
+                column_items.append({"id": f"column-{p}-{b}-{c}", "title": f"Column {c}", "boardId": board_id})
+    return project_items, board_items, column_items
+
+
+async def run(args):
+    from app.internal.services.http_client import HttpClient
+    from app.internal.services.yougile_service import YougileService
+    from app.internal.transport.bot.keyboards import projects_keyboard
+
+    projects, boards, columns = make_tree(args.projects, args.boards, args.columns)
+    stub = await YougileStub(latency=args.latency, projects=projects, boards=boards, columns=columns).start()
+    service = YougileService.get_instance()
+    service.base_url = stub.base_url
+    tree = service.project_tree
+
+    started = time.perf_counter()
+    assert await tree.refresh(force=True)
+    build = time.perf_counter() - started
+    build_requests = stub.requests
+
+    targets = [f"project-{(i * 37) % args.projects}" for i in range(args.commands)]
+
+    stub.requests = 0
+    per_command_fetch = []
+    for project_id in targets:
+        started = time.perf_counter()
+        fetched = [column async for column in service.iter_columns(project_id)]
+        per_command_fetch.append(time.perf_counter() - started)
+        assert fetched
+    fetch_requests = stub.requests
+
+    stub.requests = 0
+    tree_lookup = []
+    for project_id in targets:
+        started = time.perf_counter()
+        assert await service.get_project_columns(project_id)
+        assert await service.resolve_column_id(project_id=project_id)
+        tree_lookup.append(time.perf_counter() - started)
+    lookup_requests = stub.requests
+
+    keyboard = []
+    pages = (args.projects + 7) // 8
+    for page in range(pages):
+        started = time.perf_counter()
+        projects_keyboard(tree, page)
+        keyboard.append(time.perf_counter() - started)
+
+    await stub.stop()
+    await HttpClient.close()
+    return {
+        "build": (build, build_requests),
+        "fetch per command": (summarize(per_command_fetch), fetch_requests),
+        "tree lookup": (summarize(tree_lookup), lookup_requests),
+        "projects keyboard page": (summarize(keyboard), 0),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Project -> board -> column index vs. fetching columns per command")
+    parser.add_argument("--projects", type=int, default=300)
+    parser.add_argument("--boards", type=int, default=3)
+    parser.add_argument("--columns", type=int, default=6)
+    parser.add_argument("--commands", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+    setup_django(YOUGILE_PAGE_SIZE=1000)
+
+    results = asyncio.run(run(args))
+    build, build_requests = results.pop("build")
+    print(f"{args.projects} projects x {args.boards} boards x {args.columns} columns, "
+          f"{args.latency * 1000:.0f}ms per request")
+    print(f"{'tree build':>22}: {build * 1000:.1f}ms, {build_requests} requests")
+    for name, (stats, requests) in results.items():
+        print(f"{name:>22}: p50={stats['p50_ms']:.3f}ms p99={stats['p99_ms']:.3f}ms, "
+              f"{requests} requests for {stats['count']} calls")
+
+
+if __name__ == "__main__":
+    main()
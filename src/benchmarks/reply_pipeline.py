@@ -0,0 +1,94 @@
+import argparse
+import asyncio
+import time
+
+from benchmarks import setup_django
+from benchmarks.concurrency import BOT_USERNAME, seed_users
+from benchmarks.fakes import update_payload
+from benchmarks.stubs import TelegramStub, YougileStub
+
+GOVERNED = {
+    "TELEGRAM_RATE_LIMIT_PER_SECOND": 25,
+    "TELEGRAM_RATE_LIMIT_BURST": 1,
+    "TELEGRAM_GROUP_RATE_LIMIT_PER_MINUTE": 100,
+    "TELEGRAM_CHAT_RATE_LIMIT_BURST": 1,
+}
+UNLIMITED = {
+    "TELEGRAM_RATE_LIMIT_PER_SECOND": 10 ** 6,
+    "TELEGRAM_RATE_LIMIT_BURST": 10 ** 6,
+    "TELEGRAM_GROUP_RATE_LIMIT_PER_MINUTE": 10 ** 8,
+    "TELEGRAM_CHAT_RATE_LIMIT_BURST": 10 ** 6,
+}
+
+
+async def replay(updates, chats, limits, chat_rps, global_rps):
+    from django.conf import settings
+    from telegram import Update
+
+    from app.internal.bot import TelegramBot
+    from app.internal.services.user_cache import UserCache
+    from app.internal.services.yougile_service import YougileService
+
+    for name, value in limits.items():
+        setattr(settings, name, value)
+    telegram = await TelegramStub(BOT_USERNAME, chat_rps=chat_rps, global_rps=global_rps).start()
+    yougile = await YougileStub().start()
+    YougileService.get_instance().base_url = yougile.base_url
+    settings.TELEGRAM_API_BASE_URL = telegram.base_url
+    UserCache.clear()
+    await seed_users(chats)
+
+    bot = TelegramBot("123:benchmark")
+    application = bot.application
+    await application.initialize()
+    await bot.on_startup(application)
+    await application.start()
+
+    started = time.perf_counter()
+    for i in range(updates):
+        chat = i % chats + 1
+        executor = f"user{(chat % chats) + 1}"
+        text = f"@{BOT_USERNAME} Task {chat}-{i // chats} - body @{executor}"
+        payload = update_payload(i + 1, -chat, chat, text, username=f"user{chat}", bot_username=BOT_USERNAME)
+        await application.update_queue.put(Update.de_json(payload, application.bot))
+    while sum(1 for method, _, _ in telegram.sent if method == "editMessageText") < updates:
+        await asyncio.sleep(0.01)
+    elapsed = time.perf_counter() - started
+
+    await application.stop()
+    await bot.on_shutdown(application)
+    await application.shutdown()
+    await telegram.stop()
+    await yougile.stop()
+    delivered = len(telegram.sent)
+    return delivered, telegram.calls.get("sendMessage", 0) + telegram.calls.get("editMessageText", 0), \
+        telegram.flood_waits, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bot API requests per handled mention and flood-limit behaviour")
+    parser.add_argument("--updates", type=int, default=100)
+    parser.add_argument("--chats", type=int, default=20)
+    parser.add_argument("--chat-rps", type=int, default=2, help="per-chat limit enforced by the fake Bot API")
+    parser.add_argument("--global-rps", type=int, default=30, help="global limit enforced by the fake Bot API")
+    args = parser.parse_args()
+    setup_django()
+
+    from django.db import connection
+
+    connection.creation.create_test_db(verbosity=0)
+
+    delivered, requests, _, _ = asyncio.run(replay(args.updates, args.chats, UNLIMITED, None, None))
+    print(f"{args.updates} mentions with an executor: {delivered} messages sent or edited, "
+          f"{delivered / args.updates:.2f} Bot API calls per handled message")
+    print(f"fake Bot API limits: {args.chat_rps}/s per chat, {args.global_rps}/s global")
+    for name, limits in (("reactive (429 retry)", UNLIMITED), ("governed", GOVERNED)):
+        delivered, requests, flood_waits, elapsed = asyncio.run(
+            replay(args.updates, args.chats, limits, args.chat_rps, args.global_rps)
+        )
+        print(f"{name:>20}: {elapsed:6.2f}s, {requests} requests for {delivered} deliveries, "
+              f"{flood_waits} flood waits (429)")
+
+
+if __name__ == "__main__":
+    main()
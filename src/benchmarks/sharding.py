@@ -0,0 +1,130 @@
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks import setup_django
+from benchmarks.fakes import update_payload
+from benchmarks.stubs import TelegramStub, ThreadedStub, YougileStub
+
+SRC_DIR = Path(__file__).resolve().parent.parent
+TITLE = re.compile(r"^Chat (-?\d+) #(\d+)$")
+
+
+def seed_users(chats):
+    from app.internal.models.user import YouGileUser
+
+    YouGileUser.objects.all().delete()
+    YouGileUser.objects.bulk_create(
+        YouGileUser(
+            telegram_id=i,
+            telegram_username=f"user{i}",
+            yougile_id=f"yg-{i}",
+            yougile_email=f"user{i}@example.com",
+            default_column_id="column-1",
+        )
+        for i in range(1, chats + 1)
+    )
+
+
+def ordering_violations(tasks):
+    last = {}
+    violations = 0
+    for task in tasks:
+        match = TITLE.match(task["title"])
+        if not match:
+            continue
+        chat, seq = match.group(1), int(match.group(2))
+        if seq < last.get(chat, -1):
+            violations += 1
+        last[chat] = seq
+    return violations
+
+
+def replay(workers, updates, chats, yougile_latency, env, timeout):
+    telegram = TelegramStub()
+    yougile = YougileStub(latency=yougile_latency)
+    with ThreadedStub(telegram), ThreadedStub(yougile):
+        sequence = {}
+        for update_id in range(1, updates + 1):
+            user_id = update_id % chats + 1
+            seq = sequence[user_id] = sequence.get(user_id, -1) + 1
+            text = f"@{telegram.bot_username} Chat {-user_id} #{seq}"
+            telegram.updates.append(update_payload(update_id, -user_id, user_id, text, f"user{user_id}"))
+
+        env = dict(env, TELEGRAM_API_BASE_URL=telegram.base_url, YOUGILE_BASE_URL=yougile.base_url)
+        started = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, "manage.py", "runbot", "--workers", str(workers)],
+            env=env, cwd=SRC_DIR, stdout=subprocess.DEVNULL,
+        )
+        try:
+            while len(yougile.tasks) < updates:
+                if process.poll() is not None:
+                    raise RuntimeError(f"runbot exited with code {process.returncode}")
+                if time.perf_counter() - started > timeout:
+                    raise TimeoutError(f"{len(yougile.tasks)}/{updates} tasks created within {timeout}s")
+                time.sleep(0.01)
+            elapsed = time.perf_counter() - started
+        finally:
+            process.terminate()
+            process.wait()
+        steady = (yougile.tasks[-1]["timestamp"] - yougile.tasks[0]["timestamp"]) / 1000
+        return elapsed, steady, ordering_violations(yougile.tasks)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="runbot --workers N scaling on a synthetic mention replay")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--updates", type=int, default=2000)
+    parser.add_argument("--chats", type=int, default=200)
+    parser.add_argument("--yougile-latency", type=float, default=0.02)
+    parser.add_argument("--timeout", type=float, default=300)
+    args = parser.parse_args()
+    print(f"{os.cpu_count()} CPUs")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(
+            os.environ,
+            DJANGO_SECRET_KEY="benchmark",
+            DATABASE_URL=f"sqlite:///{tmp}/sharding.sqlite3",
+            CACHE_URL=f"filecache://{tmp}/cache",
+            TELEGRAM_BOT_TOKEN="123:sharding",
+            YOUGILE_API_KEY="benchmark-key",
+            YOUGILE_RATE_LIMIT_PER_MINUTE="60000000",
+            YOUGILE_RATE_LIMIT_BURST="1000000",
+            TELEGRAM_RATE_LIMIT_PER_SECOND="1000000",
+            TELEGRAM_RATE_LIMIT_BURST="1000000",
+            TELEGRAM_CHAT_RATE_LIMIT_PER_SECOND="1000000",
+            TELEGRAM_GROUP_RATE_LIMIT_PER_MINUTE="60000000",
+            TELEGRAM_CHAT_RATE_LIMIT_BURST="1000000",
+            OUTBOX_POLL_INTERVAL="0.2",
+            BOT_POLL_TIMEOUT="1",
+            LOG_LEVEL="WARNING",
+        )
+        env.pop("DJANGO_SETTINGS_MODULE", None)
+        setup_django(DATABASE_URL=env["DATABASE_URL"], CACHE_URL=env["CACHE_URL"])
+
+        from django.core.management import call_command
+
+        call_command("migrate", verbosity=0)
+        baseline = None
+        for workers in args.workers:
+            seed_users(args.chats)
+            elapsed, steady, violations = replay(
+                workers, args.updates, args.chats, args.yougile_latency, env, args.timeout
+            )
+            rate = (args.updates - 1) / steady
+            baseline = baseline or rate
+            print(
+                f"workers={workers}: {rate:8.1f} updates/s ({rate / baseline:.2f}x) first to last task, "
+                f"{elapsed:.2f}s incl. startup, per-chat order violations: {violations}"
+            )
+
+
+if __name__ == "__main__":
+    main()
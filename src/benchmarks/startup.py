@@ -0,0 +1,88 @@
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.fakes import update_payload
+from benchmarks.stubs import TelegramStub, ThreadedStub, YougileStub
+
+SRC_DIR = Path(__file__).resolve().parent.parent
+IMPORT_SNIPPET = "import django; django.setup(); import app.internal.bot"
+
+
+def import_profile(settings_module, top):
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings_module, DJANGO_SECRET_KEY="benchmark")
+    command = [sys.executable, "-X", "importtime", "-c", IMPORT_SNIPPET]
+    stderr = subprocess.run(command, env=env, cwd=SRC_DIR, check=True, capture_output=True, text=True).stderr
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name.startswith("  "):
+            modules.append((int(cumulative), name.strip()))
+    modules.sort(reverse=True)
+    return sum(cumulative for cumulative, _ in modules) / 1e6, modules[:top]
+
+
+def first_update_latency(settings_module, timeout):
+    telegram, yougile = TelegramStub(), YougileStub()
+    with tempfile.TemporaryDirectory() as tmp, ThreadedStub(telegram), ThreadedStub(yougile):
+        env = dict(
+            os.environ,
+            DJANGO_SECRET_KEY="benchmark",
+            DATABASE_URL=f"sqlite:///{tmp}/startup.sqlite3",
+            TELEGRAM_BOT_TOKEN="123:startup",
+            TELEGRAM_API_BASE_URL=telegram.base_url,
+            YOUGILE_API_KEY="benchmark-key",
+            YOUGILE_BASE_URL=yougile.base_url,
+            LOG_LEVEL="WARNING",
+        )
+        env.pop("DJANGO_SETTINGS_MODULE", None)
+        manage = [sys.executable, "manage.py"]
+        subprocess.run(manage + ["migrate", "--verbosity", "0"], env=env, cwd=SRC_DIR, check=True)
+        telegram.updates.append(update_payload(1, 1, 1, "/start", username="user1", bot_username=telegram.bot_username))
+
+        env["DJANGO_SETTINGS_MODULE"] = settings_module
+        started = time.perf_counter()
+        process = subprocess.Popen(manage + ["runbot"], env=env, cwd=SRC_DIR, stdout=subprocess.DEVNULL)
+        try:
+            while not telegram.sent:
+                if process.poll() is not None:
+                    raise RuntimeError(f"runbot exited with code {process.returncode}")
+                if time.perf_counter() - started > timeout:
+                    raise TimeoutError(f"no reply within {timeout}s")
+                time.sleep(0.005)
+            return time.perf_counter() - started
+        finally:
+            process.terminate()
+            process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="runbot import time and cold start to first handled update")
+    parser.add_argument("--settings", nargs="+", default=["config.settings", "config.settings_bot"])
+    parser.add_argument("--top", type=int, default=10, help="Slowest top-level imports to list")
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--target", type=float, default=None, help="Fail if cold start to first update exceeds this, s")
+    args = parser.parse_args()
+
+    failed = False
+    for settings_module in args.settings:
+        total, slowest = import_profile(settings_module, args.top)
+        first_update = first_update_latency(settings_module, args.timeout)
+        print(f"{settings_module}: imports {total * 1000:.0f}ms, first update handled after {first_update:.2f}s")
+        for cumulative, name in slowest:
+            print(f"  {cumulative / 1000:8.1f}ms  {name}")
+        if args.target is not None and first_update > args.target:
+            print(f"  over target: {first_update:.2f}s > {args.target:.2f}s")
+            failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+import asyncio
+import itertools
+import random
+import threading
+import time
+
+from aiohttp import web
+
+
+class ThreadedStub:
+    def __init__(self, stub):
+        self.stub = stub
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self.stub.start(), self.loop).result()
+        return self.stub
+
+    def __exit__(self, *exc_info):
+        asyncio.run_coroutine_threadsafe(self.stub.stop(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+
+
+class YougileStub:
+    def __init__(self, latency=0.0, users=None, columns=None, max_rps=None, error_rate=0.0, retry_after=1,
+                 projects=None, boards=None):
+        self.latency = latency
+        self.max_rps = max_rps
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.throttled = 0
+        self.errors = 0
+        self.outage = False
+        self._window = (0, 0)
+        self.users = users or []
+        self.projects = projects or [{"id": "project-1", "title": "Project"}]
+        self.boards = boards or [{"id": "board-1", "title": "Board", "projectId": "project-1"}]
+        self.columns = columns or [{"id": "column-1", "title": "Backlog", "boardId": "board-1"}]
+        self.requests = 0
+        self.tasks = []
+        self.uploads = []
+        self.messages = []
+        self._task_ids = itertools.count(1)
+        self._runner = None
+        self.port = None
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.port}/api-v2"
+
+    async def _delay(self):
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    def _throttle(self):
+        if not self.max_rps:
+            return None
+        second = int(time.monotonic())
+        window, count = self._window
+        count = count + 1 if window == second else 1
+        self._window = (second, count)
+        if count > self.max_rps:
+            self.throttled += 1
+            return web.json_response({"error": "Too Many Requests"}, status=429, headers={"Retry-After": str(self.retry_after)})
+        return None
+
+    async def create_task(self, request):
+        if self.outage:
+            self.errors += 1
+            return web.json_response({"error": "Service Unavailable"}, status=503)
+        throttled = self._throttle()
+        if throttled is not None:
+            return throttled
+        payload = await request.json()
+        task_id = f"task-{next(self._task_ids)}"
+        self.tasks.append(dict(payload, id=task_id, timestamp=int(time.time() * 1000)))
+        await self._delay()
+        if self.error_rate and random.random() < self.error_rate:
+            self.errors += 1
+            return web.json_response({"error": "Internal Server Error"}, status=502)
+        return web.json_response({"id": task_id}, status=201)
+
+    async def list_tasks(self, request):
+        await self._delay()
+        title = request.query.get("title")
+        column_id = request.query.get("columnId")
+        tasks = [
+            task for task in self.tasks
+            if (title is None or task["title"] == title) and (column_id is None or task["columnId"] == column_id)
+        ]
+        return web.json_response(self._page(request, tasks))
+
+    async def get_task(self, request):
+        await self._delay()
+        task_id = request.match_info["task_id"]
+        task = next((task for task in self.tasks if task["id"] == task_id), None)
+        if task is None:
+            return web.json_response({"error": "Not Found"}, status=404)
+        return web.json_response(task)
+
+    @staticmethod
+    def _page(request, items):
+        limit = int(request.query.get("limit", 1000))
+        offset = int(request.query.get("offset", 0))
+        content = items[offset:offset + limit]
+        paging = {"count": len(items), "limit": limit, "offset": offset, "next": offset + limit < len(items)}
+        return {"paging": paging, "content": content}
+
+    @staticmethod
+    def _filter(request, items, field):
+        value = request.query.get(field)
+        if value is None:
+            return items
+        return [item for item in items if item.get(field) == value]
+
+    async def list_projects(self, request):
+        await self._delay()
+        return web.json_response(self._page(request, self.projects))
+
+    async def list_boards(self, request):
+        await self._delay()
+        return web.json_response(self._page(request, self._filter(request, self.boards, "projectId")))
+
+    async def list_columns(self, request):
+        await self._delay()
+        return web.json_response(self._page(request, self._filter(request, self.columns, "boardId")))
+
+    async def list_users(self, request):
+        await self._delay()
+        etag = f'"users-{len(self.users)}"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.json_response(self._page(request, self.users), headers={"ETag": etag})
+
+    async def upload_file(self, request):
+        await self._delay()
+        reader = await request.multipart()
+        part = await reader.next()
+        size = 0
+        while chunk := await part.read_chunk():
+            size += len(chunk)
+        self.uploads.append({"filename": part.filename, "content_type": part.headers.get("Content-Type"), "size": size})
+        return web.json_response({"result": "ok", "url": f"/user-data/{len(self.uploads)}/{part.filename}"})
+
+    async def post_message(self, request):
+        await self._delay()
+        payload = await request.json()
+        self.messages.append(dict(payload, chatId=request.match_info["chat_id"]))
+        return web.json_response({"id": len(self.messages)}, status=201)
+
+    def make_app(self):
+        app = web.Application()
+        app.router.add_post("/api-v2/tasks", self.create_task)
+        app.router.add_post("/api-v2/upload-file", self.upload_file)
+        app.router.add_post("/api-v2/chats/{chat_id}/messages", self.post_message)
+        app.router.add_get("/api-v2/task-list", self.list_tasks)
+        app.router.add_get("/api-v2/tasks/{task_id}", self.get_task)
+        app.router.add_get("/api-v2/projects", self.list_projects)
+        app.router.add_get("/api-v2/boards", self.list_boards)
+        app.router.add_get("/api-v2/columns", self.list_columns)
+        app.router.add_get("/api-v2/users", self.list_users)
+        return app
+
+    async def start(self):
+        self._runner = web.AppRunner(self.make_app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        if self._runner:
+            await self._runner.cleanup()
+
+
+class TelegramStub:
+    def __init__(self, bot_username="benchbot", latency=0.0, chat_rps=None, global_rps=None, retry_after=1,
+                 error_rate=0.0):
+        self.bot_username = bot_username
+        self.latency = latency
+        self.error_rate = error_rate
+        self.errors = 0
+        self.chat_rps = chat_rps
+        self.global_rps = global_rps
+        self.retry_after = retry_after
+        self.flood_waits = 0
+        self._windows = {}
+        self.calls = {}
+        self.sent = []
+        self.sent_at = []
+        self.updates = []
+        self.files = {}
+        self._message_ids = itertools.count(1)
+        self._runner = None
+        self.port = None
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.port}/bot"
+
+    @property
+    def file_url(self):
+        return f"http://127.0.0.1:{self.port}/file/bot"
+
+    @property
+    def total_calls(self):
+        return sum(self.calls.values())
+
+    async def _params(self, request):
+        if request.content_type == "application/json":
+            return await request.json()
+        return dict(await request.post())
+
+    def _message(self, params):
+        chat_id = int(params.get("chat_id", 0))
+        return {
+            "message_id": int(params.get("message_id") or next(self._message_ids)),
+            "date": 0,
+            "chat": {"id": chat_id, "type": "private"},
+            "text": params.get("text", ""),
+        }
+
+    def _over_limit(self, key, limit):
+        second = int(time.monotonic())
+        window, count = self._windows.get(key, (second, 0))
+        count = count + 1 if window == second else 1
+        self._windows[key] = (second, count)
+        return limit is not None and count > limit
+
+    def _flood(self, params):
+        chat_id = params.get("chat_id")
+        over_global = self._over_limit(None, self.global_rps)
+        over_chat = chat_id is not None and self._over_limit(str(chat_id), self.chat_rps)
+        if not (over_global or over_chat):
+            return None
+        self.flood_waits += 1
+        return web.json_response({
+            "ok": False,
+            "error_code": 429,
+            "description": f"Too Many Requests: retry after {self.retry_after}",
+            "parameters": {"retry_after": self.retry_after},
+        }, status=429)
+
+    async def handle(self, request):
+        method = request.match_info["method"]
+        self.calls[method] = self.calls.get(method, 0) + 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        params = await self._params(request)
+        if method in ("sendMessage", "editMessageText"):
+            flooded = self._flood(params)
+            if flooded is not None:
+                return flooded
+        if method != "getMe" and self.error_rate and random.random() < self.error_rate:
+            self.errors += 1
+            return web.json_response({"ok": False, "error_code": 502, "description": "Bad Gateway"}, status=502)
+        if method == "getMe":
+            result = {"id": 1, "is_bot": True, "first_name": "Bench", "username": self.bot_username}
+        elif method == "getUpdates":
+            if not self.updates:
+                await asyncio.sleep(0.05)
+            limit = int(params.get("limit") or 100)
+            result, self.updates = self.updates[:limit], self.updates[limit:]
+        elif method == "getFile":
+            file_id = params["file_id"]
+            result = {
+                "file_id": file_id, "file_unique_id": file_id,
+                "file_size": self.files.get(file_id, 0), "file_path": f"documents/{file_id}",
+            }
+        elif method in ("sendMessage", "editMessageText"):
+            result = self._message(params)
+            self.sent.append((method, result["chat"]["id"], result["text"]))
+            self.sent_at.append(time.perf_counter())
+        else:
+            result = True
+        return web.json_response({"ok": True, "result": result})
+
+    async def download(self, request):
+        size = self.files.get(request.match_info["path"].rpartition("/")[2])
+        if size is None:
+            return web.Response(status=404)
+        response = web.StreamResponse()
+        response.content_length = size
+        await response.prepare(request)
+        chunk = bytes(range(256)) * 256
+        remaining = size
+        while remaining:
+            data = chunk[:remaining]
+            await response.write(data)
+            remaining -= len(data)
+        await response.write_eof()
+        return response
+
+    def make_app(self):
+        app = web.Application()
+        app.router.add_post("/bot{token}/{method}", self.handle)
+        app.router.add_get("/file/bot{token}/{path:.+}", self.download)
+        return app
+
+    async def start(self):
+        self._runner = web.AppRunner(self.make_app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        if self._runner:
+            await self._runner.cleanup()
@@ -0,0 +1,104 @@
+import argparse
+import time
+from datetime import timedelta
+
+from asgiref.sync import async_to_sync
+
+from benchmarks import setup_django, summarize
+from benchmarks.stubs import ThreadedStub, YougileStub
+
+
+def seed_tasks(count, creators, stub=None):
+    from django.utils import timezone
+
+    from app.internal.models.task_record import TaskRecord
+
+    now = timezone.now()
+    records = []
+    for i in range(count):
+        creator = i % creators + 1
+        records.append(TaskRecord(
+            yougile_id=f"task-{i + 1}",
+            telegram_id=creator,
+            chat_id=-creator,
+            title=f"Task {i}",
+            column_id="column-1",
+            executor_id=f"yg-{(i + 1) % creators + 1}",
+            created_at=now - timedelta(seconds=count - i),
+        ))
+        if stub is not None:
+            stub.tasks.append({"id": f"task-{i + 1}", "title": f"Task {i}", "columnId": "column-1",
+                               "completed": i % 10 == 0, "assigned": [f"yg-{(i + 1) % creators + 1}"]})
+    TaskRecord.objects.bulk_create(records, batch_size=5000)
+
+
+def measure(call, pages):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    samples = []
+    queries = []
+    for _ in range(pages):
+        cursor = None
+        while True:
+            started = time.perf_counter()
+            with CaptureQueriesContext(connection) as captured:
+                records, cursor = async_to_sync(call)(cursor)
+            samples.append(time.perf_counter() - started)
+            queries.append(len(captured.captured_queries))
+            if cursor is None:
+                break
+    return samples, queries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/my_tasks and /assigned keyset pages and incremental status sync")
+    parser.add_argument("--tasks", type=int, default=100000)
+    parser.add_argument("--creators", type=int, default=100)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--sync-batch", type=int, default=200)
+    args = parser.parse_args()
+    setup_django(YOUGILE_PAGE_SIZE=1000)
+
+    from django.db import connection
+
+    from app.internal.models.task_record import TaskRecord
+    from app.internal.services.http_client import HttpClient
+    from app.internal.services.task_service import TaskService
+    from app.internal.services.yougile_service import YougileService
+
+    connection.creation.create_test_db(verbosity=0)
+    with ThreadedStub(YougileStub()) as stub:
+        seed_tasks(args.tasks, args.creators, stub)
+        YougileService.get_instance().base_url = stub.base_url
+
+        print(TaskRecord.objects.filter(telegram_id=1).order_by('-created_at', '-id')[:args.page_size].explain())
+        for name, call in (
+            ("my_tasks", lambda cursor: TaskService.list_created(1, cursor, args.page_size)),
+            ("assigned", lambda cursor: TaskService.list_assigned("yg-1", cursor, args.page_size)),
+        ):
+            samples, queries = measure(call, args.rounds)
+            stats = summarize(samples)
+            print(
+                f"{name:>9}: {len(samples)} pages of {args.page_size}, max {max(queries)} queries/page, "
+                f"p50={stats['p50_ms']:.2f}ms p99={stats['p99_ms']:.2f}ms"
+            )
+
+        async def sync():
+            try:
+                return await TaskService.sync_statuses(args.sync_batch)
+            finally:
+                await HttpClient.close()
+
+        for label in ("batch 1", "batch 2"):
+            requests_before = stub.requests
+            result = async_to_sync(sync)()
+            print(
+                f"{label:>10}: {result['checked']} checked, {result['changed']} changed, "
+                f"{stub.requests - requests_before} YouGile requests in {result['elapsed']:.2f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
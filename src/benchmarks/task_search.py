@@ -0,0 +1,87 @@
+import argparse
+import random
+import string
+import tempfile
+import time
+from pathlib import Path
+
+from asgiref.sync import async_to_sync
+
+from benchmarks import setup_django, summarize
+
+
+def vocabulary(size, rng):
+    return ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10))) for _ in range(size)]
+
+
+def seed_corpus(count, words, rng, chunk=50000):
+    from django.db import connection, transaction
+    from django.utils import timezone
+
+    from app.internal.models.task_record import TaskRecord
+
+    now = timezone.now()
+    sql = (
+        f"INSERT INTO {TaskRecord._meta.db_table} "
+        "(yougile_id, telegram_id, chat_id, title, description, completed, archived, deleted, created_at) "
+        "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)"
+    )
+    for start in range(0, count, chunk):
+        rows = [
+            (
+                f"task-{i}", i % 1000, -(i % 1000), " ".join(rng.choices(words, k=rng.randint(2, 6))),
+                " ".join(rng.choices(words, k=rng.randint(0, 20))), False, False, False, now,
+            )
+            for i in range(start, min(count, start + chunk))
+        ]
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.executemany(sql, rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inline task search over a synthetic corpus")
+    parser.add_argument("--tasks", type=int, default=1000000)
+    parser.add_argument("--words", type=int, default=50000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        setup_django(DATABASE_URL=f"sqlite:///{Path(tmp) / 'search.sqlite3'}")
+
+        from django.core.management import call_command
+        from django.db import connection
+
+        from app.internal.services.task_service import TaskService
+
+        call_command("migrate", verbosity=0)
+        words = vocabulary(args.words, rng)
+        started = time.perf_counter()
+        seed_corpus(args.tasks, words, rng)
+        print(f"indexed {args.tasks} tasks in {time.perf_counter() - started:.1f}s ({connection.vendor})")
+
+        cases = {
+            "prefix 2": lambda: rng.choice(words)[:2],
+            "prefix 4": lambda: rng.choice(words)[:4],
+            "word": lambda: rng.choice(words),
+            "two words": lambda: f"{rng.choice(words)} {rng.choice(words)[:3]}",
+        }
+        for name, make_query in cases.items():
+            samples = []
+            hits = 0
+            for _ in range(args.queries):
+                query = make_query()
+                started = time.perf_counter()
+                records = async_to_sync(TaskService.search)(query, rng.randrange(1000), None)
+                samples.append(time.perf_counter() - started)
+                hits += bool(records)
+            stats = summarize(samples)
+            print(
+                f"{name:>9}: p50={stats['p50_ms']:.2f}ms p95={stats['p95_ms']:.2f}ms p99={stats['p99_ms']:.2f}ms "
+                f"({hits}/{args.queries} with results)"
+            )
+
+
+if __name__ == "__main__":
+    main()
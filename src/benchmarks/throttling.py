@@ -0,0 +1,55 @@
+import argparse
+import asyncio
+import time
+
+from benchmarks import setup_django
+from benchmarks.stubs import YougileStub
+
+
+async def run(tasks, max_rps, error_rate, latency):
+    from app.internal.services.http_client import HttpClient
+    from app.internal.services.yougile_service import YougileService
+
+    stub = await YougileStub(latency=latency, max_rps=max_rps, error_rate=error_rate).start()
+    service = YougileService()
+    service.base_url = stub.base_url
+    batch = [{"title": f"Task {i}", "column_id": "column-1"} for i in range(tasks)]
+
+    started = time.perf_counter()
+    results = await service.create_tasks(batch)
+    elapsed = time.perf_counter() - started
+
+    await HttpClient.close()
+    await stub.stop()
+    titles = [task["title"] for task in stub.tasks]
+    return {
+        "created": sum(1 for result in results if result),
+        "elapsed": elapsed,
+        "throttled": stub.throttled,
+        "server_errors": stub.errors,
+        "duplicates": len(titles) - len(set(titles)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="create_task throughput against a throttling YouGile stub")
+    parser.add_argument("--tasks", type=int, default=100)
+    parser.add_argument("--max-rps", type=int, default=10)
+    parser.add_argument("--error-rate", type=float, default=0.1)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--client-rps", type=float, default=None)
+    args = parser.parse_args()
+    env = {"YOUGILE_BATCH_CONCURRENCY": 20, "YOUGILE_RETRY_BASE_DELAY": 0.1, "YOUGILE_MAX_RETRIES": 8}
+    env["YOUGILE_RATE_LIMIT_PER_MINUTE"] = (args.client_rps or args.max_rps) * 60
+    env["YOUGILE_RATE_LIMIT_BURST"] = args.max_rps
+    setup_django(**env)
+    stats = asyncio.run(run(args.tasks, args.max_rps, args.error_rate, args.latency))
+    print(
+        f"created {stats['created']}/{args.tasks} in {stats['elapsed']:.2f}s "
+        f"({stats['created'] / stats['elapsed']:.1f} tasks/s, server limit {args.max_rps}/s); "
+        f"429s={stats['throttled']} 5xx={stats['server_errors']} duplicates={stats['duplicates']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
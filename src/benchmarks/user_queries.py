@@ -0,0 +1,73 @@
+import argparse
+import asyncio
+
+from asgiref.sync import async_to_sync
+
+from benchmarks import setup_django
+from benchmarks.fakes import fake_context, mention_update
+from benchmarks.stubs import ThreadedStub, YougileStub
+
+BOT_USERNAME = "benchbot"
+
+
+def seed_users(count):
+    from app.internal.models.user import YouGileUser
+
+    YouGileUser.objects.bulk_create(
+        YouGileUser(
+            telegram_id=i,
+            telegram_username=f"user{i}",
+            yougile_id=f"yg-{i}",
+            yougile_email=f"user{i}@example.com",
+            default_column_id="column-1",
+        )
+        for i in range(1, count + 1)
+    )
+
+
+def run(messages, users):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    from app.internal.services.http_client import HttpClient
+    from app.internal.services.yougile_service import YougileService
+    from app.internal.transport.bot.handlers import BotHandlers
+
+    seed_users(users)
+    context = fake_context(BOT_USERNAME)
+
+    async def handle(sender):
+        update = mention_update(BOT_USERNAME, f"Task - body @user{users}", sender, f"user{sender}")
+        await BotHandlers.handle_mention(update, context)
+        await HttpClient.close()
+
+    counts = []
+    with ThreadedStub(YougileStub()) as stub:
+        YougileService.get_instance().base_url = stub.base_url
+        for i in range(messages):
+            with CaptureQueriesContext(connection) as captured:
+                async_to_sync(handle)(i % users + 1)
+            counts.append(len(captured.captured_queries))
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DB queries per handle_mention")
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--users", type=int, default=20)
+    args = parser.parse_args()
+    setup_django()
+
+    from django.db import connection
+
+    connection.creation.create_test_db(verbosity=0)
+    counts = run(args.messages, args.users)
+    cold = counts[: args.users]
+    warm = counts[args.users:]
+    print(f"cold: max={max(cold)} mean={sum(cold) / len(cold):.2f} queries/message")
+    if warm:
+        print(f"warm: max={max(warm)} mean={sum(warm) / len(warm):.2f} queries/message")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import argparse
+import time
+
+from asgiref.sync import async_to_sync
+
+from benchmarks import setup_django, summarize
+
+
+def seed_users(count, batch_size=5000):
+    from app.internal.models.user import YouGileUser
+
+    for start in range(1, count + 1, batch_size):
+        YouGileUser.objects.bulk_create(
+            YouGileUser(telegram_id=i, telegram_username=f"User{i}", yougile_id=f"yg-{i}")
+            for i in range(start, min(start + batch_size, count + 1))
+        )
+
+
+def run(users, lookups):
+    from app.internal.models.user import YouGileUser
+    from app.internal.services.user_cache import UserCache
+    from app.internal.services.user_service import UserService
+
+    seed_users(users)
+    usernames = [f"user{(i * 7919) % users + 1}" for i in range(lookups)]
+
+    query = []
+    for username in usernames:
+        started = time.perf_counter()
+        assert YouGileUser.objects.by_telegram_username(username).values_list("yougile_id", flat=True).first()
+        query.append(time.perf_counter() - started)
+
+    service = []
+    lookup = async_to_sync(UserService.get_yougile_id_by_telegram_username)
+    for username in usernames:
+        UserCache.clear()
+        started = time.perf_counter()
+        assert lookup(f"@{username}") is not None
+        service.append(time.perf_counter() - started)
+    return {"indexed_query": summarize(query), "async_service_call": summarize(service)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Case-insensitive telegram_username -> yougile_id lookup")
+    parser.add_argument("--users", type=int, default=100000)
+    parser.add_argument("--lookups", type=int, default=2000)
+    args = parser.parse_args()
+    setup_django()
+
+    from django.db import connection
+
+    connection.creation.create_test_db(verbosity=0)
+    for name, stats in run(args.users, args.lookups).items():
+        print(f"{name:>18} ({args.users} users): p50={stats['p50_ms']:.3f}ms p99={stats['p99_ms']:.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import argparse
+import asyncio
+import time
+
+import aiohttp
+
+from benchmarks import setup_django
+from benchmarks.fakes import update_payload
+from benchmarks.stubs import TelegramStub, YougileStub
+
+SECRET = "benchmark-secret"
+
+
+async def run(updates, chatter):
+    from app.internal.bot import TelegramBot
+    from app.internal.services import metrics
+    from app.internal.services.yougile_service import YougileService
+    from app.internal.transport.bot.webhook import WebhookServer
+
+    secret_header = WebhookServer.SECRET_HEADER
+
+    telegram = await TelegramStub().start()
+    yougile = await YougileStub().start()
+    YougileService.get_instance().base_url = yougile.base_url
+
+    from django.conf import settings
+
+    settings.TELEGRAM_API_BASE_URL = telegram.base_url
+    bot = TelegramBot("123:benchmark")
+    stop_event = asyncio.Event()
+    serving = asyncio.create_task(
+        bot.serve_webhook(
+            webhook_url="https://example.invalid/telegram/webhook",
+            secret_token=SECRET,
+            listen="127.0.0.1",
+            port=0,
+            url_path="telegram/webhook",
+            max_connections=40,
+            stop_event=stop_event,
+        )
+    )
+    while telegram.calls.get("setWebhook", 0) == 0:
+        await asyncio.sleep(0.01)
+
+    url = f"http://127.0.0.1:{bot.webhook_server.port}/telegram/webhook"
+    async with aiohttp.ClientSession() as session:
+        async with session.post(url, json=update_payload(0, 1, 1, "/start"), headers={secret_header: "wrong"}) as resp:
+            rejected = resp.status
+
+        started = time.perf_counter()
+        for i in range(1, updates + 1):
+            payload = update_payload(i, i, i, "/start", username=f"user{i}")
+            async with session.post(url, json=payload, headers={secret_header: SECRET}) as resp:
+                assert resp.status == 200
+        while telegram.calls.get("sendMessage", 0) < updates:
+            await asyncio.sleep(0.01)
+        elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for i in range(chatter):
+            payload = update_payload(updates + i + 1, -100 - i % 20, i, f"обычное сообщение в группе номер {i}")
+            async with session.post(url, json=payload, headers={secret_header: SECRET}) as resp:
+                assert resp.status == 200
+        chatter_elapsed = time.perf_counter() - started
+
+    stop_event.set()
+    await serving
+    await telegram.stop()
+    await yougile.stop()
+    dropped = metrics.bot_updates_dropped_total.value(reason="no_mention")
+    return rejected, elapsed, chatter_elapsed, dropped, bot.allowed_updates
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay /start updates through the webhook receiver")
+    parser.add_argument("--updates", type=int, default=200)
+    parser.add_argument("--chatter", type=int, default=1000)
+    args = parser.parse_args()
+    setup_django()
+
+    from django.db import connection
+
+    connection.creation.create_test_db(verbosity=0)
+    rejected, elapsed, chatter_elapsed, dropped, allowed = asyncio.run(run(args.updates, args.chatter))
+    print(f"allowed_updates: {', '.join(allowed)}")
+    print(f"wrong secret -> HTTP {rejected}")
+    print(f"{args.updates} updates handled in {elapsed:.2f}s ({args.updates / elapsed:.0f} updates/s)")
+    if args.chatter:
+        print(f"{args.chatter} group messages in {chatter_elapsed:.2f}s "
+              f"({args.chatter / chatter_elapsed:.0f} updates/s), dropped before dispatch: {dropped}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import argparse
+import asyncio
+import time
+
+from benchmarks import setup_django, summarize
+from benchmarks.stubs import YougileStub
+
+
+async def run(tasks, latency):
+    import aiohttp
+
+    from app.internal.services.http_client import HttpClient
+    from app.internal.services.yougile_service import YougileService
+
+    stub = await YougileStub(latency=latency).start()
+    service = YougileService()
+    service.base_url = stub.base_url
+    payload = {"title": "Benchmark", "columnId": "column-1"}
+
+    per_call = []
+    for _ in range(tasks):
+        started = time.perf_counter()
+        async with aiohttp.ClientSession() as session:
+            async with session.post(f"{stub.base_url}/tasks", headers=service._headers, json=payload) as resp:
+                await resp.text()
+        per_call.append(time.perf_counter() - started)
+
+    pooled = []
+    await HttpClient.start()
+    for _ in range(tasks):
+        started = time.perf_counter()
+        await service.create_task(title="Benchmark", column_id="column-1")
+        pooled.append(time.perf_counter() - started)
+    await HttpClient.close()
+    await stub.stop()
+    return {"session_per_call": summarize(per_call), "pooled_session": summarize(pooled)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="create_task latency: ClientSession per call vs pooled session")
+    parser.add_argument("--tasks", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.0)
+    args = parser.parse_args()
+    setup_django()
+    results = asyncio.run(run(args.tasks, args.latency))
+    for name, stats in results.items():
+        print(f"{name:>18}: p50={stats['p50_ms']:.2f}ms p99={stats['p99_ms']:.2f}ms mean={stats['mean_ms']:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+import environ
 from dotenv import load_dotenv
 
 
@@ -10,9 +11,90 @@ SECRET_KEY = os.environ.get('DJANGO_SECRET_KEY')
 TELEGRAM_BOT_TOKEN = os.environ.get('TELEGRAM_BOT_TOKEN')
 DEBUG = os.environ.get('DEBUG')
 
+TELEGRAM_API_BASE_URL = os.environ.get('TELEGRAM_API_BASE_URL', 'https://api.telegram.org/bot')
+TELEGRAM_API_BASE_FILE_URL = os.environ.get('TELEGRAM_API_BASE_FILE_URL', 'https://api.telegram.org/file/bot')
+TELEGRAM_WEBHOOK_URL = os.environ.get('TELEGRAM_WEBHOOK_URL')
+TELEGRAM_WEBHOOK_SECRET = os.environ.get('TELEGRAM_WEBHOOK_SECRET')
+TELEGRAM_WEBHOOK_LISTEN = os.environ.get('TELEGRAM_WEBHOOK_LISTEN', '0.0.0.0')
+TELEGRAM_WEBHOOK_PORT = int(os.environ.get('TELEGRAM_WEBHOOK_PORT', 8443))
+TELEGRAM_WEBHOOK_PATH = os.environ.get('TELEGRAM_WEBHOOK_PATH', 'telegram/webhook')
+TELEGRAM_WEBHOOK_MAX_CONNECTIONS = int(os.environ.get('TELEGRAM_WEBHOOK_MAX_CONNECTIONS', 40))
+
+TELEGRAM_RATE_LIMIT_PER_SECOND = float(os.environ.get('TELEGRAM_RATE_LIMIT_PER_SECOND', 30))
+TELEGRAM_RATE_LIMIT_BURST = int(os.environ.get('TELEGRAM_RATE_LIMIT_BURST', 30))
+TELEGRAM_CHAT_RATE_LIMIT_PER_SECOND = float(os.environ.get('TELEGRAM_CHAT_RATE_LIMIT_PER_SECOND', 1))
+TELEGRAM_GROUP_RATE_LIMIT_PER_MINUTE = float(os.environ.get('TELEGRAM_GROUP_RATE_LIMIT_PER_MINUTE', 20))
+TELEGRAM_CHAT_RATE_LIMIT_BURST = int(os.environ.get('TELEGRAM_CHAT_RATE_LIMIT_BURST', 3))
+TELEGRAM_RATE_LIMIT_MAX_CHATS = int(os.environ.get('TELEGRAM_RATE_LIMIT_MAX_CHATS', 10000))
+TELEGRAM_MAX_PENDING_REQUESTS = int(os.environ.get('TELEGRAM_MAX_PENDING_REQUESTS', 1024))
+TELEGRAM_MAX_RETRIES = int(os.environ.get('TELEGRAM_MAX_RETRIES', 3))
+
+BOT_CONCURRENT_UPDATES = int(os.environ.get('BOT_CONCURRENT_UPDATES', 8))
+BOT_MAX_PENDING_UPDATES = int(os.environ.get('BOT_MAX_PENDING_UPDATES', 256))
+BOT_POLL_TIMEOUT = int(os.environ.get('BOT_POLL_TIMEOUT', 10))
+BOT_WORKER_SHUTDOWN_TIMEOUT = float(os.environ.get('BOT_WORKER_SHUTDOWN_TIMEOUT', 30))
+BOT_MAX_BATCH_TASKS = int(os.environ.get('BOT_MAX_BATCH_TASKS', 30))
+BOT_KEYBOARD_PAGE_SIZE = int(os.environ.get('BOT_KEYBOARD_PAGE_SIZE', 8))
+BOT_TASKS_PAGE_SIZE = int(os.environ.get('BOT_TASKS_PAGE_SIZE', 20))
+BOT_INLINE_RESULTS = int(os.environ.get('BOT_INLINE_RESULTS', 20))
+BOT_INLINE_CACHE_TIME = int(os.environ.get('BOT_INLINE_CACHE_TIME', 10))
+TASK_SEARCH_MAX_TERMS = int(os.environ.get('TASK_SEARCH_MAX_TERMS', 8))
+
+OUTBOX_POLL_INTERVAL = float(os.environ.get('OUTBOX_POLL_INTERVAL', 5))
+OUTBOX_BATCH_SIZE = int(os.environ.get('OUTBOX_BATCH_SIZE', 20))
+OUTBOX_MAX_ATTEMPTS = int(os.environ.get('OUTBOX_MAX_ATTEMPTS', 12))
+OUTBOX_RETRY_BASE_DELAY = float(os.environ.get('OUTBOX_RETRY_BASE_DELAY', 5))
+OUTBOX_RETRY_MAX_DELAY = float(os.environ.get('OUTBOX_RETRY_MAX_DELAY', 600))
+OUTBOX_LEASE_SECONDS = float(os.environ.get('OUTBOX_LEASE_SECONDS', 120))
+
+ATTACHMENT_MAX_SIZE = int(os.environ.get('ATTACHMENT_MAX_SIZE', 20 * 1024 * 1024))
+ATTACHMENT_CHUNK_SIZE = int(os.environ.get('ATTACHMENT_CHUNK_SIZE', 64 * 1024))
+ATTACHMENT_CONCURRENCY = int(os.environ.get('ATTACHMENT_CONCURRENCY', 3))
+ATTACHMENT_TIMEOUT = float(os.environ.get('ATTACHMENT_TIMEOUT', 300))
+
+YOUGILE_WEBHOOK_SECRET = os.environ.get('YOUGILE_WEBHOOK_SECRET')
+YOUGILE_EVENT_DEDUPE_TTL = int(os.environ.get('YOUGILE_EVENT_DEDUPE_TTL', 24 * 3600))
+NOTIFY_QUEUE_SIZE = int(os.environ.get('NOTIFY_QUEUE_SIZE', 10000))
+NOTIFY_WORKERS = int(os.environ.get('NOTIFY_WORKERS', 16))
+
+BOT_METRICS_LISTEN = os.environ.get('BOT_METRICS_LISTEN', '127.0.0.1')
+BOT_METRICS_PORT = int(os.environ.get('BOT_METRICS_PORT', 0))
+
 YOUGILE_API_KEY = os.environ.get('YOUGILE_API_KEY')
 YOUGILE_PROJECT_ID = os.environ.get('YOUGILE_PROJECT_ID')
 YOUGILE_COLUMN_ID = os.environ.get('YOUGILE_COLUMN_ID')
+YOUGILE_BASE_URL = os.environ.get('YOUGILE_BASE_URL', 'https://yougile.com/api-v2')
+
+YOUGILE_HTTP_POOL_LIMIT = int(os.environ.get('YOUGILE_HTTP_POOL_LIMIT', 100))
+YOUGILE_HTTP_POOL_LIMIT_PER_HOST = int(os.environ.get('YOUGILE_HTTP_POOL_LIMIT_PER_HOST', 20))
+YOUGILE_HTTP_KEEPALIVE = float(os.environ.get('YOUGILE_HTTP_KEEPALIVE', 30))
+YOUGILE_HTTP_TIMEOUT = float(os.environ.get('YOUGILE_HTTP_TIMEOUT', 30))
+YOUGILE_HTTP_CONNECT_TIMEOUT = float(os.environ.get('YOUGILE_HTTP_CONNECT_TIMEOUT', 10))
+
+YOUGILE_REQUEST_TIMEOUT = float(os.environ.get('YOUGILE_REQUEST_TIMEOUT', 10))
+YOUGILE_RATE_LIMIT_PER_MINUTE = float(os.environ.get('YOUGILE_RATE_LIMIT_PER_MINUTE', 50))
+YOUGILE_RATE_LIMIT_BURST = int(os.environ.get('YOUGILE_RATE_LIMIT_BURST', 10))
+YOUGILE_MAX_RETRIES = int(os.environ.get('YOUGILE_MAX_RETRIES', 4))
+YOUGILE_RETRY_BASE_DELAY = float(os.environ.get('YOUGILE_RETRY_BASE_DELAY', 0.5))
+YOUGILE_RETRY_MAX_DELAY = float(os.environ.get('YOUGILE_RETRY_MAX_DELAY', 30))
+YOUGILE_IDEMPOTENCY_CACHE_SIZE = int(os.environ.get('YOUGILE_IDEMPOTENCY_CACHE_SIZE', 1000))
+YOUGILE_CLOCK_SKEW_MS = int(os.environ.get('YOUGILE_CLOCK_SKEW_MS', 5000))
+
+YOUGILE_PAGE_SIZE = int(os.environ.get('YOUGILE_PAGE_SIZE', 1000))
+YOUGILE_COLUMNS_TTL = float(os.environ.get('YOUGILE_COLUMNS_TTL', 600))
+YOUGILE_BATCH_CONCURRENCY = int(os.environ.get('YOUGILE_BATCH_CONCURRENCY', 5))
+
+YOUGILE_USER_DIRECTORY_TTL = float(os.environ.get('YOUGILE_USER_DIRECTORY_TTL', 300))
+YOUGILE_USER_DIRECTORY_MAX_SIZE = int(os.environ.get('YOUGILE_USER_DIRECTORY_MAX_SIZE', 100000))
+YOUGILE_USER_DIRECTORY_MISS_REFRESH_INTERVAL = float(os.environ.get('YOUGILE_USER_DIRECTORY_MISS_REFRESH_INTERVAL', 30))
+
+YOUGILE_SYNC_INTERVAL = float(os.environ.get('YOUGILE_SYNC_INTERVAL', 0))
+YOUGILE_SYNC_CHUNK_SIZE = int(os.environ.get('YOUGILE_SYNC_CHUNK_SIZE', 1000))
+YOUGILE_TASK_SYNC_INTERVAL = float(os.environ.get('YOUGILE_TASK_SYNC_INTERVAL', 0))
+YOUGILE_TASK_SYNC_BATCH = int(os.environ.get('YOUGILE_TASK_SYNC_BATCH', 200))
+
+USER_CACHE_TTL = float(os.environ.get('USER_CACHE_TTL', 60))
+USER_CACHE_MAX_SIZE = int(os.environ.get('USER_CACHE_MAX_SIZE', 10000))
 
 ALLOWED_HOSTS = ["localhost", "127.0.0.1"]
 
@@ -58,11 +140,22 @@ TEMPLATES = [
 WSGI_APPLICATION = "config.wsgi.application"
 
 
+env = environ.Env()
+
 DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
-    }
+    "default": env.db("DATABASE_URL", default=f"sqlite:///{BASE_DIR / 'db.sqlite3'}"),
+}
+DATABASES["default"]["CONN_MAX_AGE"] = env.int("DB_CONN_MAX_AGE", default=60)
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = env.bool("DB_CONN_HEALTH_CHECKS", default=True)
+if DATABASES["default"]["ENGINE"] == "django.db.backends.sqlite3":
+    DATABASES["default"].setdefault("OPTIONS", {})["timeout"] = env.float("SQLITE_BUSY_TIMEOUT", default=20)
+
+SQLITE_JOURNAL_MODE = os.environ.get('SQLITE_JOURNAL_MODE', 'wal')
+SQLITE_SYNCHRONOUS = os.environ.get('SQLITE_SYNCHRONOUS', 'normal')
+DB_THREAD_SENSITIVE = os.environ.get('DB_THREAD_SENSITIVE', '').lower() in ('1', 'true', 'yes')
+
+CACHES = {
+    "default": env.cache("CACHE_URL", default="locmemcache://"),
 }
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -94,5 +187,19 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "default": {"format": "%(asctime)s %(levelname)s %(name)s: %(message)s"},
+    },
+    "handlers": {
+        "console": {"class": "logging.StreamHandler", "formatter": "default"},
+    },
+    "loggers": {
+        "app": {"handlers": ["console"], "level": os.environ.get('LOG_LEVEL', 'INFO'), "propagate": False},
+    },
+}
+
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
-AUTH_USER_MODEL = "app.AdminUser"
\ No newline at end of file
+AUTH_USER_MODEL = "app.AdminUser"
@@ -0,0 +1,13 @@
+from config.settings import *  # noqa: F401,F403
+
+# runbot needs the ORM and the app models only: no admin, sessions, messages,
+# staticfiles, templates or HTTP middleware.
+INSTALLED_APPS = [
+    "django.contrib.auth",
+    "django.contrib.contenttypes",
+    "app",
+]
+
+MIDDLEWARE = []
+
+TEMPLATES = []
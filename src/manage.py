@@ -3,7 +3,8 @@ import os
 import sys
 
 if __name__ == "__main__":
-    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    bot_command = sys.argv[1:2] == ["runbot"]
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings_bot" if bot_command else "config.settings")
     try:
         from django.core.management import execute_from_command_line
     except ImportError: